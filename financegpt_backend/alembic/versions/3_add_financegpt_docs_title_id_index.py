@@ -0,0 +1,31 @@
+"""add_financegpt_docs_title_id_index
+
+Revision ID: 3
+Revises: 2
+Create Date: 2026-02-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3'
+down_revision: Union[str, None] = '2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the (title, id) index backing keyset pagination of FinanceGPT docs."""
+    op.create_index(
+        'ix_financegpt_docs_documents_title_id',
+        'financegpt_docs_documents',
+        ['title', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the (title, id) index."""
+    op.drop_index('ix_financegpt_docs_documents_title_id', table_name='financegpt_docs_documents')
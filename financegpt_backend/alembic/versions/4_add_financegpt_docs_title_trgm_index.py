@@ -0,0 +1,32 @@
+"""add_financegpt_docs_title_trgm_index
+
+Revision ID: 4
+Revises: 3
+Create Date: 2026-02-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4'
+down_revision: Union[str, None] = '3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the pg_trgm GIN index used by substring ILIKE title filters."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Same name as the startup index in app.db.setup_indexes, so databases
+    # that already have it are left alone
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_financegpt_docs_title_trgm "
+        "ON financegpt_docs_documents USING gin (title gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram title index (the extension is shared, so it stays)."""
+    op.execute("DROP INDEX IF EXISTS idx_financegpt_docs_title_trgm")
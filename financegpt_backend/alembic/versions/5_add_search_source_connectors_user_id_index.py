@@ -0,0 +1,36 @@
+"""add_search_source_connectors_user_id_index
+
+Revision ID: 5
+Revises: 4
+Create Date: 2026-02-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5'
+down_revision: Union[str, None] = '4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index connector ownership lookups.
+
+    (search_space_id, user_id, connector_type) lookups are already served by
+    the leading columns of uq_searchspace_user_connector_type_name, and
+    (id, user_id) lookups by the primary key, so only user_id needs an index.
+    """
+    op.create_index(
+        op.f('ix_search_source_connectors_user_id'),
+        'search_source_connectors',
+        ['user_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the user_id index."""
+    op.drop_index(op.f('ix_search_source_connectors_user_id'), table_name='search_source_connectors')
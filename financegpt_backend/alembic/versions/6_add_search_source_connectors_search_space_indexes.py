@@ -0,0 +1,43 @@
+"""add_search_source_connectors_search_space_indexes
+
+Revision ID: 6
+Revises: 5
+Create Date: 2026-02-03 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '6'
+down_revision: Union[str, None] = '5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index the per-search-space connector lookups.
+
+    (search_space_id, connector_type) serves the duplicate-type check on
+    create/update; (search_space_id, id) serves listing a search space's
+    connectors in id order.
+    """
+    op.create_index(
+        'ix_search_source_connectors_search_space_id_connector_type',
+        'search_source_connectors',
+        ['search_space_id', 'connector_type'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_search_source_connectors_search_space_id_id',
+        'search_source_connectors',
+        ['search_space_id', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the search space indexes."""
+    op.drop_index('ix_search_source_connectors_search_space_id_id', table_name='search_source_connectors')
+    op.drop_index('ix_search_source_connectors_search_space_id_connector_type', table_name='search_source_connectors')
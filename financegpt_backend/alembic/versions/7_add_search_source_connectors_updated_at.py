@@ -0,0 +1,39 @@
+"""add_search_source_connectors_updated_at
+
+Revision ID: 7
+Revises: 6
+Create Date: 2026-02-04 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7'
+down_revision: Union[str, None] = '6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Track when each connector was last modified.
+
+    Existing rows are stamped with the migration time; the application sets
+    the value on insert and on every update from then on.
+    """
+    op.add_column(
+        'search_source_connectors',
+        sa.Column(
+            'updated_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the updated_at column."""
+    op.drop_column('search_source_connectors', 'updated_at')
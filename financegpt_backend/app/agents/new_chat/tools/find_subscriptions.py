@@ -15,8 +15,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.connector_service import ConnectorService
 from app.utils.subscription_utils import (
-    create_merchant_amount_key,
-    normalize_merchant,
+    build_merchant_amount_key,
+    normalize_merchants,
 )
 
 logger = logging.getLogger(__name__)
@@ -187,15 +187,17 @@ def _extract_transactions_from_results(results: list) -> list[dict]:
 def _group_transactions_by_merchant(transactions: list[dict]) -> dict[str, list]:
     """Group transactions by normalized merchant name and amount."""
     grouped = defaultdict(list)
+    normalized_merchants = normalize_merchants(
+        txn['description'] for txn in transactions
+    )
     
-    for txn in transactions:
+    for txn, normalized in zip(transactions, normalized_merchants, strict=True):
         merchant = txn['description']
-        amount = txn['amount']
         
         # Create grouping key
-        key = create_merchant_amount_key(merchant, amount)
+        key = build_merchant_amount_key(normalized, txn['amount'])
         
-        txn['merchant_normalized'] = normalize_merchant(merchant)
+        txn['merchant_normalized'] = normalized
         txn['merchant_raw'] = merchant
         
         grouped[key].append(txn)
@@ -11,6 +11,7 @@ import re
 from datetime import datetime, timedelta, UTC
 from typing import Any
 
+import orjson
 from langchain_core.tools import tool
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -367,7 +368,7 @@ async def _get_user_transactions(
                 
                 if isinstance(financial_data, str):
                     try:
-                        financial_data = json.loads(financial_data)
+                        financial_data = orjson.loads(financial_data)
                     except json.JSONDecodeError:
                         continue
                 
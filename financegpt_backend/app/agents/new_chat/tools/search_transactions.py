@@ -11,6 +11,7 @@ import re
 from datetime import datetime
 from typing import Any
 
+import orjson
 from langchain_core.tools import tool
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -175,7 +176,7 @@ def create_search_transactions_tool(
                     # Parse financial_data if it's also a JSON string
                     if isinstance(financial_data, str):
                         try:
-                            financial_data = json.loads(financial_data)
+                            financial_data = orjson.loads(financial_data)
                         except json.JSONDecodeError:
                             logger.error("Failed to parse financial_data as JSON")
                             continue
@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
@@ -84,6 +85,10 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# Compress larger responses (e.g. FinanceGPT docs with all their chunks);
+# small JSON payloads aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.include_router(
     fastapi_users.get_auth_router(auth_backend), prefix="/auth/jwt", tags=["auth"]
 )
@@ -78,6 +78,26 @@ class Config:
 
     # Database
     DATABASE_URL = os.getenv("DATABASE_URL")
+    # Connection pool for the API engine. The pool holds DB_POOL_SIZE idle
+    # connections and may open DB_POOL_MAX_OVERFLOW more under load;
+    # connections are recycled after DB_POOL_RECYCLE_SECONDS.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "40"))
+    DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    # How long a request waits for a pooled connection before failing
+    DB_POOL_TIMEOUT_SECONDS = int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode:
+    # PgBouncer then does the pooling and prepared statements are disabled.
+    DB_USE_PGBOUNCER = os.getenv("DB_USE_PGBOUNCER", "FALSE").upper() == "TRUE"
+
+    # API routers to mount (comma-separated module names from
+    # app.routes.ROUTER_MODULES, e.g. "plaid_routes,documents_routes").
+    # Empty mounts every router.
+    ENABLED_ROUTERS = frozenset(
+        name.strip()
+        for name in os.getenv("ENABLED_ROUTERS", "").split(",")
+        if name.strip()
+    )
 
     NEXT_FRONTEND_URL = os.getenv("NEXT_FRONTEND_URL")
     # Backend URL to override the http to https in the OAuth redirect URI
@@ -154,6 +174,11 @@ class Config:
     PLAID_ENV = os.getenv("PLAID_ENV", "sandbox")  # sandbox, development, or production
     PLAID_REDIRECT_URI = os.getenv("PLAID_REDIRECT_URI")
 
+    # Redis used for application caches (defaults to the Celery broker)
+    REDIS_URL = os.getenv(
+        "REDIS_URL", os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
+    )
+
     # LLM instances are now managed per-user through the LLMConfig system
     # Legacy environment variables removed in favor of user-specific configurations
 
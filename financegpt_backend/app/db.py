@@ -1,7 +1,10 @@
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from enum import Enum
+from typing import Any
+from uuid import uuid4
 
+import orjson
 from fastapi import Depends
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID, SQLAlchemyUserDatabase
 from pgvector.sqlalchemy import Vector
@@ -14,6 +17,7 @@ from sqlalchemy import (
     Column,
     Enum as SQLAlchemyEnum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -24,6 +28,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, relationship
+from sqlalchemy.pool import NullPool
 
 from app.config import config
 
@@ -653,6 +658,10 @@ class FinanceGPTDocsDocument(BaseModel, TimestampMixin):
     """
 
     __tablename__ = "financegpt_docs_documents"
+    __table_args__ = (
+        # Backs keyset pagination ordered by (title, id)
+        Index("ix_financegpt_docs_documents_title_id", "title", "id"),
+    )
 
     source = Column(
         String, nullable=False, unique=True, index=True
@@ -666,6 +675,7 @@ class FinanceGPTDocsDocument(BaseModel, TimestampMixin):
     chunks = relationship(
         "FinanceGPTDocsChunk",
         back_populates="document",
+        order_by="FinanceGPTDocsChunk.id",
         cascade="all, delete-orphan",
     )
 
@@ -808,6 +818,14 @@ class SearchSourceConnector(BaseModel, TimestampMixin):
             "name",
             name="uq_searchspace_user_connector_type_name",
         ),
+        # Duplicate-type check on create/update
+        Index(
+            "ix_search_source_connectors_search_space_id_connector_type",
+            "search_space_id",
+            "connector_type",
+        ),
+        # Listing a search space's connectors in id order
+        Index("ix_search_source_connectors_search_space_id_id", "search_space_id", "id"),
     )
 
     name = Column(String(100), nullable=False, index=True)
@@ -821,6 +839,14 @@ class SearchSourceConnector(BaseModel, TimestampMixin):
     indexing_frequency_minutes = Column(Integer, nullable=True)
     next_scheduled_at = Column(TIMESTAMP(timezone=True), nullable=True)
 
+    # Bumped on every change; the single-connector GET derives its ETag from it
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
     search_space_id = Column(
         Integer, ForeignKey("searchspaces.id", ondelete="CASCADE"), nullable=False
     )
@@ -829,7 +855,10 @@ class SearchSourceConnector(BaseModel, TimestampMixin):
     )
 
     user_id = Column(
-        UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
 
@@ -1661,7 +1690,65 @@ else:
         avatar_url = Column(String, nullable=True)
 
 
-engine = create_async_engine(DATABASE_URL)
+# asyncpg connect args for going through PgBouncer in transaction pooling
+# mode, shared with the Celery worker engine. Server-side prepared statements
+# don't survive across its transactions, so caching is off and the statements
+# SQLAlchemy still prepares get unique names instead of asyncpg's per-connection
+# counter, which collides once PgBouncer hands a server connection to another
+# client. PgBouncer also rejects unknown startup parameters, so no
+# server_settings.
+PGBOUNCER_CONNECT_ARGS: dict[str, Any] = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+}
+
+if config.DB_USE_PGBOUNCER:
+    # PgBouncer owns the connection pool
+    _engine_pool_options = {"poolclass": NullPool}
+    _connect_args = PGBOUNCER_CONNECT_ARGS
+else:
+    _engine_pool_options = {
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT_SECONDS,
+        # Drop connections the server or a proxy closed while they sat idle
+        "pool_pre_ping": True,
+        "pool_recycle": config.DB_POOL_RECYCLE_SECONDS,
+    }
+    _connect_args = {
+        # Keep more prepared statements per connection than the defaults
+        # (100) so the per-id connector/document lookups stay prepared
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 256,
+        # Server-side TCP keepalives so idle connections aren't silently cut
+        # by NAT/load balancer timeouts
+        "server_settings": {
+            "tcp_keepalives_idle": "60",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "5",
+        },
+    }
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values with orjson (non-str keys allowed, as in json)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_async_engine(
+    DATABASE_URL,
+    # JSON/JSONB columns (connector configs and the like) are encoded and
+    # decoded with orjson instead of the stdlib json module
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    # Room for every distinct statement the API issues in SQLAlchemy's
+    # compiled SQL cache (default 500), so hot queries aren't evicted and
+    # recompiled
+    query_cache_size=1200,
+    connect_args=_connect_args,
+    **_engine_pool_options,
+)
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
 
@@ -175,6 +175,41 @@ class AccountBalance:
         }
 
 
+def _parse_numeric_date(date_str: str) -> datetime | None:
+    """
+    Parse the common all-numeric statement date layouts without strptime.
+
+    Handles MM/DD/YYYY, MM/DD/YY, YYYY-MM-DD, MM-DD-YYYY and YYYY/MM/DD.
+
+    Args:
+        date_str: Stripped date string
+
+    Returns:
+        datetime object, or None if the string is not one of those layouts
+    """
+    separator = "/" if "/" in date_str else "-"
+    parts = date_str.split(separator)
+    if len(parts) != 3 or not all(part.isascii() and part.isdigit() for part in parts):
+        return None
+
+    first, second, third = parts
+    try:
+        if len(first) == 4 and len(second) <= 2 and len(third) <= 2:
+            return datetime(int(first), int(second), int(third))
+        if len(first) > 2 or len(second) > 2:
+            return None
+        if len(third) == 4:
+            return datetime(int(third), int(first), int(second))
+        if len(third) == 2 and separator == "/":
+            # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+            year = int(third)
+            year += 1900 if year >= 69 else 2000
+            return datetime(year, int(first), int(second))
+    except ValueError:
+        return None
+    return None
+
+
 class BaseFinancialParser(ABC):
     """Base class for financial statement parsers."""
 
@@ -296,7 +331,13 @@ class BaseFinancialParser(ABC):
         Returns:
             datetime object
         """
+        date_str = date_str.strip()
+
         if formats is None:
+            parsed = _parse_numeric_date(date_str)
+            if parsed is not None:
+                return parsed
+
             # Common date formats used by financial institutions
             formats = [
                 "%m/%d/%Y",  # 01/31/2024
@@ -309,8 +350,6 @@ class BaseFinancialParser(ABC):
                 "%B %d, %Y",  # January 31, 2024
             ]
 
-        date_str = date_str.strip()
-
         for fmt in formats:
             try:
                 return datetime.strptime(date_str, fmt)
@@ -3,10 +3,12 @@ LLM-based CSV parser for unknown formats.
 Uses LLM to intelligently extract holdings from any CSV structure.
 """
 
+import asyncio
 import csv
 import io
 import json
 import logging
+import re
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
@@ -20,6 +22,117 @@ from app.parsers.base_financial_parser import (
 
 logger = logging.getLogger(__name__)
 
+# Schema date formats (as reported by the LLM) -> strptime formats
+_DATE_FORMAT_MAP = {
+    "MM/DD/YYYY": "%m/%d/%Y",
+    "YYYY-MM-DD": "%Y-%m-%d",
+    "MM-DD-YYYY": "%m-%d-%Y",
+    "DD/MM/YYYY": "%d/%m/%Y",
+}
+
+# str.translate tables for cleaning numeric cells in a single pass
+_CURRENCY_CHARS = str.maketrans("", "", "$,")
+_SIGNED_CURRENCY_CHARS = str.maketrans({"$": None, ",": None, "(": "-", ")": None})
+
+# Value shapes reported to the LLM in place of real sample values
+_DATE_PATTERNS = (
+    (re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$"), "[DATE:MM/DD/YYYY]"),
+    (re.compile(r"^\d{4}-\d{2}-\d{2}$"), "[DATE:YYYY-MM-DD]"),
+    (re.compile(r"^\d{1,2}-\d{1,2}-\d{4}$"), "[DATE:MM-DD-YYYY]"),
+    (re.compile(r"^[A-Za-z]{3} \d{1,2}, \d{4}$"), "[DATE:Mon DD, YYYY]"),
+)
+_SYMBOL_PATTERN = re.compile(r"^[A-Z]{2,5}$")
+
+# Common transaction type labels that are not TransactionType member names
+_TRANSACTION_TYPE_MAPPING = {
+    "SALE": TransactionType.PURCHASE,
+    "ACH": TransactionType.TRANSFER,
+    "WITHDRAWAL": TransactionType.WITHDRAWAL,
+    "DEPOSIT": TransactionType.DEPOSIT,
+}
+
+# Schema mappings for well-known export layouts, keyed by their exact header
+# set, so these files are mapped without a round trip to the LLM
+_KNOWN_HEADER_SCHEMAS: dict[frozenset[str], tuple[str, dict]] = {
+    # Chase checking
+    frozenset(
+        {
+            "Details",
+            "Posting Date",
+            "Description",
+            "Amount",
+            "Type",
+            "Balance",
+            "Check or Slip #",
+        }
+    ): (
+        "transactions",
+        {
+            "date": {"column": "Posting Date", "format": "MM/DD/YYYY"},
+            "description": {"column": "Description"},
+            "amount": {"column": "Amount", "sign_convention": "negative_for_debits"},
+            "transaction_type": {"column": "Type", "default": "DEBIT"},
+        },
+    ),
+    # Chase credit card
+    frozenset(
+        {
+            "Transaction Date",
+            "Post Date",
+            "Description",
+            "Category",
+            "Type",
+            "Amount",
+            "Memo",
+        }
+    ): (
+        "transactions",
+        {
+            "date": {"column": "Transaction Date", "format": "MM/DD/YYYY"},
+            "description": {"column": "Description"},
+            "amount": {"column": "Amount", "sign_convention": "negative_for_debits"},
+            "transaction_type": {"column": "Type", "default": "DEBIT"},
+            "category": {"column": "Category"},
+        },
+    ),
+    # Fidelity positions
+    frozenset(
+        {
+            "Account Number",
+            "Account Name",
+            "Symbol",
+            "Description",
+            "Quantity",
+            "Last Price",
+            "Current Value",
+            "Cost Basis Total",
+            "Gain/Loss Dollar",
+            "Gain/Loss Percent",
+        }
+    ): (
+        "holdings",
+        {
+            "symbol": {"column": "Symbol"},
+            "description": {"column": "Description"},
+            "quantity": {"column": "Quantity"},
+            "price": {"column": "Last Price"},
+            "market_value": {"column": "Current Value"},
+            "cost_basis": {"column": "Cost Basis Total"},
+            "gain_loss": {"column": "Gain/Loss Dollar"},
+        },
+    ),
+    # Discover card: purchases are positive, payments negative
+    frozenset({"Trans. Date", "Post Date", "Description", "Amount", "Category"}): (
+        "transactions",
+        {
+            "date": {"column": "Trans. Date", "format": "MM/DD/YYYY"},
+            "description": {"column": "Description"},
+            "amount": {"column": "Amount", "sign_convention": "positive_for_debits"},
+            "category": {"column": "Category"},
+        },
+    ),
+}
+
 
 class LLMCSVParser(BaseFinancialParser):
     """Parser that uses LLM to understand and extract data from any CSV format.
@@ -28,9 +141,17 @@ class LLMCSVParser(BaseFinancialParser):
     then applies schema locally to extract actual data without exposing it to LLM.
     """
 
-    def __init__(self):
-        """Initialize LLM CSV parser."""
+    def __init__(self, keep_raw: bool = False):
+        """
+        Initialize LLM CSV parser.
+
+        Args:
+            keep_raw: Attach a copy of each source CSV row as raw_data. Off by
+                default since nothing downstream reads it and it pins every row
+                in memory for the lifetime of the parsed result.
+        """
         super().__init__("LLM CSV Parser")
+        self.keep_raw = keep_raw
 
     async def parse_file(
         self,
@@ -54,12 +175,9 @@ class LLMCSVParser(BaseFinancialParser):
             Parsed holdings and metadata
         """
         try:
-            # Decode CSV
-            text_content = file_content.decode("utf-8-sig")
-            csv_reader = csv.DictReader(io.StringIO(text_content))
-            
-            # Get headers and first few rows for LLM analysis
-            rows = list(csv_reader)
+            # Decode and read the CSV off the event loop
+            loop = asyncio.get_running_loop()
+            rows = await loop.run_in_executor(None, self._read_csv_rows, file_content)
             if not rows:
                 raise ValueError("CSV file is empty")
             
@@ -89,6 +207,14 @@ class LLMCSVParser(BaseFinancialParser):
             logger.error("Error in LLM CSV parsing: %s", e, exc_info=True)
             raise
 
+    @staticmethod
+    def _read_csv_rows(file_content: bytes) -> list[dict]:
+        """Decode CSV bytes and read every row as a dict keyed by header."""
+        text_stream = io.TextIOWrapper(
+            io.BytesIO(file_content), encoding="utf-8-sig", newline=""
+        )
+        return list(csv.DictReader(text_stream))
+
     async def _extract_data_with_llm(
         self,
         headers: list[str],
@@ -112,6 +238,18 @@ class LLMCSVParser(BaseFinancialParser):
         Returns:
             Tuple of (holdings list, transactions list)
         """
+        # Well-known layouts are recognized from their header row alone
+        known_schema = _KNOWN_HEADER_SCHEMAS.get(frozenset(headers))
+        if known_schema:
+            file_type, schema = known_schema
+            logger.info(
+                f"Recognized {file_type} CSV layout from its headers, "
+                "applying schema locally without the LLM"
+            )
+            if file_type == "holdings":
+                return self._apply_holdings_schema_locally(schema, rows), []
+            return [], self._apply_transactions_schema_locally(schema, rows)
+
         # Try to get user's configured LLM
         llm = None
         if session and user_id and search_space_id:
@@ -252,7 +390,7 @@ Example for transactions:
         value_str = str(value).strip()
         
         # Check for decimal/currency
-        clean_val = value_str.replace("$", "").replace(",", "").replace("(", "-").replace(")", "").strip()
+        clean_val = value_str.translate(_SIGNED_CURRENCY_CHARS).strip()
         try:
             float(clean_val)
             if "." in clean_val:
@@ -262,19 +400,12 @@ Example for transactions:
             pass
         
         # Check for date patterns
-        import re
-        date_patterns = [
-            (r'^\d{1,2}/\d{1,2}/\d{4}$', '[DATE:MM/DD/YYYY]'),
-            (r'^\d{4}-\d{2}-\d{2}$', '[DATE:YYYY-MM-DD]'),
-            (r'^\d{1,2}-\d{1,2}-\d{4}$', '[DATE:MM-DD-YYYY]'),
-            (r'^[A-Za-z]{3} \d{1,2}, \d{4}$', '[DATE:Mon DD, YYYY]'),
-        ]
-        for pattern, indicator in date_patterns:
-            if re.match(pattern, value_str):
+        for pattern, indicator in _DATE_PATTERNS:
+            if pattern.match(value_str):
                 return indicator
         
         # Check for stock symbols (2-5 uppercase letters)
-        if re.match(r'^[A-Z]{2,5}$', value_str):
+        if _SYMBOL_PATTERN.match(value_str):
             return "[SYMBOL]"
         
         # Default to text
@@ -293,19 +424,37 @@ Example for transactions:
         """
         holdings = []
         
+        # Resolve the schema once; every row shares the same columns
+        symbol_col = schema.get("symbol", {}).get("column")
+        quantity_col = schema.get("quantity", {}).get("column")
+        price_col = schema.get("price", {}).get("column")
+        mv_col = schema.get("market_value", {}).get("column")
+        description_col = schema.get("description", {}).get("column", "")
+        cb_config = schema.get("cost_basis", {})
+        cb_col = cb_config.get("column")
+        cb_uses_cols = None
+        calculation = cb_config.get("calculation") or ""
+        if "column" not in cb_config and "market_value - gain_loss" in calculation:
+            # Handle calculated cost_basis (e.g., market_value - gain_loss)
+            uses_cols = cb_config.get("uses_columns", [])
+            if len(uses_cols) >= 2:
+                cb_uses_cols = uses_cols
+        
+        if not symbol_col or not quantity_col:
+            logger.info("Extracted 0 holdings locally (privacy-preserving)")
+            return holdings
+        
         for row in rows:
             try:
                 # Extract symbol
-                symbol_col = schema.get("symbol", {}).get("column")
-                if not symbol_col or symbol_col not in row:
+                if symbol_col not in row:
                     continue
                 symbol = str(row[symbol_col]).strip().upper()
                 if not symbol or symbol in ["", "N/A", "Total", "TOTAL"]:
                     continue
                 
                 # Extract quantity
-                quantity_col = schema.get("quantity", {}).get("column")
-                if not quantity_col or quantity_col not in row:
+                if quantity_col not in row:
                     continue
                 quantity_str = str(row[quantity_col]).replace(",", "").strip()
                 if not quantity_str:
@@ -316,36 +465,28 @@ Example for transactions:
                 
                 # Extract optional fields
                 price = None
-                price_col = schema.get("price", {}).get("column")
                 if price_col and price_col in row and row[price_col]:
-                    price = Decimal(str(row[price_col]).replace("$", "").replace(",", "").strip())
+                    price = Decimal(str(row[price_col]).translate(_CURRENCY_CHARS).strip())
                 
                 market_value = None
-                mv_col = schema.get("market_value", {}).get("column")
                 if mv_col and mv_col in row and row[mv_col]:
-                    market_value = Decimal(str(row[mv_col]).replace("$", "").replace(",", "").strip())
+                    market_value = Decimal(str(row[mv_col]).translate(_CURRENCY_CHARS).strip())
                 
                 # Handle cost_basis - might need calculation
                 cost_basis = None
-                cb_config = schema.get("cost_basis", {})
-                if "column" in cb_config:
-                    cb_col = cb_config["column"]
+                if cb_col is not None:
                     if cb_col in row and row[cb_col]:
-                        cost_basis = Decimal(str(row[cb_col]).replace("$", "").replace(",", "").strip())
-                elif "calculation" in cb_config:
-                    # Handle calculated cost_basis (e.g., market_value - gain_loss)
-                    calc = cb_config["calculation"]
-                    if "market_value - gain_loss" in calc:
-                        uses_cols = cb_config.get("uses_columns", [])
-                        if len(uses_cols) >= 2 and all(c in row for c in uses_cols):
-                            mv = Decimal(str(row[uses_cols[0]]).replace("$", "").replace(",", "").strip())
-                            gl_str = str(row[uses_cols[1]]).replace("$", "").replace(",", "").replace("(", "-").replace(")", "").strip()
-                            gl = Decimal(gl_str)
-                            cost_basis = mv - gl
+                        cost_basis = Decimal(str(row[cb_col]).translate(_CURRENCY_CHARS).strip())
+                elif cb_uses_cols and all(c in row for c in cb_uses_cols):
+                    mv = Decimal(str(row[cb_uses_cols[0]]).translate(_CURRENCY_CHARS).strip())
+                    gl = Decimal(
+                        str(row[cb_uses_cols[1]]).translate(_SIGNED_CURRENCY_CHARS).strip()
+                    )
+                    cost_basis = mv - gl
                 
                 holding = InvestmentHolding(
                     symbol=symbol,
-                    description=row.get(schema.get("description", {}).get("column", ""), ""),
+                    description=row.get(description_col, ""),
                     quantity=quantity,
                     price=price,
                     value=market_value,
@@ -354,7 +495,7 @@ Example for transactions:
                     gain_loss_percent=None,
                     account_type=None,
                     asset_type="stock" if len(symbol) <= 5 else "mutual_fund",
-                    raw_data=dict(row),
+                    raw_data=dict(row) if self.keep_raw else None,
                 )
                 
                 holdings.append(holding)
@@ -379,29 +520,31 @@ Example for transactions:
         """
         transactions = []
         
+        # Resolve the schema once; every row shares the same columns
+        date_col = schema.get("date", {}).get("column")
+        date_format = schema.get("date", {}).get("format", "MM/DD/YYYY")
+        python_format = _DATE_FORMAT_MAP.get(date_format, "%m/%d/%Y")
+        desc_col = schema.get("description", {}).get("column")
+        amount_col = schema.get("amount", {}).get("column")
+        # Amounts are stored negative for debits; flip exports that sign the
+        # other way round (e.g. credit cards listing purchases as positive)
+        flip_sign = (
+            schema.get("amount", {}).get("sign_convention") == "positive_for_debits"
+        )
+        txn_type_col = schema.get("transaction_type", {}).get("column")
+        category_col = schema.get("category", {}).get("column")
+        merchant_col = schema.get("merchant", {}).get("column")
+        
         for row in rows:
             try:
                 # Extract date
-                date_col = schema.get("date", {}).get("column")
                 if not date_col or date_col not in row or not row[date_col]:
                     continue
                 
                 date_str = str(row[date_col]).strip()
-                date_format = schema.get("date", {}).get("format", "MM/DD/YYYY")
-                
-                # Parse date based on detected format
-                from datetime import datetime
-                format_map = {
-                    "MM/DD/YYYY": "%m/%d/%Y",
-                    "YYYY-MM-DD": "%Y-%m-%d",
-                    "MM-DD-YYYY": "%m-%d-%Y",
-                    "DD/MM/YYYY": "%d/%m/%Y",
-                }
-                python_format = format_map.get(date_format, "%m/%d/%Y")
                 date = datetime.strptime(date_str, python_format).date()
                 
                 # Extract description
-                desc_col = schema.get("description", {}).get("column")
                 if not desc_col or desc_col not in row:
                     continue
                 description = str(row[desc_col]).strip()
@@ -409,43 +552,33 @@ Example for transactions:
                     continue
                 
                 # Extract amount
-                amount_col = schema.get("amount", {}).get("column")
                 if not amount_col or amount_col not in row or not row[amount_col]:
                     continue
                 
-                amount_str = str(row[amount_col]).replace("$", "").replace(",", "").replace("(", "-").replace(")", "").strip()
+                amount_str = str(row[amount_col]).translate(_SIGNED_CURRENCY_CHARS).strip()
                 amount = Decimal(amount_str)
+                if flip_sign:
+                    amount = -amount
                 
                 # Determine transaction type
-                sign_convention = schema.get("amount", {}).get("sign_convention", "negative_for_debits")
-                txn_type_col = schema.get("transaction_type", {}).get("column")
-                
                 if txn_type_col and txn_type_col in row and row[txn_type_col]:
                     txn_type_str = str(row[txn_type_col]).upper().strip()
                     try:
                         txn_type = TransactionType[txn_type_str]
                     except KeyError:
                         # Try to map common transaction types
-                        type_mapping = {
-                            "SALE": TransactionType.PURCHASE,
-                            "ACH": TransactionType.TRANSFER,
-                            "WITHDRAWAL": TransactionType.WITHDRAWAL,
-                            "DEPOSIT": TransactionType.DEPOSIT,
-                        }
-                        txn_type = type_mapping.get(txn_type_str, 
-                                                    TransactionType.CREDIT if amount > 0 else TransactionType.DEBIT)
+                        txn_type = _TRANSACTION_TYPE_MAPPING.get(txn_type_str, 
+                                                                 TransactionType.CREDIT if amount > 0 else TransactionType.DEBIT)
                 else:
                     # Use default or infer from amount
                     txn_type = TransactionType.CREDIT if amount > 0 else TransactionType.DEBIT
                 
                 # Extract optional fields
                 category = None
-                category_col = schema.get("category", {}).get("column")
                 if category_col and category_col in row:
                     category = str(row[category_col]).strip() or None
                 
                 merchant = None
-                merchant_col = schema.get("merchant", {}).get("column")
                 if merchant_col and merchant_col in row:
                     merchant = str(row[merchant_col]).strip() or None
                 
@@ -460,7 +593,7 @@ Example for transactions:
                     account_last_4=None,
                     check_number=None,
                     memo=None,
-                    raw_data=dict(row),
+                    raw_data=dict(row) if self.keep_raw else None,
                 )
                 
                 transactions.append(transaction)
@@ -523,7 +656,7 @@ Example for transactions:
                 gain_loss_percent=None,
                 account_type=None,
                 asset_type="stock",
-                raw_data=dict(row),
+                raw_data=dict(row) if self.keep_raw else None,
             )
             
             holdings.append(holding)
@@ -5,6 +5,7 @@ OFX is a universal format supported by most banks and financial institutions.
 This provides broad compatibility without needing institution-specific parsers.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from decimal import Decimal
@@ -58,8 +59,9 @@ class OFXParser(BaseFinancialParser):
                 msg = "ofxparse library not installed. Install with: pip install ofxparse"
                 raise ImportError(msg) from None
 
-            # Parse OFX
-            ofx = OfxParser.parse(file_content)
+            # Parse OFX off the event loop; large statements take a while
+            loop = asyncio.get_running_loop()
+            ofx = await loop.run_in_executor(None, OfxParser.parse, file_content)
 
             transactions = []
             holdings = []
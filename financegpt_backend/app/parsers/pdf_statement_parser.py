@@ -4,6 +4,7 @@ PDF bank statement parser.
 Extracts transactions from PDF bank statements (Chase, Discover, etc.)
 """
 
+import asyncio
 import logging
 import re
 from datetime import datetime
@@ -17,6 +18,20 @@ from app.parsers.base_financial_parser import (
 
 logger = logging.getLogger(__name__)
 
+# Chase: MM/DD Description Amount
+_CHASE_LINE_RE = re.compile(r"(\d{2}/\d{2})\s+(.+?)\s+([-$,\d.]+)")
+
+# Discover: Trans Date Post Date Description Amount
+_DISCOVER_LINE_RE = re.compile(
+    r"(\d{2}/\d{2}/\d{2,4})\s+(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+([-$,\d.]+)"
+)
+
+# Generic: tried in order
+_GENERIC_LINE_RES = (
+    re.compile(r"(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+([-$,\d.]+)"),  # Date Description Amount
+    re.compile(r"(\d{2}/\d{2})\s+(.+?)\s+([-$,\d.]+)"),  # MM/DD Description Amount
+)
+
 
 class PDFStatementParser(BaseFinancialParser):
     """Parser for PDF bank statements."""
@@ -79,20 +94,29 @@ class PDFStatementParser(BaseFinancialParser):
             raise
 
     async def _extract_pdf_text(self, pdf_content: bytes) -> str:
-        """Extract text from PDF."""
+        """Extract text from PDF without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._extract_pdf_text_sync, pdf_content
+        )
+
+    def _extract_pdf_text_sync(self, pdf_content: bytes) -> str:
+        """
+        Extract text from PDF.
+
+        Page texts are collected and joined once rather than appended to a
+        growing string, which re-copies the text so far on every page.
+        """
         try:
             # Try pypdf first (lightweight)
             from pypdf import PdfReader
             import io
 
-            pdf_file = io.BytesIO(pdf_content)
-            reader = PdfReader(pdf_file)
-
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            with io.BytesIO(pdf_content) as pdf_file:
+                reader = PdfReader(pdf_file)
+                page_texts = [page.extract_text() + "\n" for page in reader.pages]
 
-            return text
+            return "".join(page_texts)
 
         except Exception as e:
             logger.warning(f"pypdf failed, trying pdfplumber: {e}")
@@ -102,16 +126,16 @@ class PDFStatementParser(BaseFinancialParser):
                 import pdfplumber
                 import io
 
-                pdf_file = io.BytesIO(pdf_content)
-                text = ""
-
-                with pdfplumber.open(pdf_file) as pdf:
+                with io.BytesIO(pdf_content) as pdf_file, pdfplumber.open(pdf_file) as pdf:
+                    page_texts = []
                     for page in pdf.pages:
                         page_text = page.extract_text()
                         if page_text:
-                            text += page_text + "\n"
+                            page_texts.append(page_text + "\n")
+                        # Drop the page's parsed layout before moving on
+                        page.close()
 
-                return text
+                return "".join(page_texts)
 
             except ImportError:
                 msg = "Neither pypdf nor pdfplumber is installed. Install with: pip install pypdf pdfplumber"
@@ -150,10 +174,10 @@ class PDFStatementParser(BaseFinancialParser):
         # 01/15 WHOLE FOODS MARKET -125.50
         # 01/16 PAYCHECK DIRECT DEP 3,500.00
 
-        # Pattern: MM/DD Description Amount
-        pattern = r"(\d{2}/\d{2})\s+(.+?)\s+([-$,\d.]+)"
+        # Statement lines carry no year; assume the current one
+        current_year = datetime.now().year
 
-        for match in re.finditer(pattern, text):
+        for match in _CHASE_LINE_RE.finditer(text):
             try:
                 date_str = match.group(1)
                 description = match.group(2).strip()
@@ -164,7 +188,6 @@ class PDFStatementParser(BaseFinancialParser):
                     continue
 
                 # Parse date (add current year)
-                current_year = datetime.now().year
                 date = datetime.strptime(f"{date_str}/{current_year}", "%m/%d/%Y")
 
                 # Parse amount
@@ -196,9 +219,7 @@ class PDFStatementParser(BaseFinancialParser):
         # Discover format: Trans Date Post Date Description Amount
         # 01/15/24 01/16/24 TARGET STORE -89.99
 
-        pattern = r"(\d{2}/\d{2}/\d{2,4})\s+(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+([-$,\d.]+)"
-
-        for match in re.finditer(pattern, text):
+        for match in _DISCOVER_LINE_RE.finditer(text):
             try:
                 trans_date_str = match.group(1)
                 description = match.group(3).strip()
@@ -234,13 +255,8 @@ class PDFStatementParser(BaseFinancialParser):
         transactions = []
 
         # Try multiple common patterns
-        patterns = [
-            r"(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+([-$,\d.]+)",  # Date Description Amount
-            r"(\d{2}/\d{2})\s+(.+?)\s+([-$,\d.]+)",  # MM/DD Description Amount
-        ]
-
-        for pattern in patterns:
-            for match in re.finditer(pattern, text):
+        for pattern in _GENERIC_LINE_RES:
+            for match in pattern.finditer(text):
                 try:
                     date_str = match.group(1)
                     description = match.group(2).strip()
@@ -6,10 +6,16 @@ allowing the frontend to fetch document details when a user clicks
 on a [citation:doc-XXX] link.
 """
 
+import base64
+import json
+from collections.abc import Iterator
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import ColumnElement, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.db import (
     FinanceGPTDocsChunk,
@@ -17,16 +23,51 @@ from app.db import (
     User,
     get_async_session,
 )
-from app.schemas import PaginatedResponse
+from app.schemas import CursorPaginatedResponse
 from app.schemas.financegpt_docs import (
-    FinanceGPTDocsChunkRead,
-    FinanceGPTDocsDocumentRead,
+    FinanceGPTDocsDocumentListItem,
     FinanceGPTDocsDocumentWithChunksRead,
 )
 from app.users import current_active_user
 
 router = APIRouter()
 
+# Docs only change when the indexer re-seeds them, so clients may reuse a
+# fetched doc for a while. "private" because the endpoint requires auth.
+_DOCS_CACHE_CONTROL = "private, max-age=300, stale-while-revalidate=60"
+
+
+def _title_filter(search_term: str) -> ColumnElement[bool]:
+    """
+    Case-insensitive substring match on the doc title.
+
+    The pg_trgm GIN index on title serves terms of three or more characters;
+    shorter ones fall back to a scan of the (small) docs table.
+    """
+    return FinanceGPTDocsDocument.title.ilike(f"%{search_term}%")
+
+
+def _stream_doc_with_chunks(document: FinanceGPTDocsDocument) -> Iterator[bytes]:
+    """
+    Serialize a document and its chunks as FinanceGPTDocsDocumentWithChunksRead
+    JSON, one chunk at a time.
+    """
+    header = orjson.dumps(
+        {
+            "id": document.id,
+            "title": document.title,
+            "source": document.source,
+            "content": document.content,
+        }
+    )
+    # Reopen the header object to append the chunks array
+    yield header[:-1] + b',"chunks":['
+    separator = b""
+    for chunk in document.chunks:
+        yield separator + orjson.dumps({"id": chunk.id, "content": chunk.content})
+        separator = b","
+    yield b"]}"
+
 
 @router.get(
     "/financegpt-docs/by-chunk/{chunk_id}",
@@ -43,44 +84,32 @@ async def get_financegpt_doc_by_chunk_id(
     This endpoint is used by the frontend to resolve [citation:doc-XXX] links.
     """
     try:
-        # Get the chunk
-        chunk_result = await session.execute(
-            select(FinanceGPTDocsChunk).filter(FinanceGPTDocsChunk.id == chunk_id)
-        )
-        chunk = chunk_result.scalars().first()
-
-        if not chunk:
-            raise HTTPException(
-                status_code=404,
-                detail=f"FinanceGPT docs chunk with id {chunk_id} not found",
-            )
-
-        # Get the associated document with all its chunks
+        # Resolve the chunk's document (with all its chunks) in one lookup
         document_result = await session.execute(
             select(FinanceGPTDocsDocument)
-            .options(selectinload(FinanceGPTDocsDocument.chunks))
-            .filter(FinanceGPTDocsDocument.id == chunk.document_id)
+            .join(
+                FinanceGPTDocsChunk,
+                FinanceGPTDocsChunk.document_id == FinanceGPTDocsDocument.id,
+            )
+            # raiseload("*") makes any other (lazy) relationship access fail
+            # loudly instead of silently issuing per-row queries
+            .options(selectinload(FinanceGPTDocsDocument.chunks), raiseload("*"))
+            .filter(FinanceGPTDocsChunk.id == chunk_id)
         )
-        document = document_result.scalars().first()
+        document = document_result.scalar_one_or_none()
 
         if not document:
             raise HTTPException(
                 status_code=404,
-                detail="FinanceGPT docs document not found",
+                detail=f"FinanceGPT docs chunk with id {chunk_id} not found",
             )
 
-        # Sort chunks by ID
-        sorted_chunks = sorted(document.chunks, key=lambda x: x.id)
-
-        return FinanceGPTDocsDocumentWithChunksRead(
-            id=document.id,
-            title=document.title,
-            source=document.source,
-            content=document.content,
-            chunks=[
-                FinanceGPTDocsChunkRead(id=c.id, content=c.content)
-                for c in sorted_chunks
-            ],
+        # Stream the JSON so large docs aren't serialized in one piece;
+        # chunks are already ordered by ID via the relationship's order_by
+        return StreamingResponse(
+            _stream_doc_with_chunks(document),
+            media_type="application/json",
+            headers={"Cache-Control": _DOCS_CACHE_CONTROL},
         )
     except HTTPException:
         raise
@@ -91,77 +120,115 @@ async def get_financegpt_doc_by_chunk_id(
         ) from e
 
 
+def _encode_docs_cursor(title: str, doc_id: int) -> str:
+    """Encode the (title, id) keyset position of the last item on a page."""
+    return base64.urlsafe_b64encode(json.dumps([title, doc_id]).encode()).decode()
+
+
+def _decode_docs_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by ``_encode_docs_cursor``."""
+    try:
+        title, doc_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(title, str) or not isinstance(doc_id, int):
+            raise ValueError
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    return title, doc_id
+
+
 @router.get(
     "/financegpt-docs",
-    response_model=PaginatedResponse[FinanceGPTDocsDocumentRead],
+    response_model=CursorPaginatedResponse[FinanceGPTDocsDocumentListItem],
 )
 async def list_financegpt_docs(
-    page: int = 0,
+    cursor: str | None = None,
     page_size: int = 50,
     title: str | None = None,
+    include_total: bool = False,
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     """
     List all FinanceGPT documentation documents.
 
+    Uses keyset pagination on (title, id), so deep pages cost the same as the
+    first one and results stay stable under concurrent inserts.
+
     Args:
-        page: Zero-based page index.
+        cursor: Opaque cursor from the previous page's ``next_cursor``.
         page_size: Number of items per page (default: 50).
         title: Optional title filter (case-insensitive substring match).
+        include_total: Also return the total number of matching docs (runs a COUNT).
         session: Database session (injected).
         user: Current authenticated user (injected).
 
     Returns:
-        PaginatedResponse[FinanceGPTDocsDocumentRead]: Paginated list of FinanceGPT docs.
+        CursorPaginatedResponse[FinanceGPTDocsDocumentListItem]: Page of FinanceGPT docs
+        (without their content).
     """
     try:
-        # Base query
-        query = select(FinanceGPTDocsDocument)
-        count_query = select(func.count()).select_from(FinanceGPTDocsDocument)
+        # Base query; only the listed columns, never the (large) content
+        query = select(
+            FinanceGPTDocsDocument.id,
+            FinanceGPTDocsDocument.title,
+            FinanceGPTDocsDocument.source,
+            FinanceGPTDocsDocument.created_at,
+            FinanceGPTDocsDocument.updated_at,
+        )
 
         # Filter by title if provided
         if title and title.strip():
-            query = query.filter(FinanceGPTDocsDocument.title.ilike(f"%{title}%"))
-            count_query = count_query.filter(
-                FinanceGPTDocsDocument.title.ilike(f"%{title}%")
+            query = query.filter(_title_filter(title.strip()))
+
+        # Total is opt-in so casual UI calls don't pay for a full COUNT
+        total = None
+        if include_total:
+            count_query = select(func.count()).select_from(query.subquery())
+            total_result = await session.execute(count_query)
+            total = total_result.scalar() or 0
+
+        # Resume after the last row of the previous page
+        if cursor:
+            cursor_title, cursor_id = _decode_docs_cursor(cursor)
+            query = query.filter(
+                tuple_(FinanceGPTDocsDocument.title, FinanceGPTDocsDocument.id)
+                > (cursor_title, cursor_id)
             )
 
-        # Get total count
-        total_result = await session.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Calculate offset
-        offset = page * page_size
-
-        # Get paginated results
+        # Fetch one extra row to find out whether another page exists
         result = await session.execute(
-            query.order_by(FinanceGPTDocsDocument.title).offset(offset).limit(page_size)
+            query.order_by(FinanceGPTDocsDocument.title, FinanceGPTDocsDocument.id)
+            .limit(page_size + 1)
         )
-        docs = result.scalars().all()
+        rows = result.all()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
 
         # Convert to response format
         items = [
-            FinanceGPTDocsDocumentRead(
-                id=doc.id,
-                title=doc.title,
-                source=doc.source,
-                content=doc.content,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at,
+            FinanceGPTDocsDocumentListItem(
+                id=row.id,
+                title=row.title,
+                source=row.source,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
             )
-            for doc in docs
+            for row in rows
         ]
 
-        has_more = (offset + len(items)) < total
+        next_cursor = (
+            _encode_docs_cursor(rows[-1].title, rows[-1].id) if has_more else None
+        )
 
-        return PaginatedResponse(
+        return CursorPaginatedResponse(
             items=items,
-            total=total,
-            page=page,
             page_size=page_size,
             has_more=has_more,
+            next_cursor=next_cursor,
+            total=total,
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -2,17 +2,25 @@
 Plaid OAuth and connector routes.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
 
 from app.db import SearchSourceConnector, SearchSourceConnectorType, User, get_async_session
-from app.services.plaid_service import PlaidService
+from app.services.plaid_service import (
+    PlaidService,
+    build_plaid_connector_config,
+    get_access_token,
+    get_plaid_service,
+)
 from app.tasks.plaid_indexers.bank_of_america_plaid_indexer import (
     BankOfAmericaPlaidIndexer,
 )
@@ -25,9 +33,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/plaid", tags=["plaid"])
 
 
-
-
-
 # Mapping of connector types to indexers
 CONNECTOR_INDEXERS = {
     SearchSourceConnectorType.CHASE_BANK: ChasePlaidIndexer,
@@ -35,6 +40,88 @@ CONNECTOR_INDEXERS = {
     SearchSourceConnectorType.BANK_OF_AMERICA: BankOfAmericaPlaidIndexer,
 }
 
+# connector_name is a class attribute, so no indexer needs to be built for it
+CONNECTOR_DISPLAY_NAMES = {
+    connector_type: indexer_class.connector_name
+    for connector_type, indexer_class in CONNECTOR_INDEXERS.items()
+}
+
+
+# How long fetched Plaid accounts are reused for the same access token.
+# Balance views are requested in bursts by the UI, so identical calls within
+# this window (including concurrent ones) share a single Plaid request.
+_ACCOUNTS_COALESCE_SECONDS = 30.0
+
+# access_token -> (fetched_at, task resolving to PlaidService.get_accounts())
+_accounts_cache: dict[str, tuple[float, asyncio.Task]] = {}
+
+
+async def _get_accounts_cached(
+    plaid_service: PlaidService, access_token: str
+) -> list[dict[str, Any]]:
+    """Fetch accounts for an access token, coalescing calls within the TTL."""
+    now = time.monotonic()
+    cached = _accounts_cache.get(access_token)
+    if cached is None or now - cached[0] >= _ACCOUNTS_COALESCE_SECONDS:
+        # Drop expired entries so the cache doesn't grow with every token seen
+        for token, (fetched_at, _) in list(_accounts_cache.items()):
+            if now - fetched_at >= _ACCOUNTS_COALESCE_SECONDS:
+                del _accounts_cache[token]
+        task = asyncio.ensure_future(plaid_service.get_accounts(access_token))
+        _accounts_cache[access_token] = (now, task)
+    else:
+        task = cached[1]
+
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        # Never cache failures
+        if _accounts_cache.get(access_token, (None, None))[1] is task:
+            del _accounts_cache[access_token]
+        raise
+
+
+def _invalidate_accounts_cache(access_token: str) -> None:
+    """Forget coalesced accounts for a token whose account set may change."""
+    _accounts_cache.pop(access_token, None)
+
+
+async def _release_connection(session: AsyncSession) -> None:
+    """
+    End the session's current transaction before slow Plaid I/O.
+
+    The request session is shared with the auth dependency, so by the time a
+    handler runs it usually already holds a pooled connection. Committing
+    hands it back to the pool for the duration of the Plaid call; the next
+    query transparently checks one out again. Loaded objects stay usable
+    because the session doesn't expire them on commit.
+    """
+    await session.commit()
+
+
+def _serialize_plaid_account(acc: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert an account from PlaidService.get_accounts to the stored config format.
+
+    PlaidService already turns Plaid's enums into strings, so the values are
+    JSON-serializable as-is.
+    """
+    balance = acc.get("balance")
+    return {
+        "account_id": acc["account_id"],
+        "name": acc["name"],
+        "mask": acc.get("mask"),
+        "type": acc.get("type"),
+        "subtype": acc.get("subtype"),
+        "balances": {
+            "current": balance["current"],
+            "available": balance.get("available"),
+            "limit": balance.get("limit"),
+        }
+        if balance
+        else None,
+    }
+
 
 class CreateLinkTokenRequest(BaseModel):
     """Request to create Plaid Link token."""
@@ -82,7 +169,7 @@ async def create_link_token(
     This token is used by the frontend to open Plaid Link UI.
     """
     try:
-        plaid_service = PlaidService()
+        plaid_service = get_plaid_service()
 
         # Get institution ID from connector type
         # Validate connector type
@@ -126,7 +213,10 @@ async def exchange_public_token(
     We exchange it for an access token, store it, and trigger initial indexing.
     """
     try:
-        plaid_service = PlaidService()
+        # Don't hold a DB connection across the Plaid calls below
+        await _release_connection(session)
+
+        plaid_service = get_plaid_service()
 
         # Exchange public token for access token
         token_data = await plaid_service.exchange_public_token(request.public_token)
@@ -136,40 +226,23 @@ async def exchange_public_token(
         # Get accounts to display in connector name
         accounts_data = await plaid_service.get_accounts(access_token)
         
-        # Convert Plaid response to JSON-serializable format
-        # Plaid returns enums like AccountType which aren't JSON serializable
-        accounts = [
-            {
-                "account_id": acc["account_id"],
-                "name": acc["name"],
-                "mask": acc.get("mask"),
-                "type": acc["type"].value if hasattr(acc["type"], "value") else str(acc["type"]),
-                "subtype": acc["subtype"].value if acc.get("subtype") and hasattr(acc["subtype"], "value") else str(acc.get("subtype")) if acc.get("subtype") else None,
-                "balances": {
-                    "current": acc["balances"]["current"],
-                    "available": acc["balances"].get("available"),
-                    "limit": acc["balances"].get("limit"),
-                } if acc.get("balances") else None,
-            }
-            for acc in accounts_data
-        ]
-
-        # Get indexer for connector type
-        indexer_class = CONNECTOR_INDEXERS.get(request.connector_type)
-        if not indexer_class:
+        # Convert Plaid response to the format stored in connector config
+        accounts = [_serialize_plaid_account(acc) for acc in accounts_data]
+
+        # Get display name for connector type
+        display_name = CONNECTOR_DISPLAY_NAMES.get(request.connector_type)
+        if not display_name:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Unsupported connector type: {request.connector_type}",
             )
 
-        indexer = indexer_class()
-
         # Create connector name
         if request.connector_name:
             connector_name = request.connector_name
         else:
             account_names = ", ".join([acc["name"] for acc in accounts[:3]])
-            connector_name = f"{indexer.connector_name} ({account_names})"
+            connector_name = f"{display_name} ({account_names})"
 
         # Check if connector already exists for this item
         stmt = select(SearchSourceConnector).where(
@@ -182,16 +255,13 @@ async def exchange_public_token(
 
         if existing_connector:
             # Update existing connector
-            existing_connector.config = {
-                "access_token": access_token,
-                "item_id": item_id,
-                "accounts": accounts,
-            }
+            existing_connector.config = build_plaid_connector_config(
+                access_token, item_id, accounts
+            )
             existing_connector.is_indexable = True
             existing_connector.periodic_indexing_enabled = True
             existing_connector.indexing_frequency_minutes = 1440  # Daily
             await session.commit()
-            await session.refresh(existing_connector)
 
             connector = existing_connector
         else:
@@ -204,16 +274,15 @@ async def exchange_public_token(
                 is_indexable=True,
                 periodic_indexing_enabled=True,
                 indexing_frequency_minutes=1440,  # Daily sync
-                config={
-                    "access_token": access_token,
-                    "item_id": item_id,
-                    "accounts": accounts,
-                },
+                config=build_plaid_connector_config(access_token, item_id, accounts),
             )
 
             session.add(connector)
             await session.commit()
-            await session.refresh(connector)
+
+        # No session.refresh() needed: every field in the response was just
+        # set here (the id comes back from the INSERT) and the session doesn't
+        # expire attributes on commit.
 
         # Trigger initial indexing asynchronously
         from app.tasks.celery_tasks.connector_tasks import index_plaid_transactions_task
@@ -267,13 +336,14 @@ async def get_connector_accounts(
 
         # Get accounts from config
         accounts = connector.config.get("accounts", [])
-        access_token = connector.config.get("access_token")
+        access_token = get_access_token(connector.config)
         
         # Optionally refresh account balances from Plaid
         if access_token:
+            await _release_connection(session)
             try:
-                plaid_service = PlaidService()
-                fresh_accounts = await plaid_service.get_accounts(access_token)
+                plaid_service = get_plaid_service()
+                fresh_accounts = await _get_accounts_cached(plaid_service, access_token)
                 
                 # Merge fresh data with stored accounts
                 account_map = {acc["account_id"]: acc for acc in fresh_accounts}
@@ -331,15 +401,19 @@ async def create_update_link_token(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Connector not found"
             )
 
-        access_token = connector.config.get("access_token")
+        access_token = get_access_token(connector.config)
         if not access_token:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="No access token found for connector"
             )
 
+        # The update flow may change the item's accounts
+        _invalidate_accounts_cache(access_token)
+
         # Create link token in update mode
-        plaid_service = PlaidService()
+        await _release_connection(session)
+        plaid_service = get_plaid_service()
         response = await plaid_service.create_update_link_token(  # type: ignore[attr-defined]
             user_id=str(user.id),
             access_token=access_token
@@ -385,36 +459,40 @@ async def refresh_connector_accounts(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Connector not found"
             )
 
-        access_token = connector.config.get("access_token")
+        access_token = get_access_token(connector.config)
         if not access_token:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="No access token found"
             )
 
-        # Fetch fresh accounts from Plaid
-        plaid_service = PlaidService()
+        # Fetch fresh accounts from Plaid, bypassing (and invalidating) the
+        # short-lived cache since the account set has just changed
+        _invalidate_accounts_cache(access_token)
+        await _release_connection(session)
+        plaid_service = get_plaid_service()
         accounts_data = await plaid_service.get_accounts(access_token)
-        
-        # Convert to our format
-        accounts = [
-            {
-                "account_id": acc["account_id"],
-                "name": acc["name"],
-                "mask": acc.get("mask"),
-                "type": acc["type"].value if hasattr(acc["type"], "value") else str(acc["type"]),
-                "subtype": acc["subtype"].value if acc.get("subtype") and hasattr(acc["subtype"], "value") else str(acc.get("subtype")) if acc.get("subtype") else None,
-                "balances": {
-                    "current": acc["balances"]["current"],
-                    "available": acc["balances"].get("available"),
-                    "limit": acc["balances"].get("limit"),
-                } if acc.get("balances") else None,
-            }
-            for acc in accounts_data
-        ]
-
-        # Update connector config
+
+        # Merge into the stored accounts: entries Plaid still returns are
+        # updated in place (usually only balances change), new ones are added
+        # and ones removed via Plaid Link are dropped
+        stored_by_id = {
+            acc["account_id"]: acc for acc in connector.config.get("accounts", [])
+        }
+        accounts = []
+        for acc in accounts_data:
+            fresh = _serialize_plaid_account(acc)
+            stored = stored_by_id.get(fresh["account_id"])
+            if stored is None:
+                accounts.append(fresh)
+            else:
+                stored.update(fresh)
+                accounts.append(stored)
+
+        # Update connector config; the JSON column doesn't track in-place
+        # mutation, so flag it for the UPDATE explicitly
         connector.config["accounts"] = accounts
+        flag_modified(connector, "config")
         await session.commit()
 
         return {
@@ -445,15 +523,14 @@ async def sync_connector(
     Useful for testing or forcing an immediate update.
     """
     try:
-        # Get connector
-        stmt = select(SearchSourceConnector).where(
+        # Only check the connector exists; the task loads the row itself
+        stmt = select(literal(1)).where(
             SearchSourceConnector.id == connector_id,
             SearchSourceConnector.user_id == user.id,
         )
         result = await session.execute(stmt)
-        connector = result.scalar_one_or_none()
 
-        if not connector:
+        if result.scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Connector not found"
             )
@@ -19,15 +19,31 @@ Non-OAuth connectors (BookStack, GitHub, etc.) are limited to one per search spa
 """
 
 import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
-from typing import Any
-
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from typing import Any, Literal
+
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import Select, bindparam, exists, func, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
 
+from app.celery_app import celery_app
 from app.db import (
     Permission,
     SearchSourceConnector,
@@ -40,7 +56,6 @@ from app.schemas import (
     MCPConnectorCreate,
     MCPConnectorRead,
     MCPConnectorUpdate,
-    SearchSourceConnectorBase,
     SearchSourceConnectorCreate,
     SearchSourceConnectorRead,
     SearchSourceConnectorUpdate,
@@ -52,17 +67,28 @@ from app.utils.periodic_scheduler import (
     delete_periodic_schedule,
     update_periodic_schedule,
 )
-from app.utils.rbac import check_permission
+from app.utils.rbac import check_permission, get_connector_with_permission
+from app.utils.validators import validate_connector_config
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Responses here carry datetimes, UUIDs and connector config dicts, which
+# orjson encodes natively and much faster than the stdlib json encoder
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Registered name of the Plaid indexing task. Dispatching by name keeps the
+# API process from importing the Celery task modules.
+_PLAID_INDEXING_TASK_NAME = "index_plaid_transactions"
+
+# Rows fetched per round trip when streaming connector lists as NDJSON
+_CONNECTOR_STREAM_BATCH_SIZE = 50
 
 
 @router.post("/search-source-connectors", response_model=SearchSourceConnectorRead)
 async def create_search_source_connector(
     connector: SearchSourceConnectorCreate,
+    background_tasks: BackgroundTasks,
     search_space_id: int = Query(
         ..., description="ID of the search space to associate the connector with"
     ),
@@ -103,8 +129,10 @@ async def create_search_source_connector(
                     detail=f"A connector with type {connector.connector_type} already exists in this search space.",
                 )
 
-        # Prepare connector data
-        connector_data = connector.model_dump()
+        # Prepare connector data. Iterating the model yields its validated
+        # field values as-is, so the config dict isn't deep-copied the way
+        # model_dump() would copy it
+        connector_data = dict(connector)
 
         # Automatically set next_scheduled_at if periodic indexing is enabled
         if (
@@ -120,25 +148,26 @@ async def create_search_source_connector(
             **connector_data, search_space_id=search_space_id, user_id=user.id
         )
         session.add(db_connector)
+        # The flush INSERTs with RETURNING id and created_at is a Python-side
+        # default, so the committed object is complete without a refresh()
         await session.commit()
-        await session.refresh(db_connector)
 
-        # Create periodic schedule if periodic indexing is enabled
+        # Create periodic schedule if periodic indexing is enabled. This
+        # enqueues the first indexing run on the broker, so it runs after the
+        # response is sent; create_periodic_schedule logs its own failures.
         if (
             db_connector.periodic_indexing_enabled
             and db_connector.indexing_frequency_minutes
         ):
-            success = create_periodic_schedule(
+            background_tasks.add_task(
+                create_periodic_schedule,
                 connector_id=db_connector.id,
                 search_space_id=search_space_id,
                 user_id=str(user.id),
                 connector_type=db_connector.connector_type,
                 frequency_minutes=db_connector.indexing_frequency_minutes,
+                next_scheduled_at=db_connector.next_scheduled_at,
             )
-            if not success:
-                logger.warning(
-                    f"Failed to create periodic schedule for connector {db_connector.id}"
-                )
 
         return db_connector
     except ValidationError as e:
@@ -151,7 +180,8 @@ async def create_search_source_connector(
             detail=f"Integrity error: A connector with this type already exists in this search space. {e!s}",
         ) from e
     except HTTPException:
-        await session.rollback()
+        # Only raised by the permission and duplicate checks, before anything
+        # is written, so there is nothing to roll back
         raise
     except Exception as e:
         logger.error(f"Failed to create search source connector: {e!s}")
@@ -164,15 +194,20 @@ async def create_search_source_connector(
 
 @router.get("/search-source-connectors", response_model=list[SearchSourceConnectorRead])
 async def read_search_source_connectors(
-    skip: int = 0,
+    after_id: int | None = None,
     limit: int = 100,
     search_space_id: int | None = None,
+    response_format: Literal["json", "ndjson"] = Query("json", alias="format"),
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     """
     List all search source connectors for a search space.
     Requires CONNECTORS_READ permission.
+
+    Connectors are returned in id order. To fetch the next page, pass the id
+    of the last connector received as after_id (keyset pagination).
+    With format=ndjson the connectors are streamed one JSON object per line.
     """
     try:
         if search_space_id is None:
@@ -193,8 +228,17 @@ async def read_search_source_connectors(
         query = select(SearchSourceConnector).filter(
             SearchSourceConnector.search_space_id == search_space_id
         )
+        if after_id is not None:
+            query = query.filter(SearchSourceConnector.id > after_id)
+
+        query = query.order_by(SearchSourceConnector.id).limit(limit)
 
-        result = await session.execute(query.offset(skip).limit(limit))
+        if response_format == "ndjson":
+            return StreamingResponse(
+                _stream_connectors_ndjson(query), media_type="application/x-ndjson"
+            )
+
+        result = await session.execute(query)
         return result.scalars().all()
     except HTTPException:
         raise
@@ -205,39 +249,53 @@ async def read_search_source_connectors(
         ) from e
 
 
+async def _stream_connectors_ndjson(query: Select) -> AsyncIterator[bytes]:
+    """Yield one JSON line per connector, reading rows through a server-side cursor.
+
+    Runs after the response has started, so it uses its own session rather
+    than the request's.
+    """
+    async with async_session_maker() as stream_session:
+        rows = await stream_session.stream_scalars(
+            query.execution_options(yield_per=_CONNECTOR_STREAM_BATCH_SIZE)
+        )
+        async for connector in rows:
+            connector_read = SearchSourceConnectorRead.model_validate(connector)
+            yield orjson.dumps(connector_read.model_dump()) + b"\n"
+
+
 @router.get(
     "/search-source-connectors/{connector_id}", response_model=SearchSourceConnectorRead
 )
 async def read_search_source_connector(
     connector_id: int,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     """
     Get a specific search source connector by ID.
     Requires CONNECTORS_READ permission.
+
+    The response carries an ETag derived from the connector's updated_at;
+    a request whose If-None-Match matches it gets a 304 with no body.
     """
     try:
-        # Get the connector first
-        result = await session.execute(
-            select(SearchSourceConnector).filter(
-                SearchSourceConnector.id == connector_id
-            )
-        )
-        connector = result.scalars().first()
-
-        if not connector:
-            raise HTTPException(status_code=404, detail="Connector not found")
-
-        # Check permission
-        await check_permission(
+        # Get the connector and check permission in one query
+        connector = await get_connector_with_permission(
             session,
             user,
-            connector.search_space_id,
+            connector_id,
             Permission.CONNECTORS_READ.value,
             "You don't have permission to view this connector",
         )
 
+        etag = _connector_etag(connector)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
         return connector
     except HTTPException:
         raise
@@ -247,6 +305,18 @@ async def read_search_source_connector(
         ) from e
 
 
+def _connector_etag(connector: SearchSourceConnector) -> str:
+    """Weak ETag for a connector, changing whenever the row is updated."""
+    version = int(connector.updated_at.timestamp() * 1_000_000)
+    return f'W/"{connector.id}-{version}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header lists the given ETag."""
+    if_none_match = request.headers.get("if-none-match", "")
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
 @router.put(
     "/search-source-connectors/{connector_id}", response_model=SearchSourceConnectorRead
 )
@@ -261,20 +331,11 @@ async def update_search_source_connector(
     Requires CONNECTORS_UPDATE permission.
     Handles partial updates, including merging changes into the 'config' field.
     """
-    # Get the connector first
-    result = await session.execute(
-        select(SearchSourceConnector).filter(SearchSourceConnector.id == connector_id)
-    )
-    db_connector = result.scalars().first()
-
-    if not db_connector:
-        raise HTTPException(status_code=404, detail="Connector not found")
-
-    # Check permission
-    await check_permission(
+    # Get the connector and check permission in one query
+    db_connector = await get_connector_with_permission(
         session,
         user,
-        db_connector.search_space_id,
+        connector_id,
         Permission.CONNECTORS_UPDATE.value,
         "You don't have permission to update this connector",
     )
@@ -292,6 +353,16 @@ async def update_search_source_connector(
         "indexing_frequency_minutes", db_connector.indexing_frequency_minutes
     )
 
+    # Frequency the connector is currently being indexed at, if any, so an
+    # update that leaves the schedule as-is doesn't re-arm it (an explicit
+    # next_scheduled_at always reschedules)
+    previous_frequency = (
+        db_connector.indexing_frequency_minutes
+        if db_connector.periodic_indexing_enabled
+        and "next_scheduled_at" not in update_data
+        else None
+    )
+
     # Validate periodic indexing configuration
     if effective_periodic_enabled:
         if not effective_is_indexable:
@@ -314,7 +385,9 @@ async def update_search_source_connector(
         if (
             "periodic_indexing_enabled" in update_data
             or "indexing_frequency_minutes" in update_data
-        ) and "next_scheduled_at" not in update_data:
+        ) and "next_scheduled_at" not in update_data and (
+            effective_frequency != previous_frequency
+        ):
             # Schedule the next indexing based on the frequency
             update_data["next_scheduled_at"] = datetime.now(UTC) + timedelta(
                 minutes=effective_frequency
@@ -348,17 +421,10 @@ async def update_search_source_connector(
         )
 
         try:
-            # We can reuse the base validator by creating a temporary base model instance
-            # Note: This assumes 'name' and 'is_indexable' are not crucial for config validation itself
-            temp_data_for_validation = {
-                "name": db_connector.name,  # Use existing name
-                "connector_type": current_connector_type,
-                "is_indexable": db_connector.is_indexable,  # Use existing value
-                "last_indexed_at": db_connector.last_indexed_at,  # Not used by validator
-                "config": merged_config,
-            }
-            SearchSourceConnectorBase.model_validate(temp_data_for_validation)
-        except ValidationError as e:
+            # Only the config depends on the connector type, so validate it
+            # directly instead of re-parsing a whole SearchSourceConnectorBase
+            validate_connector_config(current_connector_type, merged_config)
+        except ValueError as e:
             # Raise specific validation error for the merged config
             raise HTTPException(
                 status_code=422, detail=f"Validation error for merged config: {e!s}"
@@ -367,30 +433,47 @@ async def update_search_source_connector(
         # If validation passes, update the main update_data dict with the merged config
         update_data["config"] = merged_config
 
-    # Apply all updates (including the potentially merged config)
-    for key, value in update_data.items():
-        # Prevent changing connector_type if it causes a duplicate (check moved here)
-        if key == "connector_type" and value != db_connector.connector_type:
-            check_result = await session.execute(
-                select(SearchSourceConnector).filter(
-                    SearchSourceConnector.search_space_id
-                    == db_connector.search_space_id,
-                    SearchSourceConnector.connector_type == value,
-                    SearchSourceConnector.id != connector_id,
+    # Apply all updates (including the potentially merged config) as one
+    # UPDATE of just the changed columns. synchronize_session="fetch" copies
+    # the new values onto the in-session db_connector for the code below.
+    if update_data:
+        # Set explicitly (not via onupdate) so the synchronized db_connector
+        # carries the new value without another SELECT
+        update_data["updated_at"] = datetime.now(UTC)
+        stmt = update(SearchSourceConnector).where(
+            SearchSourceConnector.id == connector_id
+        )
+        new_connector_type = update_data.get("connector_type")
+        if (
+            new_connector_type is not None
+            and new_connector_type != db_connector.connector_type
+        ):
+            # Changing the type must not create a duplicate in the search
+            # space: guard the UPDATE itself with NOT EXISTS so the check and
+            # the write happen in one statement
+            other_connector = aliased(SearchSourceConnector)
+            stmt = stmt.where(
+                ~exists().where(
+                    other_connector.search_space_id == db_connector.search_space_id,
+                    other_connector.connector_type == new_connector_type,
+                    other_connector.id != connector_id,
                 )
             )
-            existing_connector = check_result.scalars().first()
-            if existing_connector:
-                raise HTTPException(
-                    status_code=409,
-                    detail=f"A connector with type {value} already exists in this search space.",
-                )
-
-        setattr(db_connector, key, value)
+        result = await session.execute(
+            stmt.values(**update_data)
+            .returning(SearchSourceConnector.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=409,
+                detail=f"A connector with type {new_connector_type} already exists in this search space.",
+            )
 
     try:
+        # The UPDATE above already synchronized db_connector and nothing is
+        # generated server-side, so no refresh() is needed after the commit
         await session.commit()
-        await session.refresh(db_connector)
 
         # Handle periodic schedule updates
         if (
@@ -401,13 +484,17 @@ async def update_search_source_connector(
                 db_connector.periodic_indexing_enabled
                 and db_connector.indexing_frequency_minutes
             ):
-                # Create or update the periodic schedule
-                success = update_periodic_schedule(
+                # Create or update the periodic schedule; the Redis call is
+                # blocking, so it runs off the event loop
+                success = await run_in_threadpool(
+                    update_periodic_schedule,
                     connector_id=db_connector.id,
                     search_space_id=db_connector.search_space_id,
                     user_id=str(user.id),
                     connector_type=db_connector.connector_type,
                     frequency_minutes=db_connector.indexing_frequency_minutes,
+                    next_scheduled_at=db_connector.next_scheduled_at,
+                    old_frequency_minutes=previous_frequency,
                 )
                 if not success:
                     logger.warning(
@@ -415,7 +502,9 @@ async def update_search_source_connector(
                     )
             else:
                 # Delete the periodic schedule if disabled
-                success = delete_periodic_schedule(db_connector.id)
+                success = await run_in_threadpool(
+                    delete_periodic_schedule, db_connector.id
+                )
                 if not success:
                     logger.warning(
                         f"Failed to delete periodic schedule for connector {db_connector.id}"
@@ -451,29 +540,18 @@ async def delete_search_source_connector(
     Requires CONNECTORS_DELETE permission.
     """
     try:
-        # Get the connector first
-        result = await session.execute(
-            select(SearchSourceConnector).filter(
-                SearchSourceConnector.id == connector_id
-            )
-        )
-        db_connector = result.scalars().first()
-
-        if not db_connector:
-            raise HTTPException(status_code=404, detail="Connector not found")
-
-        # Check permission
-        await check_permission(
+        # Get the connector and check permission in one query
+        db_connector = await get_connector_with_permission(
             session,
             user,
-            db_connector.search_space_id,
+            connector_id,
             Permission.CONNECTORS_DELETE.value,
             "You don't have permission to delete this connector",
         )
 
         # Delete any periodic schedule associated with this connector
         if db_connector.periodic_indexing_enabled:
-            success = delete_periodic_schedule(connector_id)
+            success = await run_in_threadpool(delete_periodic_schedule, connector_id)
             if not success:
                 logger.warning(
                     f"Failed to delete periodic schedule for connector {connector_id}"
@@ -529,49 +607,39 @@ async def index_connector_content(
         Dictionary with indexing status
     """
     try:
-        # Get the connector first
-        result = await session.execute(
-            select(SearchSourceConnector).filter(
-                SearchSourceConnector.id == connector_id
-            )
-        )
-        connector = result.scalars().first()
-
-        if not connector:
-            raise HTTPException(status_code=404, detail="Connector not found")
-
-        # Check if user has permission to update connectors (indexing is an update operation)
-        await check_permission(
+        # Get the connector and check that the user may update connectors in
+        # the target search space (indexing is an update operation)
+        connector = await get_connector_with_permission(
             session,
             user,
-            search_space_id,
+            connector_id,
             Permission.CONNECTORS_UPDATE.value,
             "You don't have permission to index content in this search space",
+            search_space_id=search_space_id,
         )
 
         # Handle different connector types
         response_message = ""
-        today_str = datetime.now().strftime("%Y-%m-%d")
+        # last_indexed_at is timestamptz and comes back as an aware UTC
+        # datetime, so compare dates in UTC as well
+        today = datetime.now(UTC).date()
 
         # Determine the actual date range to use
         if start_date is None:
             # Use last_indexed_at or default to 365 days ago
             if connector.last_indexed_at:
-                today = datetime.now().date()
                 if connector.last_indexed_at.date() == today:
                     # If last indexed today, go back 1 day to ensure we don't miss anything
-                    indexing_from = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+                    indexing_from = (today - timedelta(days=1)).isoformat()
                 else:
                     indexing_from = connector.last_indexed_at.strftime("%Y-%m-%d")
             else:
-                indexing_from = (datetime.now() - timedelta(days=365)).strftime(
-                    "%Y-%m-%d"
-                )
+                indexing_from = (today - timedelta(days=365)).isoformat()
         else:
             indexing_from = start_date
 
         # Default to today if no end_date provided
-        indexing_to = end_date if end_date else today_str
+        indexing_to = end_date if end_date else today.isoformat()
 
         if connector.connector_type == SearchSourceConnectorType.COMPOSIO_CONNECTOR:
             from app.tasks.celery_tasks.connector_tasks import (
@@ -591,14 +659,10 @@ async def index_connector_content(
             SearchSourceConnectorType.FIDELITY_INVESTMENTS,
             SearchSourceConnectorType.BANK_OF_AMERICA,
         ):
-            from app.tasks.celery_tasks.connector_tasks import (
-                index_plaid_transactions_task,
-            )
-
             logger.info(
                 f"Triggering Plaid transactions indexing for connector {connector_id} into search space {search_space_id}"
             )
-            index_plaid_transactions_task.delay(connector_id)
+            celery_app.send_task(_PLAID_INDEXING_TASK_NAME, args=(connector_id,))
             response_message = "Bank transactions indexing started in the background."
 
         else:
@@ -636,16 +700,17 @@ async def _update_connector_timestamp_by_id(session: AsyncSession, connector_id:
         connector_id: ID of the connector to update
     """
     try:
+        # One UPDATE with the database clock, so every worker stamps the
+        # same time source and no row is loaded
         result = await session.execute(
-            select(SearchSourceConnector).filter(
-                SearchSourceConnector.id == connector_id
-            )
+            update(SearchSourceConnector)
+            .where(SearchSourceConnector.id == connector_id)
+            .values(last_indexed_at=func.now())
+            .execution_options(synchronize_session=False)
         )
-        connector = result.scalars().first()
+        await session.commit()
 
-        if connector:
-            connector.last_indexed_at = datetime.now()
-            await session.commit()
+        if result.rowcount:
             logger.info(f"Updated last_indexed_at for connector {connector_id}")
     except Exception as e:
         logger.error(
@@ -715,22 +780,49 @@ async def create_mcp_connector(
             f"for user {user.id} in search space {search_space_id}"
         )
 
-        # Convert to read schema
-        connector_read = SearchSourceConnectorRead.model_validate(db_connector)
-        return MCPConnectorRead.from_connector(connector_read)
-
+        return MCPConnectorRead.from_connector(db_connector)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create MCP connector: {e!s}", exc_info=True)
+        logger.error("Failed to create MCP connector: %s", e, exc_info=True)
         await session.rollback()
         raise HTTPException(
             status_code=500, detail=f"Failed to create MCP connector: {e!s}"
         ) from e
 
 
+# Columns read by MCPConnectorRead.from_connector / dump_connector
+_MCP_CONNECTOR_READ_COLUMNS = (
+    SearchSourceConnector.id,
+    SearchSourceConnector.name,
+    SearchSourceConnector.connector_type,
+    SearchSourceConnector.config,
+    SearchSourceConnector.search_space_id,
+    SearchSourceConnector.user_id,
+    SearchSourceConnector.created_at,
+    SearchSourceConnector.updated_at,
+)
+
+# Built once at import and executed with the search space id bound; the
+# filter is served by the (search_space_id, connector_type) index
+_SELECT_MCP_CONNECTORS_BY_SPACE = select(*_MCP_CONNECTOR_READ_COLUMNS).where(
+    SearchSourceConnector.connector_type == SearchSourceConnectorType.MCP_CONNECTOR,
+    SearchSourceConnector.search_space_id == bindparam("search_space_id"),
+)
+
+# Same filter, aggregated: enough to tell whether the list has changed
+# without loading any rows
+_SELECT_MCP_CONNECTORS_VERSION_BY_SPACE = select(
+    func.max(SearchSourceConnector.updated_at), func.count()
+).where(
+    SearchSourceConnector.connector_type == SearchSourceConnectorType.MCP_CONNECTOR,
+    SearchSourceConnector.search_space_id == bindparam("search_space_id"),
+)
+
+
 @router.get("/connectors/mcp", response_model=list[MCPConnectorRead])
 async def list_mcp_connectors(
+    request: Request,
     search_space_id: int = Query(..., description="Search space ID"),
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
@@ -738,6 +830,10 @@ async def list_mcp_connectors(
     """
     List all MCP connectors for a search space.
 
+    The response carries an ETag built from the newest updated_at and the
+    connector count; a matching If-None-Match gets a 304 without the rows
+    being loaded.
+
     Args:
         search_space_id: ID of the search space
         session: Database session
@@ -756,25 +852,33 @@ async def list_mcp_connectors(
             "You don't have permission to view connectors in this search space",
         )
 
-        # Fetch MCP connectors
-        result = await session.execute(
-            select(SearchSourceConnector).filter(
-                SearchSourceConnector.connector_type
-                == SearchSourceConnectorType.MCP_CONNECTOR,
-                SearchSourceConnector.search_space_id == search_space_id,
-            )
+        version_result = await session.execute(
+            _SELECT_MCP_CONNECTORS_VERSION_BY_SPACE,
+            {"search_space_id": search_space_id},
         )
+        latest_update, connector_count = version_result.one()
+        version = int(latest_update.timestamp() * 1_000_000) if latest_update else 0
+        etag = f'W/"{version}-{connector_count}"'
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
 
-        connectors = result.scalars().all()
-        return [
-            MCPConnectorRead.from_connector(SearchSourceConnectorRead.model_validate(c))
-            for c in connectors
-        ]
+        # Fetch MCP connectors as plain rows rather than ORM objects
+        result = await session.execute(
+            _SELECT_MCP_CONNECTORS_BY_SPACE, {"search_space_id": search_space_id}
+        )
 
+        connectors = result.all()
+        # Returned as a response directly: response_model stays for the
+        # OpenAPI schema, but the rows are dumped to dicts without building (or
+        # re-validating) any Pydantic models
+        return ORJSONResponse(
+            [MCPConnectorRead.dump_connector(c) for c in connectors],
+            headers={"ETag": etag},
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to list MCP connectors: {e!s}", exc_info=True)
+        logger.error("Failed to list MCP connectors: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"Failed to list MCP connectors: {e!s}"
         ) from e
@@ -783,12 +887,15 @@ async def list_mcp_connectors(
 @router.get("/connectors/mcp/{connector_id}", response_model=MCPConnectorRead)
 async def get_mcp_connector(
     connector_id: int,
+    request: Request,
     session: AsyncSession = Depends(get_async_session),
     user: User = Depends(current_active_user),
 ):
     """
     Get a specific MCP connector by ID.
 
+    Conditional requests are handled as in read_search_source_connector.
+
     Args:
         connector_id: ID of the connector
         session: Database session
@@ -798,35 +905,30 @@ async def get_mcp_connector(
         MCP connector with tool configurations
     """
     try:
-        # Fetch connector
-        result = await session.execute(
-            select(SearchSourceConnector).filter(
-                SearchSourceConnector.id == connector_id,
-                SearchSourceConnector.connector_type
-                == SearchSourceConnectorType.MCP_CONNECTOR,
-            )
-        )
-        connector = result.scalars().first()
-
-        if not connector:
-            raise HTTPException(status_code=404, detail="MCP connector not found")
-
-        # Check user has permission to read connectors
-        await check_permission(
+        # Get the connector and check permission to read it in one query
+        connector = await get_connector_with_permission(
             session,
             user,
-            connector.search_space_id,
+            connector_id,
             Permission.CONNECTORS_READ.value,
             "You don't have permission to view this connector",
+            connector_type=SearchSourceConnectorType.MCP_CONNECTOR,
+            not_found_message="MCP connector not found",
         )
 
-        connector_read = SearchSourceConnectorRead.model_validate(connector)
-        return MCPConnectorRead.from_connector(connector_read)
+        etag = _connector_etag(connector)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
 
+        # Skip response_model re-validation, as in list_mcp_connectors
+        return ORJSONResponse(
+            MCPConnectorRead.dump_connector(connector),
+            headers={"ETag": etag},
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get MCP connector: {e!s}", exc_info=True)
+        logger.error("Failed to get MCP connector: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"Failed to get MCP connector: {e!s}"
         ) from e
@@ -852,51 +954,45 @@ async def update_mcp_connector(
         Updated MCP connector
     """
     try:
-        # Fetch connector
-        result = await session.execute(
-            select(SearchSourceConnector).filter(
-                SearchSourceConnector.id == connector_id,
-                SearchSourceConnector.connector_type
-                == SearchSourceConnectorType.MCP_CONNECTOR,
-            )
-        )
-        connector = result.scalars().first()
-
-        if not connector:
-            raise HTTPException(status_code=404, detail="MCP connector not found")
-
-        # Check user has permission to update connectors
-        await check_permission(
+        # Get the connector and check permission to update it in one query
+        await get_connector_with_permission(
             session,
             user,
-            connector.search_space_id,
+            connector_id,
             Permission.CONNECTORS_UPDATE.value,
             "You don't have permission to update this connector",
+            connector_type=SearchSourceConnectorType.MCP_CONNECTOR,
+            not_found_message="MCP connector not found",
         )
 
-        # Update fields
+        # Update fields, stamping updated_at with the database clock
+        values: dict[str, Any] = {"updated_at": func.now()}
         if connector_update.name is not None:
-            connector.name = connector_update.name
+            values["name"] = connector_update.name
 
         if connector_update.server_config is not None:
-            connector.config = {
+            values["config"] = {
                 "server_config": connector_update.server_config.model_dump()
             }
 
-        connector.updated_at = datetime.now(UTC)
-
+        # RETURNING hands back the updated columns, so no refresh() is needed
+        result = await session.execute(
+            update(SearchSourceConnector)
+            .where(SearchSourceConnector.id == connector_id)
+            .values(**values)
+            .returning(*_MCP_CONNECTOR_READ_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        updated_row = result.one()
         await session.commit()
-        await session.refresh(connector)
 
         logger.info(f"Updated MCP connector {connector_id}")
 
-        connector_read = SearchSourceConnectorRead.model_validate(connector)
-        return MCPConnectorRead.from_connector(connector_read)
-
+        return MCPConnectorRead.from_connector(updated_row)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update MCP connector: {e!s}", exc_info=True)
+        logger.error("Failed to update MCP connector: %s", e, exc_info=True)
         await session.rollback()
         raise HTTPException(
             status_code=500, detail=f"Failed to update MCP connector: {e!s}"
@@ -918,43 +1014,74 @@ async def delete_mcp_connector(
         user: Current authenticated user
     """
     try:
-        # Fetch connector
-        result = await session.execute(
-            select(SearchSourceConnector).filter(
-                SearchSourceConnector.id == connector_id,
-                SearchSourceConnector.connector_type
-                == SearchSourceConnectorType.MCP_CONNECTOR,
-            )
-        )
-        connector = result.scalars().first()
-
-        if not connector:
-            raise HTTPException(status_code=404, detail="MCP connector not found")
-
-        # Check user has permission to delete connectors
-        await check_permission(
+        # Get the connector and check permission to delete it in one query
+        connector = await get_connector_with_permission(
             session,
             user,
-            connector.search_space_id,
+            connector_id,
             Permission.CONNECTORS_DELETE.value,
             "You don't have permission to delete this connector",
+            connector_type=SearchSourceConnectorType.MCP_CONNECTOR,
+            not_found_message="MCP connector not found",
         )
 
         await session.delete(connector)
         await session.commit()
 
         logger.info(f"Deleted MCP connector {connector_id}")
-
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete MCP connector: {e!s}", exc_info=True)
+        logger.error("Failed to delete MCP connector: %s", e, exc_info=True)
         await session.rollback()
         raise HTTPException(
             status_code=500, detail=f"Failed to delete MCP connector: {e!s}"
         ) from e
 
 
+async def _test_mcp_http_server(
+    server_config: dict[str, Any], transport: str
+) -> dict[str, Any]:
+    """Test an MCP server reached over HTTP (streamable-http, http, sse)."""
+    from app.agents.new_chat.tools.mcp_client import test_mcp_http_connection
+
+    url = server_config.get("url")
+    headers = server_config.get("headers", {})
+
+    if not url:
+        raise HTTPException(
+            status_code=400, detail="Server URL is required for HTTP transport"
+        )
+
+    return await test_mcp_http_connection(url, headers, transport)
+
+
+async def _test_mcp_stdio_server(
+    server_config: dict[str, Any], transport: str
+) -> dict[str, Any]:
+    """Test an MCP server run as a local process over stdio."""
+    from app.agents.new_chat.tools.mcp_client import test_mcp_connection
+
+    command = server_config.get("command")
+    args = server_config.get("args", [])
+    env = server_config.get("env", {})
+
+    if not command:
+        raise HTTPException(
+            status_code=400, detail="Server command is required for stdio transport"
+        )
+
+    return await test_mcp_connection(command, args, env)
+
+
+_MCP_TEST_BY_TRANSPORT = {
+    "streamable-http": _test_mcp_http_server,
+    "http": _test_mcp_http_server,
+    "sse": _test_mcp_http_server,
+    "stdio": _test_mcp_stdio_server,
+}
+
+
 @router.post("/connectors/mcp/test")
 async def test_mcp_server_connection(
     server_config: dict = Body(...),
@@ -978,45 +1105,16 @@ async def test_mcp_server_connection(
         Connection status and list of available tools
     """
     try:
-        from app.agents.new_chat.tools.mcp_client import (
-            test_mcp_connection,
-            test_mcp_http_connection,
-        )
-
         transport = server_config.get("transport", "stdio")
-
-        # HTTP transport (streamable-http, http, sse)
-        if transport in ("streamable-http", "http", "sse"):
-            url = server_config.get("url")
-            headers = server_config.get("headers", {})
-
-            if not url:
-                raise HTTPException(
-                    status_code=400, detail="Server URL is required for HTTP transport"
-                )
-
-            result = await test_mcp_http_connection(url, headers, transport)
-            return result
-
-        # stdio transport (default)
-        command = server_config.get("command")
-        args = server_config.get("args", [])
-        env = server_config.get("env", {})
-
-        if not command:
-            raise HTTPException(
-                status_code=400, detail="Server command is required for stdio transport"
-            )
-
-        # Test the connection
-        result = await test_mcp_connection(command, args, env)
-
-        return result
+        # Unknown transports fall back to stdio, the default. The helpers import
+        # the MCP client lazily, so a broken install is reported below too
+        test_connection = _MCP_TEST_BY_TRANSPORT.get(transport, _test_mcp_stdio_server)
+        return await test_connection(server_config, transport)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to test MCP connection: {e!s}", exc_info=True)
+        logger.error("Failed to test MCP connection: %s", e, exc_info=True)
         return {
             "status": "error",
             "message": f"Failed to test connection: {e!s}",
@@ -1,6 +1,7 @@
 from .base import IDModel, TimestampModel
 from .chunks import ChunkBase, ChunkCreate, ChunkRead, ChunkUpdate
 from .documents import (
+    CursorPaginatedResponse,
     DocumentBase,
     DocumentRead,
     DocumentsCreate,
@@ -81,6 +82,7 @@ __all__ = [
     "ChunkCreate",
     "ChunkRead",
     "ChunkUpdate",
+    "CursorPaginatedResponse",
     "DefaultSystemInstructionsResponse",
     # Document schemas
     "DocumentBase",
@@ -69,6 +69,17 @@ class PaginatedResponse[T](BaseModel):
     has_more: bool
 
 
+class CursorPaginatedResponse[T](BaseModel):
+    """Keyset-paginated page; pass ``next_cursor`` back to fetch the next one."""
+
+    items: list[T]
+    page_size: int
+    has_more: bool
+    next_cursor: str | None = None
+    # Only populated when the caller explicitly asks for it (costs a COUNT)
+    total: int | None = None
+
+
 class DocumentTitleRead(BaseModel):
     """Lightweight document response for mention picker - only essential fields."""
 
@@ -29,6 +29,18 @@ class FinanceGPTDocsDocumentRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class FinanceGPTDocsDocumentListItem(BaseModel):
+    """Schema for a FinanceGPT docs document in list views (without content)."""
+
+    id: int
+    title: str
+    source: str
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class FinanceGPTDocsDocumentWithChunksRead(BaseModel):
     """Schema for a FinanceGPT docs document with its chunks."""
 
@@ -3,8 +3,9 @@ from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from sqlalchemy import Row
 
-from app.db import SearchSourceConnectorType
+from app.db import SearchSourceConnector, SearchSourceConnectorType
 from app.utils.validators import validate_connector_config
 
 from .base import IDModel, TimestampModel
@@ -135,13 +136,23 @@ class MCPConnectorRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     @classmethod
-    def from_connector(cls, connector: SearchSourceConnectorRead) -> "MCPConnectorRead":
-        """Convert from base SearchSourceConnectorRead."""
+    def from_connector(
+        cls, connector: SearchSourceConnector | SearchSourceConnectorRead | Row
+    ) -> "MCPConnectorRead":
+        """Convert from a connector row or base SearchSourceConnectorRead.
+
+        ORM rows (or result rows selecting the same named columns) can be
+        passed directly, which skips re-validating the stored config through
+        SearchSourceConnectorRead. The values come from typed
+        columns and a server_config that was validated when it was written,
+        so the models are built with model_construct() rather than validated
+        field by field again.
+        """
         config = connector.config or {}
         server_config_data = config.get("server_config", {})
-        server_config = MCPServerConfig(**server_config_data)
+        server_config = MCPServerConfig.model_construct(**server_config_data)
 
-        return cls(
+        return cls.model_construct(
             id=connector.id,
             name=connector.name,
             connector_type=connector.connector_type,
@@ -151,3 +162,37 @@ class MCPConnectorRead(BaseModel):
             created_at=connector.created_at,
             updated_at=connector.updated_at,
         )
+
+    @staticmethod
+    def dump_connector(
+        connector: SearchSourceConnector | SearchSourceConnectorRead | Row,
+    ) -> dict[str, Any]:
+        """The model_dump() of from_connector(connector), without the models.
+
+        For read paths that serialize straight to JSON: the dict is built
+        directly (server_config defaults filled in, unknown keys dropped)
+        and orjson handles the datetime, UUID and enum values itself.
+        """
+        config = connector.config or {}
+        server_config_data = config.get("server_config", {})
+        server_config = {
+            "command": None,
+            "args": [],
+            "env": {},
+            "url": None,
+            "headers": {},
+            "transport": "stdio",
+        }
+        for key in server_config.keys() & server_config_data.keys():
+            server_config[key] = server_config_data[key]
+
+        return {
+            "id": connector.id,
+            "name": connector.name,
+            "connector_type": connector.connector_type,
+            "server_config": server_config,
+            "search_space_id": connector.search_space_id,
+            "user_id": connector.user_id,
+            "created_at": connector.created_at,
+            "updated_at": connector.updated_at,
+        }
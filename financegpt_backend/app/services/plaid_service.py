@@ -4,8 +4,15 @@ Plaid service for bank account integration.
 Handles OAuth flow, transaction fetching, and account management for all bank connectors.
 """
 
+import asyncio
+import json
 import logging
+import random
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 import plaid
@@ -23,43 +30,227 @@ from plaid.model.transactions_get_request import TransactionsGetRequest
 from plaid.model.transactions_get_request_options import (
     TransactionsGetRequestOptions,
 )
+from plaid.model.transactions_sync_request import TransactionsSyncRequest
 from plaid.model.investments_holdings_get_request import (
     InvestmentsHoldingsGetRequest,
 )
 from plaid.model.investments_transactions_get_request import (
     InvestmentsTransactionsGetRequest,
 )
+from plaid.model.investments_transactions_get_request_options import (
+    InvestmentsTransactionsGetRequestOptions,
+)
 
 from app.config import config
+from app.utils.oauth_security import AESGCMTokenEncryption
 
 logger = logging.getLogger(__name__)
 
+# Largest page /transactions/get and /investments/transactions/get allow
+PLAID_TRANSACTIONS_PAGE_SIZE = 500
+
+# Transaction pages requested from Plaid at once for a single call
+PLAID_MAX_CONCURRENT_PAGE_REQUESTS = 8
+
+# Threads making Plaid calls at once, and the HTTP connections kept to Plaid
+# for them, so every worker thread can hold a keep-alive connection
+PLAID_MAX_CONCURRENT_CALLS = 16
+
+# Attempts per Plaid call when Plaid rate limits us or has a server error,
+# and the bounds of the exponential backoff between them
+PLAID_MAX_CALL_ATTEMPTS = 5
+PLAID_RETRY_BASE_DELAY_SECONDS = 0.5
+PLAID_RETRY_MAX_DELAY_SECONDS = 16.0
+
+# The Plaid SDK is synchronous; its calls run on this pool so a 100-500ms
+# round trip doesn't block the event loop
+_plaid_executor = ThreadPoolExecutor(
+    max_workers=PLAID_MAX_CONCURRENT_CALLS, thread_name_prefix="plaid"
+)
+
+# Transaction fields copied out of each Plaid transaction: the required ones
+# in a single itemgetter call, the optional ones defaulting to None
+_TRANSACTION_REQUIRED_FIELDS = (
+    "transaction_id",
+    "account_id",
+    "date",
+    "amount",
+    "name",
+    "pending",
+)
+_get_transaction_required_fields = itemgetter(*_TRANSACTION_REQUIRED_FIELDS)
+_TRANSACTION_OPTIONAL_FIELDS = (
+    "authorized_date",
+    "merchant_name",
+    "category_id",
+    "payment_channel",
+    "iso_currency_code",
+)
+
+
+def _project_transaction(txn: Any) -> dict[str, Any]:
+    """Copy the fields FinanceGPT uses out of a Plaid transaction."""
+    projected = dict(
+        zip(_TRANSACTION_REQUIRED_FIELDS, _get_transaction_required_fields(txn))
+    )
+    get = txn.get
+    for key in _TRANSACTION_OPTIONAL_FIELDS:
+        projected[key] = get(key)
+    projected["category"] = get("category", [])
+    projected["location"] = get("location", {})
+    return projected
+
+
+# Plaid error codes meaning the item simply has no (ready) investment data
+_INVESTMENTS_UNAVAILABLE_ERROR_CODES = frozenset(
+    {"ADDITIONAL_CONSENT_REQUIRED", "PRODUCT_NOT_READY", "PRODUCTS_NOT_SUPPORTED"}
+)
+
+
+def _plaid_error_code(error: ApiException) -> str | None:
+    """The error_code from a Plaid API error's JSON body, if there is one."""
+    try:
+        return json.loads(error.body).get("error_code")
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _is_retryable(error: ApiException) -> bool:
+    """Whether a failed Plaid call is worth retrying (rate limit or 5xx)."""
+    status = error.status or 0
+    return (
+        status == 429
+        or status >= 500
+        or _plaid_error_code(error) == "RATE_LIMIT_EXCEEDED"
+    )
+
+
+def _make_projector(
+    required: tuple[str, ...], optional: tuple[str, ...]
+) -> Callable[[Any], dict[str, Any]]:
+    """
+    Build a function copying fields out of a Plaid record, as
+    _project_transaction does: the required ones in a single itemgetter call,
+    the optional ones defaulting to None.
+    """
+    # itemgetter returns a bare value rather than a tuple for a single key
+    get_required = itemgetter(*required, *required[:1])
+
+    def project(record: Any) -> dict[str, Any]:
+        projected = dict(zip(required, get_required(record)))
+        get = record.get
+        for key in optional:
+            projected[key] = get(key)
+        return projected
+
+    return project
+
+
+_project_holding = _make_projector(
+    (
+        "account_id",
+        "security_id",
+        "quantity",
+        "institution_price",
+        "institution_value",
+    ),
+    ("cost_basis", "iso_currency_code"),
+)
+_project_security = _make_projector(
+    ("security_id",),
+    (
+        "name",
+        "ticker_symbol",
+        "type",
+        "close_price",
+        "close_price_as_of",
+        "isin",
+        "cusip",
+    ),
+)
+_project_investment_transaction = _make_projector(
+    (
+        "investment_transaction_id",
+        "account_id",
+        "date",
+        "name",
+        "amount",
+        "quantity",
+        "price",
+        "type",  # buy, sell, dividend, etc.
+    ),
+    ("security_id", "subtype", "iso_currency_code"),
+)
+
+
+@lru_cache(maxsize=1)
+def _get_plaid_client() -> plaid_api.PlaidApi:
+    """
+    Build the process-wide Plaid API client.
+
+    Its ApiClient owns a urllib3 pool, so sharing one client keeps HTTP
+    keep-alive connections to Plaid across every PlaidService.
+    """
+    from plaid.api_client import ApiClient
+
+    env_map = {
+        "sandbox": plaid.Environment.Sandbox,
+        "development": plaid.Environment.Sandbox,  # Development uses Sandbox
+        "production": plaid.Environment.Production,
+    }
+    configuration = plaid.Configuration(
+        host=env_map.get(config.PLAID_ENV.lower(), plaid.Environment.Sandbox),
+        api_key={
+            "clientId": config.PLAID_CLIENT_ID,
+            "secret": config.PLAID_SECRET,
+        },
+    )
+    # The default urllib3 pool size is tied to the CPU count; size it to the
+    # executor instead so no thread has to open (and then drop) an extra
+    # TLS connection
+    configuration.connection_pool_maxsize = PLAID_MAX_CONCURRENT_CALLS
+    return plaid_api.PlaidApi(ApiClient(configuration))
+
 
 class PlaidService:
     """Service for interacting with Plaid API."""
 
     def __init__(self):
         """Initialize Plaid client."""
-        from plaid.api_client import ApiClient
-
-        configuration = plaid.Configuration(
-            host=self._get_plaid_environment(),
-            api_key={
-                "clientId": config.PLAID_CLIENT_ID,
-                "secret": config.PLAID_SECRET,
-            },
-        )
-        api_client = ApiClient(configuration)
-        self.client = plaid_api.PlaidApi(api_client)
-
-    def _get_plaid_environment(self) -> str:
-        """Get Plaid environment URL based on config."""
-        env_map = {
-            "sandbox": plaid.Environment.Sandbox,
-            "development": plaid.Environment.Sandbox,  # Development uses Sandbox
-            "production": plaid.Environment.Production,
-        }
-        return env_map.get(config.PLAID_ENV.lower(), plaid.Environment.Sandbox)
+        self.client = _get_plaid_client()
+
+    async def _call(self, method: Callable[[Any], Any], request: Any) -> Any:
+        """
+        Run a blocking Plaid SDK method on the Plaid thread pool.
+
+        The pool's size bounds how many Plaid calls the process makes at once.
+        Rate limiting and server errors are retried with exponential backoff
+        and full jitter; other errors are raised straight away.
+        """
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await loop.run_in_executor(_plaid_executor, method, request)
+            except ApiException as e:
+                if attempt == PLAID_MAX_CALL_ATTEMPTS or not _is_retryable(e):
+                    raise
+                delay = random.uniform(
+                    0,
+                    min(
+                        PLAID_RETRY_MAX_DELAY_SECONDS,
+                        PLAID_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1),
+                    ),
+                )
+                logger.warning(
+                    "Plaid call failed (%s), retrying in %.1fs (attempt %d/%d)",
+                    e.status,
+                    delay,
+                    attempt,
+                    PLAID_MAX_CALL_ATTEMPTS,
+                )
+                await asyncio.sleep(delay)
 
     async def create_link_token(
         self, user_id: str, institution_id: str | None = None
@@ -86,7 +277,7 @@ class PlaidService:
             if institution_id:
                 request.institution_id = institution_id
 
-            response = self.client.link_token_create(request)
+            response = await self._call(self.client.link_token_create, request)
             return response.to_dict()
 
         except ApiException as e:
@@ -118,7 +309,7 @@ class PlaidService:
                 access_token=access_token,  # This enables update mode
             )
 
-            response = self.client.link_token_create(request)
+            response = await self._call(self.client.link_token_create, request)
             return response.to_dict()
 
         except ApiException as e:
@@ -137,7 +328,7 @@ class PlaidService:
         """
         try:
             request = ItemPublicTokenExchangeRequest(public_token=public_token)
-            response = self.client.item_public_token_exchange(request)
+            response = await self._call(self.client.item_public_token_exchange, request)
 
             return {
                 "access_token": response["access_token"],
@@ -160,7 +351,7 @@ class PlaidService:
         """
         try:
             request = AccountsGetRequest(access_token=access_token)
-            response = self.client.accounts_get(request)
+            response = await self._call(self.client.accounts_get, request)
 
             accounts = []
             for account in response["accounts"]:
@@ -196,6 +387,9 @@ class PlaidService:
         """
         Get transactions for an account within date range.
 
+        Collects every page from iter_transaction_pages(); callers that can
+        work page by page should iterate that instead.
+
         Args:
             access_token: Plaid access token
             start_date: Start date for transactions
@@ -205,72 +399,183 @@ class PlaidService:
         Returns:
             List of transaction dictionaries
         """
-        try:
-            options = TransactionsGetRequestOptions()
+        return [
+            txn
+            async for page in self.iter_transaction_pages(
+                access_token, start_date, end_date, account_ids
+            )
+            for txn in page
+        ]
+
+    async def iter_transaction_pages(
+        self,
+        access_token: str,
+        start_date: datetime,
+        end_date: datetime,
+        account_ids: list[str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Yield transactions for an account within date range, one page at a time.
+
+        Every page is fetched: after the first, the remaining pages are
+        requested concurrently and yielded in Plaid's order as they arrive,
+        so only the pages not yet consumed are held in memory.
+
+        Args:
+            access_token: Plaid access token
+            start_date: Start date for transactions
+            end_date: End date for transactions
+            account_ids: Optional list of specific account IDs to fetch
+
+        Yields:
+            Lists of transaction dictionaries
+        """
+        def build_request(offset: int) -> TransactionsGetRequest:
+            options = TransactionsGetRequestOptions(
+                count=PLAID_TRANSACTIONS_PAGE_SIZE, offset=offset
+            )
             if account_ids:
                 options.account_ids = account_ids
-
-            request = TransactionsGetRequest(
+            return TransactionsGetRequest(
                 access_token=access_token,
                 start_date=start_date.date(),
                 end_date=end_date.date(),
                 options=options,
             )
 
-            response = self.client.transactions_get(request)
-
-            transactions = []
-            for txn in response["transactions"]:
-                transactions.append(
-                    {
-                        "transaction_id": txn["transaction_id"],
-                        "account_id": txn["account_id"],
-                        "date": txn["date"],
-                        "authorized_date": txn.get("authorized_date"),
-                        "amount": txn["amount"],
-                        "name": txn["name"],
-                        "merchant_name": txn.get("merchant_name"),
-                        "category": txn.get("category", []),
-                        "category_id": txn.get("category_id"),
-                        "pending": txn["pending"],
-                        "payment_channel": txn.get("payment_channel"),
-                        "location": txn.get("location", {}),
-                        "iso_currency_code": txn.get("iso_currency_code"),
-                    }
-                )
-
-            # Handle pagination if there are more transactions
+        page_tasks: list[asyncio.Task] = []
+        try:
+            response = await self._call(self.client.transactions_get, build_request(0))
+            first_page = response["transactions"]
             total_transactions = response["total_transactions"]
-            if total_transactions > len(transactions):
+
+            # Request any remaining pages concurrently, bounded so a large
+            # history doesn't trip Plaid's rate limits
+            if first_page and total_transactions > len(first_page):
                 logger.info(
                     "Paginating to get all %d transactions", total_transactions
                 )
-                # Plaid may require multiple calls for large datasets
-                # For now, we return what we got - implement pagination if needed
-
-            return transactions
+                semaphore = asyncio.Semaphore(PLAID_MAX_CONCURRENT_PAGE_REQUESTS)
+
+                async def fetch_page(offset: int) -> list[Any]:
+                    async with semaphore:
+                        page = await self._call(
+                            self.client.transactions_get, build_request(offset)
+                        )
+                    return page["transactions"]
+
+                page_tasks = [
+                    asyncio.create_task(fetch_page(offset))
+                    for offset in range(
+                        len(first_page),
+                        total_transactions,
+                        PLAID_TRANSACTIONS_PAGE_SIZE,
+                    )
+                ]
+
+            yield [_project_transaction(txn) for txn in first_page]
+            # Let the raw first page go before waiting on the rest
+            del response, first_page
+
+            for task in page_tasks:
+                yield [_project_transaction(txn) for txn in await task]
 
         except ApiException as e:
             logger.error("Error getting transactions: %s", e)
             raise
+        finally:
+            # The consumer may stop early or a page may fail: don't leave
+            # the remaining requests running
+            for task in page_tasks:
+                task.cancel()
+
+    async def sync_transactions(
+        self, access_token: str, cursor: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Get the transaction changes since a /transactions/sync cursor.
+
+        Pages through /transactions/sync until Plaid reports no more changes.
+
+        Args:
+            access_token: Plaid access token
+            cursor: Cursor from a previous sync. None starts from the beginning
+                of the Item's history; "now" skips it and only returns a cursor
+
+        Returns:
+            Dictionary with the added and modified transactions (in the same
+            shape as get_transactions()), the removed transaction IDs, and
+            next_cursor for the following sync
+        """
+        added: list[dict[str, Any]] = []
+        modified: list[dict[str, Any]] = []
+        removed: list[str] = []
+        try:
+            while True:
+                request = TransactionsSyncRequest(
+                    access_token=access_token, count=PLAID_TRANSACTIONS_PAGE_SIZE
+                )
+                if cursor:
+                    request.cursor = cursor
+                response = await self._call(self.client.transactions_sync, request)
+
+                added.extend(_project_transaction(txn) for txn in response["added"])
+                modified.extend(
+                    _project_transaction(txn) for txn in response["modified"]
+                )
+                removed.extend(txn["transaction_id"] for txn in response["removed"])
+                cursor = response["next_cursor"]
+                if not response["has_more"]:
+                    break
+
+        except ApiException as e:
+            logger.error("Error syncing transactions: %s", e)
+            raise
+
+        return {
+            "added": added,
+            "modified": modified,
+            "removed": removed,
+            "next_cursor": cursor,
+        }
 
     async def sync_recent_transactions(
-        self, access_token: str, days_back: int = 30
+        self, access_token: str | Sequence[str], days_back: int = 30
     ) -> list[dict[str, Any]]:
         """
         Sync recent transactions (default last 30 days).
 
+        Several access tokens (one per linked institution) are synced
+        concurrently, so the wait is the slowest institution rather than the
+        sum of all of them. An institution that fails is logged and skipped.
+
         Args:
-            access_token: Plaid access token
+            access_token: Plaid access token, or a sequence of them
             days_back: Number of days to look back
 
         Returns:
-            List of recent transactions
+            List of recent transactions across all the given tokens
         """
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
 
-        return await self.get_transactions(access_token, start_date, end_date)
+        if isinstance(access_token, str):
+            return await self.get_transactions(access_token, start_date, end_date)
+
+        results = await asyncio.gather(
+            *(
+                self.get_transactions(token, start_date, end_date)
+                for token in access_token
+            ),
+            return_exceptions=True,
+        )
+        transactions: list[dict[str, Any]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Error syncing recent transactions: %s", result)
+                continue
+            transactions.extend(result)
+        return transactions
 
     async def get_investment_holdings(
         self, access_token: str
@@ -286,7 +591,7 @@ class PlaidService:
         """
         try:
             request = InvestmentsHoldingsGetRequest(access_token=access_token)
-            response = self.client.investments_holdings_get(request)
+            response = await self._call(self.client.investments_holdings_get, request)
 
             # Parse response
             holdings_data = {
@@ -314,39 +619,21 @@ class PlaidService:
                 )
 
             # Extract holdings (positions)
-            for holding in response.get("holdings", []):
-                holdings_data["holdings"].append(
-                    {
-                        "account_id": holding["account_id"],
-                        "security_id": holding["security_id"],
-                        "quantity": holding["quantity"],
-                        "institution_price": holding["institution_price"],
-                        "institution_value": holding["institution_value"],
-                        "cost_basis": holding.get("cost_basis"),
-                        "iso_currency_code": holding.get("iso_currency_code"),
-                    }
-                )
+            holdings_data["holdings"] = [
+                _project_holding(holding) for holding in response.get("holdings", [])
+            ]
 
             # Extract securities (stock/fund details)
-            for security in response.get("securities", []):
-                holdings_data["securities"].append(
-                    {
-                        "security_id": security["security_id"],
-                        "name": security.get("name"),
-                        "ticker_symbol": security.get("ticker_symbol"),
-                        "type": security.get("type"),
-                        "close_price": security.get("close_price"),
-                        "close_price_as_of": security.get("close_price_as_of"),
-                        "isin": security.get("isin"),
-                        "cusip": security.get("cusip"),
-                    }
-                )
+            holdings_data["securities"] = [
+                _project_security(security)
+                for security in response.get("securities", [])
+            ]
 
             return holdings_data
 
         except ApiException as e:
             # Check if it's a consent/permission issue (common for non-investment accounts)
-            error_code = getattr(e, 'error_code', None) if hasattr(e, 'error_code') else None
+            error_code = _plaid_error_code(e)
             if error_code == 'ADDITIONAL_CONSENT_REQUIRED':
                 logger.info(
                     "Investment holdings not available - account doesn't have investment product access (this is normal for checking/savings accounts)"
@@ -361,47 +648,133 @@ class PlaidService:
         access_token: str,
         start_date: datetime,
         end_date: datetime,
+        account_ids: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get investment transactions (buys, sells, dividends, etc.).
 
+        Items without (ready) investment data give an empty list, as do other
+        Plaid errors, which are logged as warnings.
+
         Args:
             access_token: Plaid access token
             start_date: Start date
             end_date: End date
+            account_ids: Optional list of specific account IDs to fetch
 
         Returns:
             List of investment transaction dictionaries
         """
-        try:
-            request = InvestmentsTransactionsGetRequest(
+        def build_request(offset: int) -> InvestmentsTransactionsGetRequest:
+            options = InvestmentsTransactionsGetRequestOptions(
+                count=PLAID_TRANSACTIONS_PAGE_SIZE, offset=offset
+            )
+            if account_ids:
+                options.account_ids = account_ids
+            return InvestmentsTransactionsGetRequest(
                 access_token=access_token,
                 start_date=start_date.date(),
                 end_date=end_date.date(),
+                options=options,
             )
 
-            response = self.client.investments_transactions_get(request)
+        try:
+            response = await self._call(
+                self.client.investments_transactions_get, build_request(0)
+            )
+            raw_transactions = list(response.get("investment_transactions", []))
+            total_transactions = response.get(
+                "total_investment_transactions", len(raw_transactions)
+            )
 
-            transactions = []
-            for txn in response.get("investment_transactions", []):
-                transactions.append(
-                    {
-                        "investment_transaction_id": txn["investment_transaction_id"],
-                        "account_id": txn["account_id"],
-                        "security_id": txn.get("security_id"),
-                        "date": txn["date"],
-                        "name": txn["name"],
-                        "amount": txn["amount"],
-                        "quantity": txn["quantity"],
-                        "price": txn["price"],
-                        "type": txn["type"],  # buy, sell, dividend, etc.
-                        "subtype": txn.get("subtype"),
-                        "iso_currency_code": txn.get("iso_currency_code"),
-                    }
+            # Fetch any remaining pages concurrently, bounded as in
+            # iter_transaction_pages()
+            if raw_transactions and total_transactions > len(raw_transactions):
+                semaphore = asyncio.Semaphore(PLAID_MAX_CONCURRENT_PAGE_REQUESTS)
+
+                async def fetch_page(offset: int) -> list[Any]:
+                    async with semaphore:
+                        page = await self._call(
+                            self.client.investments_transactions_get,
+                            build_request(offset),
+                        )
+                    return page.get("investment_transactions", [])
+
+                pages = await asyncio.gather(
+                    *(
+                        fetch_page(offset)
+                        for offset in range(
+                            len(raw_transactions),
+                            total_transactions,
+                            PLAID_TRANSACTIONS_PAGE_SIZE,
+                        )
+                    )
                 )
+                for page in pages:
+                    raw_transactions.extend(page)
+
+            transactions = [
+                _project_investment_transaction(txn) for txn in raw_transactions
+            ]
 
             return transactions
 
         except ApiException as e:
-            logger.error("Error getting investment transactions: %s", e)
+            if _plaid_error_code(e) in _INVESTMENTS_UNAVAILABLE_ERROR_CODES:
+                logger.info(
+                    "Investment transactions not available for this item: %s",
+                    _plaid_error_code(e),
+                )
+                return []
+            logger.warning("Error getting investment transactions: %s", e)
             return []
+
+
+@lru_cache(maxsize=1)
+def _get_access_token_encryption() -> AESGCMTokenEncryption:
+    """Cipher for Plaid access tokens at rest, built once per process."""
+    return AESGCMTokenEncryption(config.SECRET_KEY)
+
+
+def build_plaid_connector_config(
+    access_token: str, item_id: str, accounts: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Build a Plaid connector's config, encrypting the access token.
+
+    The token is bound to its item_id, so it can't be moved into another
+    connector's config. Without a SECRET_KEY it is stored as-is.
+    """
+    connector_config: dict[str, Any] = {
+        "access_token": access_token,
+        "item_id": item_id,
+        "accounts": accounts,
+    }
+    if config.SECRET_KEY:
+        connector_config["access_token"] = (
+            _get_access_token_encryption().encrypt_token(access_token, item_id.encode())
+        )
+        connector_config["_token_encrypted"] = True
+    return connector_config
+
+
+def get_access_token(connector_config: dict[str, Any]) -> str | None:
+    """Plaintext Plaid access token from a connector config, if it has one."""
+    access_token = connector_config.get("access_token")
+    if access_token and connector_config.get("_token_encrypted"):
+        item_id = connector_config.get("item_id", "")
+        return _get_access_token_encryption().decrypt_token(
+            access_token, item_id.encode()
+        )
+    return access_token
+
+
+@lru_cache(maxsize=1)
+def get_plaid_service() -> PlaidService:
+    """
+    Get the process-wide PlaidService.
+
+    Every PlaidService shares the client from _get_plaid_client(); this just
+    avoids constructing a new service object per call.
+    """
+    return PlaidService()
@@ -1,6 +1,10 @@
 """Celery tasks for connector indexing."""
 
+import asyncio
 import logging
+from collections.abc import Coroutine
+from functools import lru_cache
+from typing import Any, TypeVar
 
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
@@ -10,36 +14,60 @@ from app.config import config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
+# Event loop shared by every task this worker process runs. Prefork and solo
+# workers run one task at a time per process, so tasks never overlap on it.
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _run_in_worker_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on this worker process's event loop.
+
+    The loop is created on first use (after the worker has forked) and kept
+    for later tasks, instead of setting up and tearing down a loop per task.
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
+@lru_cache(maxsize=1)
 def get_celery_session_maker():
     """
-    Create a new async session maker for Celery tasks.
-    This is necessary because Celery tasks run in a new event loop,
-    and the default session maker is bound to the main app's event loop.
+    Get the async session maker for Celery tasks in this worker process.
+
+    The main app's session maker is bound to the main app's event loop, so
+    Celery tasks get their own engine. It is built once per worker process
+    (on first use, after the fork) and keeps a small connection pool: every
+    task runs on the same _run_in_worker_loop() loop, so pooled connections
+    stay valid from one task to the next.
     """
-    engine = create_async_engine(
-        config.DATABASE_URL,
-        poolclass=NullPool,  # Don't use connection pooling for Celery tasks
-        echo=False,
-    )
+    if config.DB_USE_PGBOUNCER:
+        from app.db import PGBOUNCER_CONNECT_ARGS
+
+        # PgBouncer does the pooling; connect the way the API engine does
+        engine_options: dict[str, Any] = {
+            "poolclass": NullPool,
+            "connect_args": PGBOUNCER_CONNECT_ARGS,
+        }
+    else:
+        engine_options = {"pool_size": 5, "max_overflow": 10, "pool_pre_ping": True}
+    engine = create_async_engine(config.DATABASE_URL, echo=False, **engine_options)
     return async_sessionmaker(engine, expire_on_commit=False)
 
 
-@celery_app.task(name="index_plaid_transactions", bind=True)
+# Nothing reads these results, so skip the result backend write per run
+@celery_app.task(name="index_plaid_transactions", bind=True, ignore_result=True)
 def index_plaid_transactions_task(
     self,
     connector_id: int,
 ):
     """Celery task to index Plaid bank transactions."""
-    import asyncio
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    try:
-        loop.run_until_complete(_index_plaid_transactions(connector_id))
-    finally:
-        loop.close()
+    _run_in_worker_loop(_index_plaid_transactions(connector_id))
 
 
 async def _index_plaid_transactions(
@@ -92,7 +120,8 @@ async def _index_plaid_transactions(
                 days_back=90,  # Fetch last 90 days
             )
 
-            # Update last indexed timestamp
+            # Update last indexed timestamp; this single commit also writes
+            # every document the indexer added
             from datetime import UTC, datetime
 
             connector.last_indexed_at = datetime.now(UTC)
@@ -1,18 +1,39 @@
 """Meta-scheduler task for FinanceGPT - checks for Plaid connectors needing periodic sync."""
 
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
 
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.future import select
 from sqlalchemy.pool import NullPool
 
 from app.celery_app import celery_app
 from app.config import config
-from app.db import SearchSourceConnector, SearchSourceConnectorType
+from app.db import SearchSourceConnector
+from app.utils.periodic_scheduler import PERIODIC_DUE_KEY, PLAID_CONNECTOR_TYPES
 
 logger = logging.getLogger(__name__)
 
+# Held while a checker dispatches; expires on its own if the worker dies
+DISPATCH_LOCK_KEY = "periodic:dispatch-lock"
+DISPATCH_LOCK_TTL_MS = 55_000
+
+# Deletes the lock only while it still holds this checker's token, so a checker
+# that outlived its TTL can't release a lock another checker has since taken
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Present while the due set is considered in sync with the database
+DUE_SET_REBUILT_KEY = "periodic:due-rebuilt"
+DUE_SET_REBUILD_SECONDS = 3600
+
 
 def get_celery_session_maker():
     """Create async session maker for Celery tasks."""
@@ -43,20 +64,93 @@ def check_periodic_schedules_task():
 
 
 async def _check_and_trigger_schedules():
+    """Check for due Plaid connectors and trigger their tasks, one checker at a time."""
+    lock_token = uuid4().hex
+    async with Redis.from_url(config.REDIS_URL) as redis:
+        try:
+            # Only one checker dispatches at a time, so overlapping ticks or a
+            # second Beat instance can't trigger the same connectors twice
+            if not await redis.set(
+                DISPATCH_LOCK_KEY, lock_token, nx=True, px=DISPATCH_LOCK_TTL_MS
+            ):
+                logger.debug("Another checker is dispatching periodic syncs")
+                return
+        except RedisError as e:
+            logger.warning(
+                "Redis unavailable, scanning the database for due connectors: %s", e
+            )
+            await _dispatch_due_connectors(None)
+            return
+
+        try:
+            await _dispatch_due_connectors(redis)
+        finally:
+            try:
+                await redis.eval(
+                    _RELEASE_LOCK_SCRIPT, 1, DISPATCH_LOCK_KEY, lock_token
+                )
+            except RedisError:
+                pass  # The lock expires on its own
+
+
+async def _nothing_due(redis: Redis, now: datetime) -> bool:
+    """Whether the due set shows no connector scheduled at or before now."""
+    try:
+        due = await redis.zrangebyscore(
+            PERIODIC_DUE_KEY, "-inf", now.timestamp(), start=0, num=1
+        )
+    except RedisError as e:
+        logger.warning("Could not read the periodic due set: %s", e)
+        return False
+    return not due
+
+
+async def _rebuild_due_set(redis: Redis, session) -> None:
+    """Replace the due set with the schedules stored in the database."""
+    result = await session.execute(
+        select(SearchSourceConnector.id, SearchSourceConnector.next_scheduled_at).filter(
+            SearchSourceConnector.periodic_indexing_enabled == True,  # noqa: E712
+            SearchSourceConnector.next_scheduled_at.is_not(None),
+            SearchSourceConnector.connector_type.in_(PLAID_CONNECTOR_TYPES),
+        )
+    )
+    scores = {
+        str(connector_id): next_scheduled_at.timestamp()
+        for connector_id, next_scheduled_at in result
+    }
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.delete(PERIODIC_DUE_KEY)
+        if scores:
+            pipe.zadd(PERIODIC_DUE_KEY, scores)
+        await pipe.execute()
+
+
+async def _dispatch_due_connectors(redis: Redis | None):
     """Check database for Plaid connectors that need syncing and trigger their tasks."""
+    now = datetime.now(UTC)
     async with get_celery_session_maker()() as session:
         try:
+            if redis is not None:
+                # Rebuilding from the database seeds the set on first run and
+                # repairs any writes the API process failed to make
+                try:
+                    if await redis.set(
+                        DUE_SET_REBUILT_KEY, "1", nx=True, ex=DUE_SET_REBUILD_SECONDS
+                    ):
+                        await _rebuild_due_set(redis, session)
+                except RedisError as e:
+                    logger.warning("Could not rebuild the periodic due set: %s", e)
+
+                if await _nothing_due(redis, now):
+                    logger.debug("No Plaid connectors due for periodic syncing")
+                    return
+
             # Find all Plaid connectors with periodic indexing enabled that are due
-            now = datetime.now(UTC)
             result = await session.execute(
                 select(SearchSourceConnector).filter(
                     SearchSourceConnector.periodic_indexing_enabled == True,  # noqa: E712
                     SearchSourceConnector.next_scheduled_at <= now,
-                    SearchSourceConnector.connector_type.in_([
-                        SearchSourceConnectorType.CHASE_BANK,
-                        SearchSourceConnectorType.FIDELITY_INVESTMENTS,
-                        SearchSourceConnectorType.BANK_OF_AMERICA,
-                    ])
+                    SearchSourceConnector.connector_type.in_(PLAID_CONNECTOR_TYPES),
                 )
             )
             due_connectors = result.scalars().all()
@@ -65,28 +159,49 @@ async def _check_and_trigger_schedules():
                 logger.debug("No Plaid connectors due for periodic syncing")
                 return
 
-            logger.info(f"Found {len(due_connectors)} Plaid connectors due for transaction sync")
+            logger.info(
+                "Found %d Plaid connectors due for transaction sync",
+                len(due_connectors),
+            )
 
             # Import Plaid indexing task
             from app.tasks.celery_tasks.connector_tasks import index_plaid_transactions_task
 
-            # Trigger syncing for each due connector
+            # Advance each schedule and collect the ids to dispatch in one batch
+            ids_to_dispatch = []
             for connector in due_connectors:
                 logger.info(
-                    f"Triggering periodic transaction sync for connector {connector.id} "
-                    f"({connector.connector_type.value})"
+                    "Triggering periodic transaction sync for connector %d (%s)",
+                    connector.id,
+                    connector.connector_type.value,
                 )
-                
-                index_plaid_transactions_task.delay(connector.id)
-
-                # Update next_scheduled_at for next run
-                from datetime import timedelta
-
+                ids_to_dispatch.append(connector.id)
                 connector.next_scheduled_at = now + timedelta(
                     minutes=connector.indexing_frequency_minutes
                 )
-                await session.commit()
+
+            # Publish every message over one pooled producer, without the
+            # group bookkeeping; these runs are fire-and-forget so skip
+            # result backend writes
+            with celery_app.producer_or_acquire() as producer:
+                for connector_id in ids_to_dispatch:
+                    index_plaid_transactions_task.apply_async(
+                        (connector_id,), producer=producer, ignore_result=True
+                    )
+            await session.commit()
+
+            if redis is not None:
+                try:
+                    await redis.zadd(
+                        PERIODIC_DUE_KEY,
+                        {
+                            str(connector.id): connector.next_scheduled_at.timestamp()
+                            for connector in due_connectors
+                        },
+                    )
+                except RedisError as e:
+                    logger.warning("Could not re-score the periodic due set: %s", e)
 
         except Exception as e:
-            logger.error(f"Error checking periodic schedules: {e!s}", exc_info=True)
+            logger.error("Error checking periodic schedules: %s", e, exc_info=True)
             await session.rollback()
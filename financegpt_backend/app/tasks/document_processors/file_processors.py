@@ -10,6 +10,7 @@ import warnings
 from logging import ERROR, getLogger
 
 import httpx
+import orjson
 from fastapi import HTTPException
 from langchain_core.documents import Document as LangChainDocument
 from sqlalchemy.exc import SQLAlchemyError
@@ -983,8 +984,6 @@ async def _process_financial_data(
     log_entry: Log,
 ) -> Document:
     """Process parsed financial data and create document."""
-    import json
-    
     # Build markdown content from financial data
     markdown_parts = []
     metadata = financial_data.get("metadata", {})
@@ -1047,7 +1046,7 @@ async def _process_financial_data(
     markdown_content = "".join(markdown_parts)
     
     # Store raw financial data as JSON metadata
-    raw_financial_json = json.dumps({
+    raw_financial_json = orjson.dumps({
         "transactions": [
             {
                 "date": t.date.isoformat() if hasattr(t, 'date') else str(t.get('date', '')),
@@ -1072,7 +1071,7 @@ async def _process_financial_data(
             for h in holdings
         ],
         "metadata": metadata,
-    }, indent=2)
+    }, option=orjson.OPT_INDENT_2).decode()
     
     # Generate content hash from the markdown content
     content_hash = generate_content_hash(markdown_content, search_space_id)
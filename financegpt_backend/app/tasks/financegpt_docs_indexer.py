@@ -9,6 +9,7 @@ import re
 from datetime import UTC, datetime
 from pathlib import Path
 
+import blake3
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -72,7 +73,17 @@ def get_all_mdx_files() -> list[Path]:
 
 
 def generate_financegpt_docs_content_hash(content: str) -> str:
-    """Generate SHA-256 hash for FinanceGPT docs content."""
+    """
+    Generate a BLAKE3 hash for FinanceGPT docs content.
+
+    This is a change-detection hash, not a security boundary, so it uses the
+    faster BLAKE3 rather than SHA-256.
+    """
+    return blake3.blake3(content.encode("utf-8")).hexdigest()
+
+
+def _legacy_financegpt_docs_content_hash(content: str) -> str:
+    """SHA-256 hash used by earlier releases, kept to migrate stored hashes."""
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
@@ -144,6 +155,16 @@ async def index_financegpt_docs(session: AsyncSession) -> tuple[int, int, int, i
                     skipped += 1
                     continue
 
+                # Unchanged content hashed by an earlier release: switch the
+                # stored hash over without re-embedding the document
+                if existing_doc.content_hash == _legacy_financegpt_docs_content_hash(
+                    raw_content
+                ):
+                    logger.debug(f"Migrating content hash for unchanged: {source}")
+                    existing_doc.content_hash = content_hash
+                    skipped += 1
+                    continue
+
                 # Content changed - update document
                 logger.info(f"Updating changed document: {source}")
 
@@ -4,17 +4,19 @@ Base indexer for Plaid-powered bank connectors.
 All bank-specific connectors (Chase, Fidelity, etc.) inherit from this base class.
 """
 
+import asyncio
 import logging
-from datetime import UTC, datetime, timedelta
+from collections import defaultdict
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import Document, DocumentType, SearchSourceConnector
+from app.db import Chunk, Document, DocumentType, SearchSourceConnector
 from app.parsers.base_financial_parser import BankTransaction, TransactionType
 from app.services.llm_service import get_user_long_context_llm
-from app.services.plaid_service import PlaidService
+from app.services.plaid_service import get_access_token, get_plaid_service
 from app.utils.document_converters import (
     create_document_chunks,
     generate_document_summary,
@@ -30,6 +32,11 @@ def get_current_timestamp() -> datetime:
 logger = logging.getLogger(__name__)
 
 
+def _month_key(txn_date: date) -> str:
+    """YYYY-MM month key for a Plaid transaction date (a datetime.date)."""
+    return f"{txn_date.year:04d}-{txn_date.month:02d}"
+
+
 class PlaidBaseIndexer:
     """
     Base class for all Plaid-powered bank connectors.
@@ -44,7 +51,7 @@ class PlaidBaseIndexer:
 
     def __init__(self):
         """Initialize Plaid service."""
-        self.plaid_service = PlaidService()
+        self.plaid_service = get_plaid_service()
 
     async def index_transactions(
         self,
@@ -62,17 +69,29 @@ class PlaidBaseIndexer:
             user_id: User ID
             days_back: Number of days to fetch (default 90)
 
+        Documents are added to the session but not committed: the caller
+        commits them in one transaction along with the connector's
+        last_indexed_at and transactions_cursor.
+
         Returns:
             Indexing result with transaction count and documents created
         """
         try:
             # Get access token from connector config
-            access_token = connector.config.get("access_token")
+            access_token = get_access_token(connector.config)
             if not access_token:
                 raise ValueError(f"No access token found for {self.connector_name}")
 
-            # Fetch accounts first (for balances and account info)
-            accounts = await self.plaid_service.get_accounts(access_token)
+            # Accounts (for balances and account info), investment holdings (if
+            # supported by the institution) and the transaction changes since
+            # the last run are independent Plaid calls, so they are requested
+            # together
+            sync_plan, accounts, holdings_data = await asyncio.gather(
+                self._plan_transaction_sync(connector, access_token, days_back),
+                self.plaid_service.get_accounts(access_token),
+                self.plaid_service.get_investment_holdings(access_token),
+            )
+            start_date, changed_months, next_cursor = sync_plan
             account_map = {acc["account_id"]: acc for acc in accounts}
 
             documents_created = 0
@@ -88,10 +107,7 @@ class PlaidBaseIndexer:
             if account_doc_created:
                 documents_created += 1
 
-            # 2. Try to fetch investment holdings (if supported by the institution)
-            holdings_data = await self.plaid_service.get_investment_holdings(
-                access_token
-            )
+            # 2. Create investment holdings document
             if holdings_data["holdings"]:
                 holdings_doc_created = await self._create_investment_holdings_document(
                     session=session,
@@ -103,43 +119,48 @@ class PlaidBaseIndexer:
                 if holdings_doc_created:
                     documents_created += 1
 
-            # 3. Fetch regular transactions from Plaid
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days_back)
-
-            transactions = await self.plaid_service.get_transactions(
-                access_token=access_token,
-                start_date=start_date,
-                end_date=end_date,
+            # 3. Fetch regular transactions from Plaid for the months that
+            # changed, converting and grouping by month page by page so each
+            # raw Plaid page can be dropped as soon as it has been converted
+            transaction_count = 0
+            transactions_by_month: defaultdict[str, list[BankTransaction]] = (
+                defaultdict(list)
             )
-
-            transaction_count = len(transactions) if transactions else 0
-
-            if transactions:
-                # Group transactions by month for better organization
-                transactions_by_month = self._group_by_month(transactions)
-
-                for month_key, month_transactions in transactions_by_month.items():
-                    # Convert Plaid transactions to BankTransaction format
-                    bank_transactions = []
-                    for txn in month_transactions:
+            if start_date is not None:
+                async for page in self.plaid_service.iter_transaction_pages(
+                    access_token=access_token,
+                    start_date=start_date,
+                    end_date=datetime.now(),
+                ):
+                    transaction_count += len(page)
+                    for txn in page:
+                        month_key = _month_key(txn["date"])
+                        if (
+                            changed_months is not None
+                            and month_key not in changed_months
+                        ):
+                            continue
                         account = account_map.get(txn["account_id"], {})
-                        bank_transactions.append(
+                        transactions_by_month[month_key].append(
                             self._convert_plaid_transaction(txn, account)
                         )
 
-                    # Create document for this month's transactions
-                    doc_created = await self._create_transaction_document(
-                        session=session,
-                        transactions=bank_transactions,
-                        month_key=month_key,
-                        search_space_id=connector.search_space_id,
-                        user_id=user_id,
-                        connector_id=connector.id,
-                    )
+            # Create a document for each month's transactions
+            documents_created += await self._create_transaction_documents(
+                session=session,
+                transactions_by_month=transactions_by_month,
+                search_space_id=connector.search_space_id,
+                user_id=user_id,
+                connector_id=connector.id,
+            )
 
-                    if doc_created:
-                        documents_created += 1
+            # Committed by the caller with this run's documents, so the cursor
+            # only moves once they are in place
+            if next_cursor:
+                connector.config = {
+                    **connector.config,
+                    "transactions_cursor": next_cursor,
+                }
 
             return {
                 "transaction_count": transaction_count,
@@ -152,18 +173,64 @@ class PlaidBaseIndexer:
             logger.error(f"Error indexing {self.connector_name} data: {e}")
             raise
 
-    def _group_by_month(
-        self, transactions: list[dict[str, Any]]
-    ) -> dict[str, list[dict[str, Any]]]:
-        """Group transactions by month (YYYY-MM)."""
-        grouped = {}
-        for txn in transactions:
-            date_str = str(txn["date"])  # Format: YYYY-MM-DD
-            month_key = date_str[:7]  # Get YYYY-MM
-            if month_key not in grouped:
-                grouped[month_key] = []
-            grouped[month_key].append(txn)
-        return grouped
+    async def _plan_transaction_sync(
+        self,
+        connector: SearchSourceConnector,
+        access_token: str,
+        days_back: int,
+    ) -> tuple[datetime | None, set[str] | None, str | None]:
+        """
+        Work out which transactions need (re)indexing on this run.
+
+        With a stored /transactions/sync cursor only the months touched by
+        changes since the last run are rebuilt. Without one (the first run
+        after linking) the whole window is indexed, and a cursor for "now" is
+        taken first so nothing that changes during this run is missed next
+        time.
+
+        Args:
+            connector: Plaid connector, possibly holding a transactions_cursor
+            access_token: Plaid access token
+            days_back: Size of the indexing window in days
+
+        Returns:
+            Tuple of the date to fetch transactions from (None when nothing
+            changed), the YYYY-MM months to rebuild (None for every month in
+            the window) and the cursor to store for the next run
+        """
+        window_start = datetime.now() - timedelta(days=days_back)
+        cursor = connector.config.get("transactions_cursor")
+
+        if not cursor:
+            try:
+                changes = await self.plaid_service.sync_transactions(
+                    access_token, "now"
+                )
+            except Exception as e:
+                # Not fatal: the next run just indexes the whole window again
+                logger.warning(
+                    f"Could not get a transactions cursor for "
+                    f"{self.connector_name}: {e}"
+                )
+                return window_start, None, None
+            return window_start, None, changes["next_cursor"]
+
+        changes = await self.plaid_service.sync_transactions(access_token, cursor)
+        if changes["removed"]:
+            # Removed transactions come back without a date, so there is no
+            # telling which months they were in
+            return window_start, None, changes["next_cursor"]
+
+        changed_months = {
+            _month_key(txn["date"])
+            for txn in changes["added"] + changes["modified"]
+        }
+        if not changed_months:
+            return None, changed_months, changes["next_cursor"]
+
+        earliest_month = datetime.strptime(min(changed_months), "%Y-%m")
+        start_date = max(earliest_month, window_start)
+        return start_date, changed_months, changes["next_cursor"]
 
     def _convert_plaid_transaction(
         self, plaid_txn: dict[str, Any], account: dict[str, Any]
@@ -181,8 +248,13 @@ class PlaidBaseIndexer:
         else:
             trans_type = TransactionType.OTHER
 
-        # Parse date
-        txn_date = datetime.fromisoformat(str(plaid_txn["date"]))
+        # Plaid returns a datetime.date; build the (naive) datetime from its
+        # fields rather than round-tripping through an ISO string
+        raw_date = plaid_txn["date"]
+        if isinstance(raw_date, datetime):
+            txn_date = raw_date
+        else:
+            txn_date = datetime(raw_date.year, raw_date.month, raw_date.day)
 
         return BankTransaction(
             date=txn_date,
@@ -201,123 +273,210 @@ class PlaidBaseIndexer:
             },
         )
 
-    async def _create_transaction_document(
+    def _build_transaction_markdown(
+        self, transactions: list[BankTransaction], month_key: str
+    ) -> tuple[str, float, float]:
+        """
+        Build the markdown for a month's transactions.
+
+        Args:
+            transactions: List of BankTransaction objects
+            month_key: Month identifier (YYYY-MM)
+
+        Returns:
+            Tuple of the markdown content, total spent and total received
+        """
+        # Calculate totals in a single pass
+        total_spent = 0.0
+        total_received = 0.0
+        for t in transactions:
+            if t.amount > 0:
+                total_spent += t.amount
+            elif t.amount < 0:
+                total_received -= t.amount
+
+        header = (
+            f"# {self.connector_name} - Transactions for {month_key}\n\n"
+            f"**Total Transactions:** {len(transactions)}\n\n"
+            f"**Total Spent:** ${total_spent:.2f}\n"
+            f"**Total Received:** ${total_received:.2f}\n\n"
+            "## Transactions\n\n"
+        )
+
+        # One line per transaction, oldest first: expenses are shown with a
+        # minus sign and income with a plus sign
+        rows = "".join(
+            f"- **{t.date:%Y-%m-%d}** - {t.description}: "
+            f"{'-' if t.amount > 0 else '+'}${abs(t.amount):.2f} "
+            f"({' | '.join(t.category) if t.category else t.transaction_type})\n"
+            for t in sorted(transactions, key=lambda t: t.date)
+        )
+
+        return header + rows, total_spent, total_received
+
+    async def _summarize_and_chunk(
+        self, markdown_content: str, user_llm: Any, metadata: dict[str, Any]
+    ) -> tuple[str, Any, list[Any]]:
+        """
+        Generate the summary, embedding and chunks for a document's content.
+
+        Args:
+            markdown_content: Document content
+            user_llm: The user's long-context LLM
+            metadata: Document metadata passed to the summarizer
+
+        Returns:
+            Tuple of the summary, summary embedding and chunks
+        """
+        summary, summary_embedding = await generate_document_summary(
+            markdown_content, user_llm, metadata
+        )
+        chunks = await create_document_chunks(content=markdown_content)
+        return summary, summary_embedding, chunks
+
+    async def _create_transaction_documents(
         self,
         session: AsyncSession,
-        transactions: list[BankTransaction],
-        month_key: str,
+        transactions_by_month: dict[str, list[BankTransaction]],
         search_space_id: int,
         user_id: str,
         connector_id: int,
-    ) -> bool:
+    ) -> int:
         """
-        Create a document from transactions.
+        Create a document for each month of transactions.
+
+        Months whose content is already indexed are found with a single
+        content_hash IN (...) query; the rest are summarized and chunked
+        concurrently and added to the session together.
 
         Args:
             session: Database session
-            transactions: List of BankTransaction objects
-            month_key: Month identifier (YYYY-MM)
+            transactions_by_month: BankTransaction objects keyed by month (YYYY-MM)
             search_space_id: Search space ID
             user_id: User ID
             connector_id: Connector ID
 
         Returns:
-            True if document was created
+            Number of documents created
         """
-        # Build markdown content
-        markdown_parts = []
-        markdown_parts.append(
-            f"# {self.connector_name} - Transactions for {month_key}\n\n"
-        )
-        markdown_parts.append(f"**Total Transactions:** {len(transactions)}\n\n")
-
-        # Calculate totals
-        total_spent = sum(t.amount for t in transactions if t.amount > 0)
-        total_received = sum(abs(t.amount) for t in transactions if t.amount < 0)
-
-        markdown_parts.append(f"**Total Spent:** ${total_spent:.2f}\n")
-        markdown_parts.append(f"**Total Received:** ${total_received:.2f}\n\n")
-
-        # Add transactions
-        markdown_parts.append("## Transactions\n\n")
-        for txn in sorted(transactions, key=lambda t: t.date):
-            date_str = txn.date.strftime("%Y-%m-%d")
-            amount_str = f"${abs(txn.amount):.2f}"
-            if txn.amount > 0:
-                amount_str = f"-{amount_str}"  # Expense
-            else:
-                amount_str = f"+{amount_str}"  # Income
-
-            category_str = (
-                " | ".join(txn.category) if txn.category else txn.transaction_type
-            )
-            markdown_parts.append(
-                f"- **{date_str}** - {txn.description}: {amount_str} ({category_str})\n"
-            )
-
-        markdown_content = "".join(markdown_parts)
-
-        # Check for duplicate
         from hashlib import sha256
 
-        content_hash = sha256(markdown_content.encode()).hexdigest()
+        # Build every month's content and hash up front
+        months_by_hash: dict[
+            str, tuple[str, list[BankTransaction], str, float, float]
+        ] = {}
+        for month_key, transactions in transactions_by_month.items():
+            markdown_content, total_spent, total_received = (
+                self._build_transaction_markdown(transactions, month_key)
+            )
+            content_hash = sha256(markdown_content.encode()).hexdigest()
+            months_by_hash[content_hash] = (
+                month_key,
+                transactions,
+                markdown_content,
+                total_spent,
+                total_received,
+            )
 
-        stmt = select(Document).where(Document.content_hash == content_hash)
-        result = await session.execute(stmt)
-        existing_doc = result.scalar_one_or_none()
+        if not months_by_hash:
+            return 0
 
-        if existing_doc:
+        # Check for duplicates in one round trip
+        result = await session.execute(
+            select(Document.content_hash).where(
+                Document.content_hash.in_(list(months_by_hash))
+            )
+        )
+        for existing_hash in set(result.scalars()):
+            month_key = months_by_hash.pop(existing_hash)[0]
             logger.info(
                 f"Document for {self.connector_name} {month_key} already exists"
             )
-            return False
+
+        if not months_by_hash:
+            return 0
 
         # Get LLM for embeddings
         user_llm = await get_user_long_context_llm(session, user_id, search_space_id)
 
-        # Generate summary and embedding
-        summary, summary_embedding = await generate_document_summary(
-            markdown_content,
-            user_llm,
-            {
-                "connector": self.connector_name,
-                "month": month_key,
-                "transaction_count": len(transactions),
-            },
-        )
-
-        # Create chunks
-        chunks = await create_document_chunks(content=markdown_content)
-
-        # Create document
-        doc = Document(
-            search_space_id=search_space_id,
-            title=f"{self.connector_name} - {month_key}",
-            document_type=DocumentType.FILE,  # Use FILE type so it's searchable
-            document_metadata={
-                "connector_id": connector_id,
-                "connector_name": self.connector_name,
-                "month": month_key,
-                "transaction_count": len(transactions),
-                "total_spent": total_spent,
-                "total_received": total_received,
-                "is_plaid_document": True,
-            },
-            content=markdown_content,
-            content_hash=content_hash,
-            unique_identifier_hash=content_hash,  # Use content hash as unique ID
-            embedding=summary_embedding,
-            chunks=chunks,
-            updated_at=get_current_timestamp(),
+        # Months are summarized and chunked concurrently
+        processed = await asyncio.gather(
+            *(
+                self._summarize_and_chunk(
+                    markdown_content,
+                    user_llm,
+                    {
+                        "connector": self.connector_name,
+                        "month": month_key,
+                        "transaction_count": len(transactions),
+                    },
+                )
+                for month_key, transactions, markdown_content, _, _ in (
+                    months_by_hash.values()
+                )
+            )
         )
 
-        session.add(doc)
-        await session.commit()
+        doc_rows = []
+        month_chunks = []
+        for (
+            content_hash,
+            (month_key, transactions, markdown_content, total_spent, total_received),
+        ), (_summary, summary_embedding, chunks) in zip(
+            months_by_hash.items(), processed, strict=True
+        ):
+            doc_rows.append(
+                {
+                    "search_space_id": search_space_id,
+                    "title": f"{self.connector_name} - {month_key}",
+                    # Use FILE type so it's searchable
+                    "document_type": DocumentType.FILE,
+                    "document_metadata": {
+                        "connector_id": connector_id,
+                        "connector_name": self.connector_name,
+                        "month": month_key,
+                        "transaction_count": len(transactions),
+                        "total_spent": total_spent,
+                        "total_received": total_received,
+                        "is_plaid_document": True,
+                    },
+                    "content": markdown_content,
+                    "content_hash": content_hash,
+                    # Use content hash as unique ID
+                    "unique_identifier_hash": content_hash,
+                    "embedding": summary_embedding,
+                    "updated_at": get_current_timestamp(),
+                }
+            )
+            month_chunks.append(chunks)
+
+        # Core executemany inserts skip the per-instance ORM bookkeeping;
+        # documents come back in parameter order so chunks can be linked
+        doc_ids = (
+            await session.scalars(
+                insert(Document).returning(
+                    Document.id, sort_by_parameter_order=True
+                ),
+                doc_rows,
+            )
+        ).all()
+        chunk_rows = [
+            {
+                "document_id": doc_id,
+                "content": chunk.content,
+                "embedding": chunk.embedding,
+            }
+            for doc_id, chunks in zip(doc_ids, month_chunks, strict=True)
+            for chunk in chunks
+        ]
+        if chunk_rows:
+            await session.execute(insert(Chunk), chunk_rows)
 
         logger.info(
-            f"Created document for {self.connector_name} {month_key} with {len(chunks)} chunks"
+            f"Created {len(doc_ids)} transaction documents for {self.connector_name}"
         )
-        return True
+
+        return len(doc_ids)
 
     async def _create_account_summary_document(
         self,
@@ -448,7 +607,6 @@ class PlaidBaseIndexer:
         )
 
         session.add(doc)
-        await session.commit()
 
         logger.info(
             f"Created account summary for {self.connector_name} with {len(accounts)} accounts"
@@ -608,7 +766,6 @@ class PlaidBaseIndexer:
         )
 
         session.add(doc)
-        await session.commit()
 
         logger.info(
             f"Created investment holdings document for {self.connector_name} with {len(holdings)} positions"
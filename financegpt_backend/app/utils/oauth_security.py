@@ -10,10 +10,14 @@ import hashlib
 import hmac
 import json
 import logging
+import os
 import time
 from uuid import UUID
 
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
@@ -208,3 +212,72 @@ class TokenEncryption:
             return len(token) > 20
         except Exception:
             return False
+
+
+class AESGCMTokenEncryption:
+    """Encrypt/decrypt tokens for storage with AES-256-GCM.
+
+    A single AEAD pass (hardware AES through OpenSSL) instead of Fernet's
+    AES-CBC followed by a separate HMAC. Stored values are base64 of
+    nonce || ciphertext, and are not interchangeable with TokenEncryption's.
+    """
+
+    NONCE_SIZE = 12
+
+    def __init__(self, secret_key: str):
+        """
+        Initialize token encryption.
+
+        Args:
+            secret_key: Secret key for encryption (should be SECRET_KEY from config)
+        """
+        if not secret_key:
+            raise ValueError("secret_key is required for token encryption")
+        key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"financegpt-token-aes-gcm",
+        ).derive(secret_key.encode())
+        self.cipher = AESGCM(key)
+
+    def encrypt_token(self, token: str, associated_data: bytes | None = None) -> str:
+        """
+        Encrypt a token for storage.
+
+        Args:
+            token: Plaintext token to encrypt
+            associated_data: Optional data the ciphertext is bound to; the same
+                value must be passed to decrypt_token
+
+        Returns:
+            Encrypted token string
+        """
+        if not token:
+            return token
+        nonce = os.urandom(self.NONCE_SIZE)
+        ciphertext = self.cipher.encrypt(nonce, token.encode(), associated_data)
+        return base64.urlsafe_b64encode(nonce + ciphertext).decode()
+
+    def decrypt_token(
+        self, encrypted_token: str, associated_data: bytes | None = None
+    ) -> str:
+        """
+        Decrypt a stored token.
+
+        Args:
+            encrypted_token: Encrypted token string
+            associated_data: The associated data used when encrypting
+
+        Returns:
+            Decrypted plaintext token
+        """
+        if not encrypted_token:
+            return encrypted_token
+        try:
+            raw = base64.urlsafe_b64decode(encrypted_token.encode())
+            nonce, ciphertext = raw[: self.NONCE_SIZE], raw[self.NONCE_SIZE :]
+            return self.cipher.decrypt(nonce, ciphertext, associated_data).decode()
+        except Exception as e:
+            logger.error(f"Failed to decrypt token: {e!s}")
+            raise ValueError(f"Token decryption failed: {e!s}") from e
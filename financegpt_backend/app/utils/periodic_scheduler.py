@@ -4,24 +4,81 @@ Utility functions for managing periodic connector indexing schedules.
 This module uses a meta-scheduler pattern instead of RedBeat's dynamic schedule creation.
 Instead of creating individual Beat schedules for each connector, we:
 1. Store schedule configuration in the database (next_scheduled_at, frequency)
-2. Have ONE Beat task that runs every minute checking for due connectors
-3. Trigger indexing tasks for connectors whose next_scheduled_at has passed
+2. Mirror each schedule into a Redis sorted set scored by next_scheduled_at
+3. Have ONE Beat task that runs every minute, skipping the database entirely
+   unless the sorted set says a connector is due
+4. Trigger indexing tasks for connectors whose next_scheduled_at has passed
 
 This avoids RedBeat's limitation where new schedules aren't discovered without restart.
 """
 
 import logging
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
+from redis import Redis
+from redis.exceptions import RedisError
+
+from app.config import config
 from app.db import SearchSourceConnectorType
 
 logger = logging.getLogger(__name__)
 
-# Mapping of connector types to their corresponding Celery task names
-CONNECTOR_TASK_MAP = {
-    SearchSourceConnectorType.CHASE_BANK: "index_plaid_transactions",
-    SearchSourceConnectorType.FIDELITY_INVESTMENTS: "index_plaid_transactions",
-    SearchSourceConnectorType.BANK_OF_AMERICA: "index_plaid_transactions",
-}
+# Connector ids scored by next_scheduled_at (epoch seconds). The database stays
+# the source of truth; the meta-scheduler rebuilds this set from it periodically
+PERIODIC_DUE_KEY = "periodic:due"
+
+# Connector types synced through Plaid; all of them run index_plaid_transactions
+PLAID_CONNECTOR_TYPES: frozenset[SearchSourceConnectorType] = frozenset(
+    {
+        SearchSourceConnectorType.CHASE_BANK,
+        SearchSourceConnectorType.FIDELITY_INVESTMENTS,
+        SearchSourceConnectorType.BANK_OF_AMERICA,
+    }
+)
+
+
+# Keep Redis trouble from stalling a request: the due set is rebuilt from the
+# database anyway, so give up quickly and let the caller log the failure
+_REDIS_TIMEOUT_SECONDS = 2
+
+
+@lru_cache(maxsize=1)
+def _get_redis() -> Redis:
+    """
+    Redis client for the due set, shared by the API process.
+
+    The client is synchronous, so async callers should run the schedule
+    functions in a worker thread.
+    """
+    return Redis.from_url(
+        config.REDIS_URL,
+        socket_connect_timeout=_REDIS_TIMEOUT_SECONDS,
+        socket_timeout=_REDIS_TIMEOUT_SECONDS,
+    )
+
+
+def _schedule_next_run(
+    connector_id: int,
+    frequency_minutes: int,
+    next_scheduled_at: datetime | None,
+) -> bool:
+    """Add or re-score a connector in the due set."""
+    if next_scheduled_at is None:
+        next_scheduled_at = datetime.now(UTC) + timedelta(minutes=frequency_minutes)
+    try:
+        _get_redis().zadd(
+            PERIODIC_DUE_KEY, {str(connector_id): next_scheduled_at.timestamp()}
+        )
+    except RedisError as e:
+        logger.warning(
+            "Could not schedule connector %d in Redis: %s. "
+            "It will be picked up when the due set is next rebuilt.",
+            connector_id,
+            e,
+        )
+        return False
+    return True
 
 
 def create_periodic_schedule(
@@ -30,6 +87,7 @@ def create_periodic_schedule(
     user_id: str,
     connector_type: SearchSourceConnectorType,
     frequency_minutes: int,
+    next_scheduled_at: datetime | None = None,
 ) -> bool:
     """
     Trigger the first indexing run immediately when periodic indexing is enabled.
@@ -43,15 +101,19 @@ def create_periodic_schedule(
         search_space_id: ID of the search space
         user_id: User ID
         connector_type: Type of connector
-        frequency_minutes: Frequency in minutes (used for logging)
+        frequency_minutes: Frequency in minutes
+        next_scheduled_at: When the next periodic run is due (defaults to one
+            frequency from now)
 
     Returns:
         True if successful, False otherwise
     """
     try:
         logger.info(
-            f"Periodic indexing enabled for connector {connector_id} "
-            f"(frequency: {frequency_minutes} minutes). Triggering first run..."
+            "Periodic indexing enabled for connector %d "
+            "(frequency: %d minutes). Triggering first run...",
+            connector_id,
+            frequency_minutes,
         )
 
         # Import Plaid indexing task
@@ -59,31 +121,39 @@ def create_periodic_schedule(
             index_plaid_transactions_task,
         )
 
-        # Map connector type to task
-        task_map = {
-            SearchSourceConnectorType.CHASE_BANK: index_plaid_transactions_task,
-            SearchSourceConnectorType.FIDELITY_INVESTMENTS: index_plaid_transactions_task,
-            SearchSourceConnectorType.BANK_OF_AMERICA: index_plaid_transactions_task,
-        }
-
         # Trigger the first run immediately
-        task = task_map.get(connector_type)
+        task = (
+            index_plaid_transactions_task
+            if connector_type in PLAID_CONNECTOR_TYPES
+            else None
+        )
         if task:
             # Plaid tasks only need connector_id (not search_space_id, user_id, dates)
-            task.delay(connector_id)
+            # Skip the result backend, and drop the trigger if no worker picks
+            # it up before the next periodic run would be due anyway
+            task.apply_async(
+                (connector_id,),
+                ignore_result=True,
+                expires=frequency_minutes * 60,
+            )
+            _schedule_next_run(connector_id, frequency_minutes, next_scheduled_at)
             logger.info(
-                f"✓ First indexing run triggered for connector {connector_id}. "
-                f"Periodic indexing will continue automatically every {frequency_minutes} minutes."
+                "✓ First indexing run triggered for connector %d. "
+                "Periodic indexing will continue automatically every %d minutes.",
+                connector_id,
+                frequency_minutes,
             )
         else:
-            logger.error(f"No task mapping found for connector type: {connector_type}")
+            logger.error("No task mapping found for connector type: %s", connector_type)
             return False
 
         return True
 
     except Exception as e:
         logger.error(
-            f"Failed to trigger initial indexing for connector {connector_id}: {e!s}",
+            "Failed to trigger initial indexing for connector %d: %s",
+            connector_id,
+            e,
             exc_info=True,
         )
         return False
@@ -94,16 +164,23 @@ def delete_periodic_schedule(connector_id: int) -> bool:
     Handle deletion of periodic schedule for a connector.
 
     Note: With the meta-scheduler pattern, the schedule is managed in the database.
-    The next_scheduled_at field being set to None effectively disables it.
-    This function just logs the action.
+    The next_scheduled_at field being set to None effectively disables it; this
+    function removes the connector from the Redis due set.
 
     Args:
         connector_id: ID of the connector
 
     Returns:
-        True (always successful since database handles the state)
+        True if successful, False otherwise
     """
-    logger.info(f"Periodic indexing disabled for connector {connector_id}")
+    logger.info("Periodic indexing disabled for connector %d", connector_id)
+    try:
+        _get_redis().zrem(PERIODIC_DUE_KEY, str(connector_id))
+    except RedisError as e:
+        logger.warning(
+            "Could not remove connector %d from the due set: %s", connector_id, e
+        )
+        return False
     return True
 
 
@@ -113,12 +190,15 @@ def update_periodic_schedule(
     user_id: str,
     connector_type: SearchSourceConnectorType,
     frequency_minutes: int,
+    next_scheduled_at: datetime | None = None,
+    old_frequency_minutes: int | None = None,
 ) -> bool:
     """
     Update an existing periodic schedule for a connector.
 
     Note: With the meta-scheduler pattern, updates are handled by the database.
-    This function logs the update and optionally triggers an immediate run.
+    This function re-scores the connector in the Redis due set and optionally
+    triggers an immediate run.
 
     Args:
         connector_id: ID of the connector
@@ -126,14 +206,26 @@ def update_periodic_schedule(
         user_id: User ID
         connector_type: Type of connector
         frequency_minutes: New frequency in minutes
+        next_scheduled_at: When the next periodic run is due (defaults to one
+            frequency from now)
+        old_frequency_minutes: Frequency the connector was already scheduled
+            at, or None if it wasn't scheduled
 
     Returns:
         True if successful, False otherwise
     """
+    if old_frequency_minutes == frequency_minutes:
+        logger.debug("No-op schedule update for connector %d", connector_id)
+        return True
+
     logger.info(
-        f"Periodic indexing schedule updated for connector {connector_id} "
-        f"(new frequency: {frequency_minutes} minutes)"
+        "Periodic indexing schedule updated for connector %d "
+        "(new frequency: %d minutes)",
+        connector_id,
+        frequency_minutes,
     )
+    if not _schedule_next_run(connector_id, frequency_minutes, next_scheduled_at):
+        return False
     # Optionally trigger an immediate run with the new schedule
     # Uncomment the line below if you want immediate execution on schedule update
     # return create_periodic_schedule(connector_id, search_space_id, user_id, connector_type, frequency_minutes)
@@ -6,8 +6,11 @@ before sending tax form data to LLMs or external services.
 
 import hashlib
 import re
+from collections.abc import Callable
 from typing import Any
 
+_NON_DIGIT = re.compile(r'\D')
+
 
 def mask_ssn(ssn: str | None, keep_last: int = 4) -> str:
     """Mask SSN, keeping only the last N digits.
@@ -31,7 +34,7 @@ def mask_ssn(ssn: str | None, keep_last: int = 4) -> str:
         return "[SSN_REDACTED]"
     
     # Remove all non-digit characters
-    digits_only = re.sub(r'\D', '', ssn)
+    digits_only = _NON_DIGIT.sub('', ssn)
     
     # SSN must be exactly 9 digits
     if len(digits_only) != 9:
@@ -49,6 +52,29 @@ def mask_ssn(ssn: str | None, keep_last: int = 4) -> str:
         return ('*' * mask_count) + last_digits
 
 
+def hash_tin_bytes(tin: str | None) -> bytes:
+    """Hash Tax Identification Number (SSN or EIN) to a raw SHA-256 digest.
+    
+    Use this where the hash is stored or compared rather than displayed: the
+    32-byte digest is half the size of its hex form.
+    
+    Args:
+        tin: SSN or EIN to hash
+        
+    Returns:
+        32-byte SHA-256 digest of the TIN, or b"" if empty
+    """
+    if not tin:
+        return b""
+    
+    # Remove all non-digit characters for consistent hashing; TINs that arrive
+    # pre-cleaned skip the regex pass entirely
+    digits_only = tin if tin.isascii() and tin.isdigit() else _NON_DIGIT.sub('', tin)
+    
+    # Hash using SHA-256
+    return hashlib.sha256(digits_only.encode('utf-8')).digest()
+
+
 def hash_tin(tin: str | None) -> str:
     """Hash Tax Identification Number (SSN or EIN) using SHA-256.
     
@@ -62,14 +88,7 @@ def hash_tin(tin: str | None) -> str:
         >>> hash_tin("123-45-6789")
         "a665a45920422f9d417e4867efdc4fb8a04a1f3fff1fa07e998e86f7f7a27ae3"
     """
-    if not tin:
-        return ""
-    
-    # Remove all non-digit characters for consistent hashing
-    digits_only = re.sub(r'\D', '', tin)
-    
-    # Hash using SHA-256
-    return hashlib.sha256(digits_only.encode('utf-8')).hexdigest()
+    return hash_tin_bytes(tin).hex()
 
 
 def mask_ein(ein: str | None) -> str:
@@ -130,6 +149,58 @@ def mask_address(address: str | None, replacement: str = "[ADDRESS_REDACTED]") -
     return replacement
 
 
+def _mask_ssn_field(data: dict[str, Any], field: str) -> None:
+    """Mask an SSN in place, keeping the last 4 digits for context."""
+    data[field] = mask_ssn(data[field])
+
+
+def _hash_tin_field(data: dict[str, Any], field: str) -> None:
+    """Replace a TIN with its hash under ``<field>_hash`` (never keep plaintext)."""
+    data[f"{field}_hash"] = hash_tin(data.pop(field))
+
+
+def _mask_employee_name_field(data: dict[str, Any], field: str) -> None:
+    """Replace the employee name with a placeholder."""
+    data[field] = mask_name(data[field], "[EMPLOYEE_NAME]")
+
+
+def _mask_address_field(data: dict[str, Any], field: str) -> None:
+    """Replace an address with a placeholder."""
+    data[field] = mask_address(data[field])
+
+
+def _drop_employee_name_field(data: dict[str, Any], field: str) -> None:
+    """Drop the employee name, leaving only a masked marker for storage."""
+    del data[field]
+    data["employee_name_masked"] = "[EMPLOYEE_NAME]"
+
+
+# Field name -> in-place masking rule applied before sending a form to an LLM
+_LLM_MASK_RULES: dict[str, Callable[[dict[str, Any], str], None]] = {
+    "employee_ssn": _mask_ssn_field,
+    "recipient_ssn": _mask_ssn_field,
+    "employer_ein": _hash_tin_field,
+    "payer_tin": _hash_tin_field,
+    "recipient_tin": _hash_tin_field,
+    "employee_name": _mask_employee_name_field,
+    "employee_address": _mask_address_field,
+    "employer_address": _mask_address_field,
+    "payer_address": _mask_address_field,
+}
+
+# Field name -> in-place rule applied before persisting a form
+_STORAGE_RULES: dict[str, Callable[[dict[str, Any], str], None]] = {
+    "employee_ssn": _hash_tin_field,
+    "employer_ein": _hash_tin_field,
+    "payer_tin": _hash_tin_field,
+    "recipient_tin": _hash_tin_field,
+    "employee_name": _drop_employee_name_field,
+}
+
+_LLM_MASK_FIELDS = frozenset(_LLM_MASK_RULES)
+_STORAGE_FIELDS = frozenset(_STORAGE_RULES)
+
+
 def mask_tax_form_for_llm(form_data: dict[str, Any], form_type: str) -> dict[str, Any]:
     """Mask all PII in a tax form before sending to LLM.
     
@@ -146,7 +217,8 @@ def mask_tax_form_for_llm(form_data: dict[str, Any], form_type: str) -> dict[str
         form_type: Type of form (W2, 1099-MISC, etc.)
         
     Returns:
-        Dictionary with PII masked
+        Dictionary with PII masked. When the form has no PII fields this is
+        ``form_data`` itself, so callers must not mutate the result.
         
     Examples:
         >>> w2_data = {
@@ -161,53 +233,20 @@ def mask_tax_form_for_llm(form_data: dict[str, Any], form_type: str) -> dict[str
         >>> masked["wages"]
         75000.0
     """
-    masked_data = form_data.copy()
-    
-    # Mask SSNs (keep last 4 for context)
-    if "employee_ssn" in masked_data:
-        masked_data["employee_ssn"] = mask_ssn(masked_data["employee_ssn"])
-    
-    if "recipient_ssn" in masked_data:
-        masked_data["recipient_ssn"] = mask_ssn(masked_data["recipient_ssn"])
-    
-    # Hash EINs (never show plaintext)
-    if "employer_ein" in masked_data:
-        masked_data["employer_ein_hash"] = hash_tin(masked_data["employer_ein"])
-        del masked_data["employer_ein"]
-    
-    if "payer_tin" in masked_data:
-        masked_data["payer_tin_hash"] = hash_tin(masked_data["payer_tin"])
-        del masked_data["payer_tin"]
-    
-    if "recipient_tin" in masked_data:
-        masked_data["recipient_tin_hash"] = hash_tin(masked_data["recipient_tin"])
-        del masked_data["recipient_tin"]
-    
-    # Mask names
-    if "employee_name" in masked_data:
-        masked_data["employee_name"] = mask_name(masked_data["employee_name"], "[EMPLOYEE_NAME]")
+    # Nothing to mask: skip the copy entirely
+    if _LLM_MASK_FIELDS.isdisjoint(form_data):
+        return form_data
     
-    if "employer_name" in masked_data:
-        # Keep employer name for context (helps LLM understand employment)
-        # But could mask if user prefers
-        pass
-    
-    if "payer_name" in masked_data:
-        # Keep payer name (e.g., "Vanguard", "Chase Bank") - useful for context
-        pass
-    
-    # Mask addresses
-    if "employee_address" in masked_data:
-        masked_data["employee_address"] = mask_address(masked_data["employee_address"])
-    
-    if "employer_address" in masked_data:
-        masked_data["employer_address"] = mask_address(masked_data["employer_address"])
-    
-    if "payer_address" in masked_data:
-        masked_data["payer_address"] = mask_address(masked_data["payer_address"])
+    masked_data = form_data.copy()
     
-    # Financial data is NOT masked - it's needed for analysis
-    # This includes: wages, taxes withheld, interest income, dividends, etc.
+    # Only fields present in the form are visited. Employer/payer names are
+    # kept for context (they help the LLM understand employment and income
+    # sources), and financial data is never masked since it's needed for
+    # analysis.
+    for field in list(masked_data):
+        rule = _LLM_MASK_RULES.get(field)
+        if rule is not None:
+            rule(masked_data, field)
     
     return masked_data
 
@@ -224,34 +263,21 @@ def prepare_tax_form_for_storage(form_data: dict[str, Any]) -> dict[str, Any]:
         form_data: Dictionary containing raw tax form data
         
     Returns:
-        Dictionary ready for database insertion
+        Dictionary ready for database insertion. When the form has no PII
+        fields this is ``form_data`` itself, so callers must not mutate it.
     """
-    storage_data = form_data.copy()
+    # Nothing to hash or mask: skip the copy entirely
+    if _STORAGE_FIELDS.isdisjoint(form_data):
+        return form_data
     
-    # Hash all TINs for storage (never store plaintext)
-    if "employee_ssn" in storage_data:
-        storage_data["employee_ssn_hash"] = hash_tin(storage_data["employee_ssn"])
-        del storage_data["employee_ssn"]
-    
-    if "employer_ein" in storage_data:
-        storage_data["employer_ein_hash"] = hash_tin(storage_data["employer_ein"])
-        del storage_data["employer_ein"]
-    
-    if "payer_tin" in storage_data:
-        storage_data["payer_tin_hash"] = hash_tin(storage_data["payer_tin"])
-        del storage_data["payer_tin"]
-    
-    if "recipient_tin" in storage_data:
-        storage_data["recipient_tin_hash"] = hash_tin(storage_data["recipient_tin"])
-        del storage_data["recipient_tin"]
-    
-    # Mask employee name for storage
-    if "employee_name" in storage_data:
-        storage_data["employee_name_masked"] = "[EMPLOYEE_NAME]"
-        del storage_data["employee_name"]
+    storage_data = form_data.copy()
     
-    # Keep employer/payer names (useful for queries)
-    # Keep financial data (wages, taxes, etc.)
+    # Hash all TINs and mask the employee name; employer/payer names and
+    # financial data are kept intact (useful for queries)
+    for field in list(storage_data):
+        rule = _STORAGE_RULES.get(field)
+        if rule is not None:
+            rule(storage_data, field)
     
     return storage_data
 
@@ -277,11 +303,8 @@ def validate_confidence_threshold(
         >>> failed
         ['federal_tax']
     """
-    failed_fields = []
-    
-    for field, score in confidence_scores.items():
-        if score < threshold:
-            failed_fields.append(field)
+    failed_fields = [
+        field for field, score in confidence_scores.items() if score < threshold
+    ]
     
-    all_passed = len(failed_fields) == 0
-    return all_passed, failed_fields
+    return not failed_fields, failed_fields
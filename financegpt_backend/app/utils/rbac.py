@@ -7,12 +7,15 @@ import secrets
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy import and_, event
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, selectinload
 
 from app.db import (
     Permission,
+    SearchSourceConnector,
+    SearchSourceConnectorType,
     SearchSpace,
     SearchSpaceMembership,
     SearchSpaceRole,
@@ -20,6 +23,15 @@ from app.db import (
     has_permission,
 )
 
+# Key in AsyncSession.info under which memberships are memoized per session
+_MEMBERSHIP_CACHE_KEY = "rbac_membership_cache"
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_membership_cache(session: Session, previous_transaction) -> None:
+    """Drop memoized memberships on rollback, which expires the cached objects."""
+    session.info.pop(_MEMBERSHIP_CACHE_KEY, None)
+
 
 async def get_user_membership(
     session: AsyncSession,
@@ -29,6 +41,9 @@ async def get_user_membership(
     """
     Get the user's membership in a search space.
 
+    Memberships found are memoized on the session (i.e. for the request), so
+    repeated permission checks against the same search space only query once.
+
     Args:
         session: Database session
         user_id: User UUID
@@ -37,6 +52,11 @@ async def get_user_membership(
     Returns:
         SearchSpaceMembership if found, None otherwise
     """
+    cache = session.info.setdefault(_MEMBERSHIP_CACHE_KEY, {})
+    membership = cache.get((user_id, search_space_id))
+    if membership is not None:
+        return membership
+
     result = await session.execute(
         select(SearchSpaceMembership)
         .options(selectinload(SearchSpaceMembership.role))
@@ -45,7 +65,10 @@ async def get_user_membership(
             SearchSpaceMembership.search_space_id == search_space_id,
         )
     )
-    return result.scalars().first()
+    membership = result.scalars().first()
+    if membership is not None:
+        cache[(user_id, search_space_id)] = membership
+    return membership
 
 
 async def get_user_permissions(
@@ -218,6 +241,91 @@ async def get_search_space_with_access_check(
     return search_space, membership
 
 
+async def get_connector_with_permission(
+    session: AsyncSession,
+    user: User,
+    connector_id: int,
+    required_permission: str,
+    error_message: str = "You don't have permission to perform this action",
+    search_space_id: int | None = None,
+    connector_type: SearchSourceConnectorType | None = None,
+    not_found_message: str = "Connector not found",
+) -> SearchSourceConnector:
+    """
+    Get a connector and check the user's permission in a single query.
+
+    The connector is joined against the user's membership and role, so the
+    lookup and the permission check share one round trip instead of running
+    a fetch followed by check_permission().
+
+    Args:
+        session: Database session
+        user: User object
+        connector_id: Connector ID
+        required_permission: Permission string to check
+        error_message: Custom error message for permission denied
+        search_space_id: Search space to check the permission in
+            (defaults to the connector's own search space)
+        connector_type: Only match connectors of this type
+        not_found_message: Detail for the 404 raised when no connector matches
+
+    Returns:
+        SearchSourceConnector if found and permission granted
+
+    Raises:
+        HTTPException: If the connector doesn't exist (404) or the user lacks
+            access or permission (403)
+    """
+    membership_space_id = (
+        SearchSourceConnector.search_space_id
+        if search_space_id is None
+        else search_space_id
+    )
+    query = (
+        select(
+            SearchSourceConnector,
+            SearchSpaceMembership.id,
+            SearchSpaceMembership.is_owner,
+            SearchSpaceRole.permissions,
+        )
+        .outerjoin(
+            SearchSpaceMembership,
+            and_(
+                SearchSpaceMembership.search_space_id == membership_space_id,
+                SearchSpaceMembership.user_id == user.id,
+            ),
+        )
+        .outerjoin(SearchSpaceRole, SearchSpaceRole.id == SearchSpaceMembership.role_id)
+        .filter(SearchSourceConnector.id == connector_id)
+    )
+    if connector_type is not None:
+        query = query.filter(SearchSourceConnector.connector_type == connector_type)
+    result = await session.execute(query)
+    row = result.first()
+
+    if not row:
+        raise HTTPException(status_code=404, detail=not_found_message)
+
+    connector, membership_id, is_owner, role_permissions = row
+
+    if membership_id is None:
+        raise HTTPException(
+            status_code=403,
+            detail="You don't have access to this search space",
+        )
+
+    # Get user's permissions
+    if is_owner:
+        permissions = [Permission.FULL_ACCESS.value]
+    else:
+        permissions = role_permissions or []
+
+    if not has_permission(permissions, required_permission):
+        raise HTTPException(status_code=403, detail=error_message)
+
+    return connector
+
+
 def generate_invite_code() -> str:
     """
     Generate a unique invite code for search space invites.
@@ -6,13 +6,100 @@ and normalizing merchant names for better matching.
 """
 
 import re
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+import ahocorasick
 
+# Known subscription patterns: normalized name -> substrings that identify it.
+# Read-only so the automaton built from it below can never drift out of sync.
+SUBSCRIPTION_PATTERNS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    'netflix': ('netflix',),
+    'spotify': ('spotify',),
+    'amazon prime': ('amzn prime', 'amazon prime', 'prime video'),
+    'hulu': ('hulu',),
+    'disney plus': ('disney', 'disneyplus', 'disney plus'),
+    'hbo max': ('hbo', 'hbomax'),
+    'apple music': ('apple com bill', 'apple music'),
+    'apple tv': ('apple tv',),
+    'youtube premium': ('youtube premium', 'google youtube'),
+    'paramount plus': ('paramount',),
+    'peacock': ('peacock',),
+    'discovery plus': ('discovery',),
+    
+    # Software/SaaS
+    'adobe': ('adobe',),
+    'microsoft 365': ('microsoft', 'msft', 'office 365'),
+    'google workspace': ('google workspace', 'google apps'),
+    'dropbox': ('dropbox',),
+    'evernote': ('evernote',),
+    'notion': ('notion',),
+    'slack': ('slack',),
+    'zoom': ('zoom',),
+    'github': ('github',),
+    'chatgpt': ('openai', 'chat gpt'),
+    'claude': ('anthropic',),
+    
+    # Fitness/Wellness
+    'planet fitness': ('planet fit', 'planet fitness'),
+    'la fitness': ('la fitness',),
+    'equinox': ('equinox',),
+    'peloton': ('peloton',),
+    'calm': ('calm',),
+    'headspace': ('headspace',),
+    
+    # Delivery/Food
+    'doordash': ('doordash', 'door dash'),
+    'uber eats': ('uber eats',),
+    'grubhub': ('grubhub',),
+    'instacart': ('instacart',),
+    'hellofresh': ('hellofresh', 'hello fresh'),
+    'blue apron': ('blue apron',),
+    
+    # News/Magazines
+    'new york times': ('nytimes', 'ny times', 'new york times'),
+    'washington post': ('wash post', 'washington post'),
+    'wall street journal': ('wsj', 'wall street'),
+    
+    # Gaming
+    'playstation plus': ('playstation', 'ps plus'),
+    'xbox game pass': ('xbox', 'microsoft xbox'),
+    'nintendo online': ('nintendo',),
+    
+    # Cloud storage
+    'icloud': ('icloud', 'apple icloud'),
+    'google one': ('google one', 'google storage'),
+    'onedrive': ('onedrive',),
+})
+
+
+def _build_subscription_automaton() -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton over all subscription patterns."""
+    automaton = ahocorasick.Automaton()
+    for priority, (normalized, patterns) in enumerate(SUBSCRIPTION_PATTERNS.items()):
+        for pattern in patterns:
+            automaton.add_word(pattern, (priority, normalized))
+    automaton.make_automaton()
+    return automaton
+
+
+_SUBSCRIPTION_AUTOMATON = _build_subscription_automaton()
+
+_NON_ALNUM_SPACE = re.compile(r'[^a-z0-9\s]')
+_DIGIT_TOKEN = re.compile(r'\b\d+\b')
+_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=131072)
 def normalize_merchant(merchant_name: str | None) -> str:
     """
     Normalize merchant names for consistent matching across transactions.
     
+    Results are memoized: the same raw merchant strings recur constantly
+    (every monthly charge from every user), and normalization is pure.
+    
     Examples:
         - "NETFLIX.COM*123456" -> "netflix"
         - "SPOTIFY AB*789" -> "spotify"
@@ -47,83 +134,62 @@ def normalize_merchant(merchant_name: str | None) -> str:
             merchant = merchant[len(prefix):]
     
     # Remove special characters except spaces
-    merchant = re.sub(r'[^a-z0-9\s]', ' ', merchant)
+    merchant = _NON_ALNUM_SPACE.sub(' ', merchant)
     
     # Remove transaction IDs and numbers
-    merchant = re.sub(r'\b\d+\b', '', merchant)
+    merchant = _DIGIT_TOKEN.sub('', merchant)
     
     # Remove extra whitespace
-    merchant = re.sub(r'\s+', ' ', merchant).strip()
-    
-    # Known subscription patterns
-    subscription_patterns = {
-        'netflix': ['netflix'],
-        'spotify': ['spotify'],
-        'amazon prime': ['amzn prime', 'amazon prime', 'prime video'],
-        'hulu': ['hulu'],
-        'disney plus': ['disney', 'disneyplus', 'disney plus'],
-        'hbo max': ['hbo', 'hbomax'],
-        'apple music': ['apple com bill', 'apple music'],
-        'apple tv': ['apple tv'],
-        'youtube premium': ['youtube premium', 'google youtube'],
-        'paramount plus': ['paramount'],
-        'peacock': ['peacock'],
-        'discovery plus': ['discovery'],
-        
-        # Software/SaaS
-        'adobe': ['adobe'],
-        'microsoft 365': ['microsoft', 'msft', 'office 365'],
-        'google workspace': ['google workspace', 'google apps'],
-        'dropbox': ['dropbox'],
-        'evernote': ['evernote'],
-        'notion': ['notion'],
-        'slack': ['slack'],
-        'zoom': ['zoom'],
-        'github': ['github'],
-        'chatgpt': ['openai', 'chat gpt'],
-        'claude': ['anthropic'],
-        
-        # Fitness/Wellness
-        'planet fitness': ['planet fit', 'planet fitness'],
-        'la fitness': ['la fitness'],
-        'equinox': ['equinox'],
-        'peloton': ['peloton'],
-        'calm': ['calm'],
-        'headspace': ['headspace'],
-        
-        # Delivery/Food
-        'doordash': ['doordash', 'door dash'],
-        'uber eats': ['uber eats'],
-        'grubhub': ['grubhub'],
-        'instacart': ['instacart'],
-        'hellofresh': ['hellofresh', 'hello fresh'],
-        'blue apron': ['blue apron'],
-        
-        # News/Magazines
-        'new york times': ['nytimes', 'ny times', 'new york times'],
-        'washington post': ['wash post', 'washington post'],
-        'wall street journal': ['wsj', 'wall street'],
-        
-        # Gaming
-        'playstation plus': ['playstation', 'ps plus'],
-        'xbox game pass': ['xbox', 'microsoft xbox'],
-        'nintendo online': ['nintendo'],
-        
-        # Cloud storage
-        'icloud': ['icloud', 'apple icloud'],
-        'google one': ['google one', 'google storage'],
-        'onedrive': ['onedrive'],
-    }
+    merchant = _WHITESPACE.sub(' ', merchant).strip()
     
-    # Match against known patterns
-    for normalized, patterns in subscription_patterns.items():
-        for pattern in patterns:
-            if pattern in merchant:
-                return normalized
+    # Match against known patterns in a single scan; the lowest priority wins so
+    # the result matches the declaration order of SUBSCRIPTION_PATTERNS.
+    match = min((value for _, value in _SUBSCRIPTION_AUTOMATON.iter(merchant)), default=None)
+    if match is not None:
+        return match[1]
     
     return merchant
 
 
+def normalize_merchants(merchant_names: Iterable[str | None]) -> list[str]:
+    """
+    Normalize a batch of merchant names.
+    
+    Transaction batches repeat the same merchants heavily, so each distinct
+    raw name is normalized once and reused for the rest of the batch.
+    
+    Args:
+        merchant_names: Raw merchant names from transactions
+        
+    Returns:
+        Normalized merchant names, in the same order as the input
+    """
+    normalized: dict[str | None, str] = {}
+    results = []
+    for merchant_name in merchant_names:
+        value = normalized.get(merchant_name)
+        if value is None:
+            value = normalized[merchant_name] = normalize_merchant(merchant_name)
+        results.append(value)
+    return results
+
+
+def build_merchant_amount_key(normalized_merchant: str, amount: float) -> str:
+    """
+    Build the grouping key for an already-normalized merchant name.
+    
+    Args:
+        normalized_merchant: Output of normalize_merchant
+        amount: Transaction amount
+        
+    Returns:
+        Composite key like "netflix_16" or "spotify_11"
+    """
+    # Round amount to nearest dollar for grouping
+    rounded_amount = round(abs(amount), 0)
+    return f"{normalized_merchant}_{int(rounded_amount)}"
+
+
 def create_merchant_amount_key(merchant_name: str | None, amount: float) -> str:
     """
     Create a composite key for grouping recurring charges.
@@ -138,10 +204,7 @@ def create_merchant_amount_key(merchant_name: str | None, amount: float) -> str:
     Returns:
         Composite key like "netflix_16" or "spotify_11"
     """
-    normalized = normalize_merchant(merchant_name)
-    # Round amount to nearest dollar for grouping
-    rounded_amount = round(abs(amount), 0)
-    return f"{normalized}_{int(rounded_amount)}"
+    return build_merchant_amount_key(normalize_merchant(merchant_name), amount)
 
 
 def detect_subscription_metadata(transaction: dict[str, Any]) -> dict[str, Any]:
@@ -157,6 +220,7 @@ def detect_subscription_metadata(transaction: dict[str, Any]) -> dict[str, Any]:
     merchant_name = transaction.get("merchant_name") or transaction.get("name", "")
     amount = float(transaction.get("amount", 0))
     category = transaction.get("category", [])
+    merchant_normalized = normalize_merchant(merchant_name)
     
     # Detect potential subscription indicators
     subscription_indicators = {
@@ -172,8 +236,8 @@ def detect_subscription_metadata(transaction: dict[str, Any]) -> dict[str, Any]:
     # Enhanced metadata
     metadata = {
         'merchant_raw': merchant_name,
-        'merchant_normalized': normalize_merchant(merchant_name),
-        'merchant_amount_key': create_merchant_amount_key(merchant_name, amount),
+        'merchant_normalized': merchant_normalized,
+        'merchant_amount_key': build_merchant_amount_key(merchant_normalized, amount),
         'amount': abs(amount),
         'is_debit': amount > 0,  # Plaid convention: positive = outflow
         'category': category if isinstance(category, list) else [category] if category else [],
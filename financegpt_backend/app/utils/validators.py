@@ -429,6 +429,152 @@ def validate_uuid(uuid_string: str) -> str:
     return uuid_string
 
 
+def _validate_email_field(
+    config: dict[str, Any], key: str, connector_name: str
+) -> None:
+    if not validators.email(config.get(key, "")):
+        raise ValueError(f"Invalid email format for {connector_name} connector")
+
+
+def _validate_url_field(
+    config: dict[str, Any], key: str, connector_name: str
+) -> None:
+    if not validators.url(config.get(key, "").strip(), simple_host=True):
+        raise ValueError(f"Invalid base URL format for {connector_name} connector")
+
+
+def _validate_list_field(config: dict[str, Any], key: str, field_name: str) -> None:
+    value = config.get(key)
+    if not isinstance(value, list) or not value:
+        raise ValueError(f"{field_name} must be a non-empty list of strings")
+
+
+def _validate_firecrawl_api_key_format(config: dict[str, Any]) -> None:
+    """Validate Firecrawl API key format if provided."""
+    api_key = config.get("FIRECRAWL_API_KEY", "")
+    if api_key and api_key.strip() and not api_key.strip().startswith("fc-"):
+        raise ValueError(
+            "Firecrawl API key should start with 'fc-'. Please verify your API key."
+        )
+
+
+def _validate_initial_urls(config: dict[str, Any]) -> None:
+    initial_urls = config.get("INITIAL_URLS", "")
+    if initial_urls and initial_urls.strip():
+        urls = [url.strip() for url in initial_urls.split("\n") if url.strip()]
+        for url in urls:
+            if not validators.url(url):
+                raise ValueError(f"Invalid URL format in INITIAL_URLS: {url}")
+
+
+# Lookup table for connector validation rules. Built once at import; each
+# custom validator takes the config being checked.
+_CONNECTOR_CONFIG_RULES: dict[str, dict[str, Any]] = {
+    "SERPER_API": {"required": ["SERPER_API_KEY"], "validators": {}},
+    "TAVILY_API": {"required": ["TAVILY_API_KEY"], "validators": {}},
+    "SEARXNG_API": {
+        "required": ["SEARXNG_HOST"],
+        "optional": [
+            "SEARXNG_API_KEY",
+            "SEARXNG_ENGINES",
+            "SEARXNG_CATEGORIES",
+            "SEARXNG_LANGUAGE",
+            "SEARXNG_SAFESEARCH",
+            "SEARXNG_VERIFY_SSL",
+        ],
+        "validators": {
+            "SEARXNG_HOST": lambda config: _validate_url_field(
+                config, "SEARXNG_HOST", "SearxNG"
+            )
+        },
+    },
+    "LINKUP_API": {"required": ["LINKUP_API_KEY"], "validators": {}},
+    "BAIDU_SEARCH_API": {
+        "required": ["BAIDU_API_KEY"],
+        "optional": [
+            "BAIDU_MODEL",
+            "BAIDU_SEARCH_SOURCE",
+            "BAIDU_ENABLE_DEEP_SEARCH",
+        ],
+        "validators": {},
+    },
+    # "SLACK_CONNECTOR": {
+    #     "required": [],  # OAuth uses bot_token (encrypted), legacy uses SLACK_BOT_TOKEN
+    #     "optional": [
+    #         "bot_token",
+    #         "SLACK_BOT_TOKEN",
+    #         "bot_user_id",
+    #         "team_id",
+    #         "team_name",
+    #         "token_type",
+    #         "expires_in",
+    #         "expires_at",
+    #         "scope",
+    #         "_token_encrypted",
+    #     ],
+    #     "validators": {},
+    # },
+    "GITHUB_CONNECTOR": {
+        # GITHUB_PAT is optional - only required for private repositories
+        # Public repositories can be indexed without authentication
+        "required": ["repo_full_names"],
+        "optional": ["GITHUB_PAT"],  # Optional - only needed for private repos
+        "validators": {
+            "repo_full_names": lambda config: _validate_list_field(
+                config, "repo_full_names", "repo_full_names"
+            )
+        },
+    },
+    # "DISCORD_CONNECTOR": {"required": ["DISCORD_BOT_TOKEN"], "validators": {}},
+    # "JIRA_CONNECTOR": {
+    #     "required": ["JIRA_EMAIL", "JIRA_API_TOKEN", "JIRA_BASE_URL"],
+    #     "validators": {
+    #         "JIRA_EMAIL": lambda config: _validate_email_field(config, "JIRA_EMAIL", "JIRA"),
+    #         "JIRA_BASE_URL": lambda config: _validate_url_field(config, "JIRA_BASE_URL", "JIRA"),
+    #     },
+    # },
+    # "CONFLUENCE_CONNECTOR": {
+    #     "required": [
+    #         "access_token",
+    #     ],
+    #     "validators": {},
+    # },
+    # "CLICKUP_CONNECTOR": {"required": ["CLICKUP_API_TOKEN"], "validators": {}},
+    # "GOOGLE_CALENDAR_CONNECTOR": {
+    #     "required": ["token", "refresh_token", "token_uri", "client_id", "expiry", "scopes", "client_secret"],
+    #     "validators": {},
+    #     "allow_none_or_empty": False  # Special flag for Google connectors
+    # },
+    # "GOOGLE_GMAIL_CONNECTOR": {
+    #     "required": ["token", "refresh_token", "token_uri", "client_id", "expiry", "scopes", "client_secret"],
+    #     "validators": {},
+    #     "allow_none_or_empty": False
+    # },
+    # "AIRTABLE_CONNECTOR": {
+    #     "required": ["AIRTABLE_API_KEY", "AIRTABLE_BASE_ID"],
+    #     "validators": {}
+    # },
+    "LUMA_CONNECTOR": {"required": ["LUMA_API_KEY"], "validators": {}},
+    "WEBCRAWLER_CONNECTOR": {
+        "required": [],  # No required fields - API key is optional
+        "optional": ["FIRECRAWL_API_KEY", "INITIAL_URLS"],
+        "validators": {
+            "FIRECRAWL_API_KEY": _validate_firecrawl_api_key_format,
+            "INITIAL_URLS": _validate_initial_urls,
+        },
+    },
+}
+
+# (required keys, allowed keys) per connector type, precomputed from the rules
+_CONNECTOR_CONFIG_KEYS: dict[str, tuple[frozenset[str], frozenset[str]]] = {
+    connector_type: (
+        frozenset(rules["required"]),
+        frozenset(rules["required"]) | frozenset(rules.get("optional", [])),
+    )
+    for connector_type, rules in _CONNECTOR_CONFIG_RULES.items()
+}
+
+
 def validate_connector_config(
     connector_type: str | Any, config: dict[str, Any]
 ) -> dict[str, Any]:
@@ -455,155 +601,27 @@ def validate_connector_config(
         else str(connector_type)
     )
 
-    # Validation function helpers
-    def validate_email_field(key: str, connector_name: str) -> None:
-        if not validators.email(config.get(key, "")):
-            raise ValueError(f"Invalid email format for {connector_name} connector")
-
-    def validate_url_field(key: str, connector_name: str) -> None:
-        if not validators.url(config.get(key, "").strip(), simple_host=True):
-            raise ValueError(f"Invalid base URL format for {connector_name} connector")
-
-    def validate_list_field(key: str, field_name: str) -> None:
-        value = config.get(key)
-        if not isinstance(value, list) or not value:
-            raise ValueError(f"{field_name} must be a non-empty list of strings")
-
-    def validate_firecrawl_api_key_format() -> None:
-        """Validate Firecrawl API key format if provided."""
-        api_key = config.get("FIRECRAWL_API_KEY", "")
-        if api_key and api_key.strip() and not api_key.strip().startswith("fc-"):
-            raise ValueError(
-                "Firecrawl API key should start with 'fc-'. Please verify your API key."
-            )
-
-    def validate_initial_urls() -> None:
-        initial_urls = config.get("INITIAL_URLS", "")
-        if initial_urls and initial_urls.strip():
-            urls = [url.strip() for url in initial_urls.split("\n") if url.strip()]
-            for url in urls:
-                if not validators.url(url):
-                    raise ValueError(f"Invalid URL format in INITIAL_URLS: {url}")
-
-    # Lookup table for connector validation rules
-    connector_rules = {
-        "SERPER_API": {"required": ["SERPER_API_KEY"], "validators": {}},
-        "TAVILY_API": {"required": ["TAVILY_API_KEY"], "validators": {}},
-        "SEARXNG_API": {
-            "required": ["SEARXNG_HOST"],
-            "optional": [
-                "SEARXNG_API_KEY",
-                "SEARXNG_ENGINES",
-                "SEARXNG_CATEGORIES",
-                "SEARXNG_LANGUAGE",
-                "SEARXNG_SAFESEARCH",
-                "SEARXNG_VERIFY_SSL",
-            ],
-            "validators": {
-                "SEARXNG_HOST": lambda: validate_url_field("SEARXNG_HOST", "SearxNG")
-            },
-        },
-        "LINKUP_API": {"required": ["LINKUP_API_KEY"], "validators": {}},
-        "BAIDU_SEARCH_API": {
-            "required": ["BAIDU_API_KEY"],
-            "optional": [
-                "BAIDU_MODEL",
-                "BAIDU_SEARCH_SOURCE",
-                "BAIDU_ENABLE_DEEP_SEARCH",
-            ],
-            "validators": {},
-        },
-        # "SLACK_CONNECTOR": {
-        #     "required": [],  # OAuth uses bot_token (encrypted), legacy uses SLACK_BOT_TOKEN
-        #     "optional": [
-        #         "bot_token",
-        #         "SLACK_BOT_TOKEN",
-        #         "bot_user_id",
-        #         "team_id",
-        #         "team_name",
-        #         "token_type",
-        #         "expires_in",
-        #         "expires_at",
-        #         "scope",
-        #         "_token_encrypted",
-        #     ],
-        #     "validators": {},
-        # },
-        "GITHUB_CONNECTOR": {
-            # GITHUB_PAT is optional - only required for private repositories
-            # Public repositories can be indexed without authentication
-            "required": ["repo_full_names"],
-            "optional": ["GITHUB_PAT"],  # Optional - only needed for private repos
-            "validators": {
-                "repo_full_names": lambda: validate_list_field(
-                    "repo_full_names", "repo_full_names"
-                )
-            },
-        },
-        # "DISCORD_CONNECTOR": {"required": ["DISCORD_BOT_TOKEN"], "validators": {}},
-        # "JIRA_CONNECTOR": {
-        #     "required": ["JIRA_EMAIL", "JIRA_API_TOKEN", "JIRA_BASE_URL"],
-        #     "validators": {
-        #         "JIRA_EMAIL": lambda: validate_email_field("JIRA_EMAIL", "JIRA"),
-        #         "JIRA_BASE_URL": lambda: validate_url_field("JIRA_BASE_URL", "JIRA"),
-        #     },
-        # },
-        # "CONFLUENCE_CONNECTOR": {
-        #     "required": [
-        #         "access_token",
-        #     ],
-        #     "validators": {},
-        # },
-        # "CLICKUP_CONNECTOR": {"required": ["CLICKUP_API_TOKEN"], "validators": {}},
-        # "GOOGLE_CALENDAR_CONNECTOR": {
-        #     "required": ["token", "refresh_token", "token_uri", "client_id", "expiry", "scopes", "client_secret"],
-        #     "validators": {},
-        #     "allow_none_or_empty": False  # Special flag for Google connectors
-        # },
-        # "GOOGLE_GMAIL_CONNECTOR": {
-        #     "required": ["token", "refresh_token", "token_uri", "client_id", "expiry", "scopes", "client_secret"],
-        #     "validators": {},
-        #     "allow_none_or_empty": False
-        # },
-        # "AIRTABLE_CONNECTOR": {
-        #     "required": ["AIRTABLE_API_KEY", "AIRTABLE_BASE_ID"],
-        #     "validators": {}
-        # },
-        "LUMA_CONNECTOR": {"required": ["LUMA_API_KEY"], "validators": {}},
-        "WEBCRAWLER_CONNECTOR": {
-            "required": [],  # No required fields - API key is optional
-            "optional": ["FIRECRAWL_API_KEY", "INITIAL_URLS"],
-            "validators": {
-                "FIRECRAWL_API_KEY": lambda: validate_firecrawl_api_key_format(),
-                "INITIAL_URLS": lambda: validate_initial_urls(),
-            },
-        },
-    }
-
-    rules = connector_rules.get(connector_type_str)
+    rules = _CONNECTOR_CONFIG_RULES.get(connector_type_str)
     if not rules:
         return config  # Unknown connector type, pass through
 
-    required_keys = set(rules["required"])
-    optional_keys = set(rules.get("optional", []))
-    config_keys = set(config.keys())
+    required_keys, allowed_keys = _CONNECTOR_CONFIG_KEYS[connector_type_str]
 
     # Validate that no unexpected keys are present
-    if not config_keys.issubset(required_keys | optional_keys):
-        allowed_keys = list(required_keys | optional_keys)
+    if not allowed_keys.issuperset(config):
         raise ValueError(
-            f"For {connector_type_str} connector type, config may only contain these keys: {allowed_keys}"
+            f"For {connector_type_str} connector type, config may only contain these keys: {list(allowed_keys)}"
         )
 
     # Validate that all required keys are present
-    if not required_keys.issubset(config_keys):
+    if not required_keys.issubset(config):
         raise ValueError(
             f"For {connector_type_str} connector type, config must include these keys: {sorted(required_keys)}"
         )
 
     # Apply custom validators first (these check format before emptiness)
     for validator_func in rules["validators"].values():
-        validator_func()
+        validator_func(config)
 
     # Validate each field is not empty
     for key in rules["required"]:
@@ -1,44 +1,43 @@
-import psycopg2
-
-# Connect to database
-conn = psycopg2.connect(
-    host="localhost",
-    port=5432,
-    database="financegpt",
-    user="postgres",
-    password="postgres"
-)
-
-cur = conn.cursor()
-
-# Count accounts
-cur.execute("SELECT COUNT(*) FROM investment_accounts;")
-account_count = cur.fetchone()[0]
-print(f"Investment Accounts: {account_count}")
+from contextlib import closing
 
-# Count holdings
-cur.execute("SELECT COUNT(*) FROM investment_holdings;")
-holding_count = cur.fetchone()[0]
-print(f"Investment Holdings: {holding_count}")
-
-# Get total value
-cur.execute("SELECT SUM(market_value) FROM investment_holdings;")
-total_value = cur.fetchone()[0] or 0
-print(f"Total Market Value: ${total_value:,.2f}")
-
-# List accounts if any
-if account_count > 0:
-    cur.execute("SELECT account_name, total_value FROM investment_accounts;")
-    print("\nAccounts:")
-    for row in cur.fetchall():
-        print(f"  - {row[0]}: ${row[1]:,.2f}")
-
-# List holdings if any
-if holding_count > 0:
-    cur.execute("SELECT symbol, quantity, market_value FROM investment_holdings;")
-    print("\nHoldings:")
-    for row in cur.fetchall():
-        print(f"  - {row[0]}: qty={row[1]}, value=${row[2]:,.2f}")
+import psycopg2
 
-cur.close()
-conn.close()
+# Connect to database (psycopg2's own context manager only ends the
+# transaction, so closing() makes sure the connection is released)
+with closing(
+    psycopg2.connect(
+        host="localhost",
+        port=5432,
+        database="financegpt",
+        user="postgres",
+        password="postgres"
+    )
+) as conn, conn.cursor() as cur:
+    # Counts and total value in a single round trip
+    cur.execute("""
+        SELECT (SELECT COUNT(*) FROM investment_accounts),
+               (SELECT COUNT(*) FROM investment_holdings),
+               (SELECT COALESCE(SUM(market_value), 0) FROM investment_holdings);
+    """)
+    account_count, holding_count, total_value = cur.fetchone()
+    print(f"Investment Accounts: {account_count}")
+    print(f"Investment Holdings: {holding_count}")
+    print(f"Total Market Value: ${total_value:,.2f}")
+
+    # List accounts if any
+    if account_count > 0:
+        cur.execute("SELECT account_name, total_value FROM investment_accounts;")
+        print("\nAccounts:")
+        for row in cur:
+            print(f"  - {row[0]}: ${row[1]:,.2f}")
+
+    # List holdings if any, streamed through a server-side cursor
+    if holding_count > 0:
+        with conn.cursor(name="holdings") as holdings_cur:
+            holdings_cur.itersize = 1000
+            holdings_cur.execute(
+                "SELECT symbol, quantity, market_value FROM investment_holdings;"
+            )
+            print("\nHoldings:")
+            for row in holdings_cur:
+                print(f"  - {row[0]}: qty={row[1]}, value=${row[2]:,.2f}")
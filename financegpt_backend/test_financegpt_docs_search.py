@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test for the FinanceGPT docs title search.
+
+The document mention picker searches from two characters up, so short terms
+must still match anywhere in a title, not just at its start.
+"""
+
+import re
+
+from sqlalchemy.dialects import postgresql
+
+
+def _like_to_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a LIKE pattern (no escapes) into an equivalent regex."""
+    parts = (
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in pattern
+    )
+    return re.compile("".join(parts), re.IGNORECASE | re.DOTALL)
+
+
+def _title_pattern(search_term: str) -> str:
+    """The ILIKE pattern the docs route filters titles with."""
+    from app.routes.financegpt_docs_routes import _title_filter
+
+    clause = _title_filter(search_term).compile(dialect=postgresql.dialect())
+    (pattern,) = clause.params.values()
+    return pattern
+
+
+def test_two_character_term_matches_mid_title():
+    """A 2-character term matches in the middle of a title."""
+    pattern = _title_pattern("dg")
+    assert pattern == "%dg%"
+    assert _like_to_regex(pattern).fullmatch("Budgeting Basics")
+
+
+def test_long_term_matches_mid_title():
+    """Longer terms keep their substring match."""
+    pattern = _title_pattern("connect")
+    assert _like_to_regex(pattern).fullmatch("Plaid Connectors")
+
+
+if __name__ == "__main__":
+    test_two_character_term_matches_mid_title()
+    test_long_term_matches_mid_title()
+    print("✓ Docs title search tests passed")
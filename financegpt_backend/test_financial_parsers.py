@@ -7,83 +7,89 @@ statements from Chase, Fidelity, and Discover.
 """
 
 import asyncio
+import logging
 from decimal import Decimal
 from pathlib import Path
 
-# Create sample CSV data for testing
-SAMPLE_CHASE_CHECKING = """Details,Posting Date,Description,Amount,Type,Balance,Check or Slip #
+logger = logging.getLogger(__name__)
+
+# Create sample CSV data for testing (as bytes, the way uploads arrive)
+SAMPLE_CHASE_CHECKING: bytes = b"""Details,Posting Date,Description,Amount,Type,Balance,Check or Slip #
 DEBIT,01/15/2024,WHOLE FOODS MARKET,-125.50,DEBIT,2500.25,
 CREDIT,01/16/2024,PAYCHECK DIRECT DEP,3500.00,ACH_CREDIT,6000.25,
 DEBIT,01/17/2024,ATM WITHDRAWAL,-100.00,ATM,5900.25,
 """
 
-SAMPLE_CHASE_CREDIT = """Transaction Date,Post Date,Description,Category,Type,Amount,Memo
+SAMPLE_CHASE_CREDIT: bytes = b"""Transaction Date,Post Date,Description,Category,Type,Amount,Memo
 01/15/2024,01/16/2024,AMAZON.COM,Shopping,Sale,-89.99,
 01/16/2024,01/17/2024,STARBUCKS,Food & Drink,Sale,-5.75,
 01/20/2024,01/21/2024,PAYMENT - THANK YOU,,Payment,500.00,
 """
 
-SAMPLE_FIDELITY_POSITIONS = """Account Number,Account Name,Symbol,Description,Quantity,Last Price,Current Value,Cost Basis Total,Gain/Loss Dollar,Gain/Loss Percent
+SAMPLE_FIDELITY_POSITIONS: bytes = b"""Account Number,Account Name,Symbol,Description,Quantity,Last Price,Current Value,Cost Basis Total,Gain/Loss Dollar,Gain/Loss Percent
 123456789,INDIVIDUAL,AAPL,APPLE INC,50,170.00,8500.00,7500.00,1000.00,13.33%
 123456789,INDIVIDUAL,MSFT,MICROSOFT CORP,30,380.00,11400.00,10000.00,1400.00,14.00%
 123456789,INDIVIDUAL,VTSAX,VANGUARD TOTAL STOCK MKT,100,115.50,11550.00,11000.00,550.00,5.00%
 """
 
-SAMPLE_DISCOVER = """Trans. Date,Post Date,Description,Amount,Category
+SAMPLE_DISCOVER: bytes = b"""Trans. Date,Post Date,Description,Amount,Category
 01/15/2024,01/16/2024,TARGET STORE,-125.43,Merchandise
 01/16/2024,01/17/2024,SHELL GAS STATION,-45.00,Gasoline
 01/20/2024,01/21/2024,ONLINE PAYMENT,500.00,Payments and Credits
 """
 
 
-async def test_parser(parser_class, sample_data: str, institution: str):
-    """Test a parser with sample data."""
-    print(f"\n{'='*60}")
-    print(f"Testing {institution} Parser")
-    print(f"{'='*60}")
+async def test_parser(
+    parser_class, sample_data: bytes, institution: str
+) -> tuple[bool, str]:
+    """
+    Test a parser with sample data.
+
+    Returns whether it passed and its printable report, so concurrent runs
+    can print their reports in order.
+    """
+    report = [
+        f"\n{'='*60}",
+        f"Testing {institution} Parser",
+        f"{'='*60}",
+    ]
     
     try:
-        # Create parser instance
-        from app.parsers import (
-            ChaseBankParser,
-            ChaseCreditParser,
-            FidelityParser,
-            DiscoverParser,
-        )
-        
         # Parse the sample data
         parser = parser_class()
-        result = await parser.parse_file(sample_data.encode('utf-8'), f"sample_{institution}.csv")
+        result = await parser.parse_file(sample_data, f"sample_{institution}.csv")
+        meta = result['metadata']
+        transactions = result['transactions']
+        holdings = result['holdings']
         
         # Display results
-        print(f"\n✓ Successfully parsed {institution} file")
-        print(f"  Institution: {result['metadata']['institution']}")
-        print(f"  Format: {result['metadata']['format']}")
-        print(f"  Transactions: {result['metadata'].get('transaction_count', 0)}")
-        print(f"  Holdings: {result['metadata'].get('holding_count', 0)}")
+        report.append(f"\n✓ Successfully parsed {institution} file")
+        report.append(f"  Institution: {meta['institution']}")
+        report.append(f"  Format: {meta['format']}")
+        report.append(f"  Transactions: {meta.get('transaction_count', 0)}")
+        report.append(f"  Holdings: {meta.get('holding_count', 0)}")
         
         # Show first few transactions
-        if result['transactions']:
-            print(f"\n  Sample Transactions:")
-            for i, trans in enumerate(result['transactions'][:3], 1):
+        if transactions:
+            report.append("\n  Sample Transactions:")
+            for i, trans in enumerate(transactions[:3], 1):
                 trans_dict = trans.to_dict()
-                print(f"    {i}. {trans_dict['date'][:10]} - {trans_dict['description'][:40]:40s} ${trans_dict['amount']:>10s}")
+                report.append(f"    {i}. {trans_dict['date'][:10]} - {trans_dict['description'][:40]:40s} ${trans_dict['amount']:>10s}")
         
         # Show holdings if available
-        if result['holdings']:
-            print(f"\n  Holdings:")
-            for i, holding in enumerate(result['holdings'][:3], 1):
+        if holdings:
+            report.append("\n  Holdings:")
+            for i, holding in enumerate(holdings[:3], 1):
                 hold_dict = holding.to_dict()
                 gain_loss = f" (${hold_dict['gain_loss']})" if hold_dict['gain_loss'] else ""
-                print(f"    {i}. {hold_dict['symbol']:6s} - {hold_dict['quantity']:>6s} shares @ ${hold_dict['price']:>8s} = ${hold_dict['value']:>10s}{gain_loss}")
+                report.append(f"    {i}. {hold_dict['symbol']:6s} - {hold_dict['quantity']:>6s} shares @ ${hold_dict['price']:>8s} = ${hold_dict['value']:>10s}{gain_loss}")
         
-        return True
+        return True, "\n".join(report)
         
-    except Exception as e:
-        print(f"\n✗ Error testing {institution}: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    except Exception:
+        logger.exception("✗ Error testing %s", institution)
+        report.append(f"\n✗ Error testing {institution} (see log above)")
+        return False, "\n".join(report)
 
 
 async def test_parser_factory():
@@ -105,7 +111,7 @@ async def test_parser_factory():
         for sample_data, filename, expected in test_cases:
             try:
                 connector_type, parsed = await ParserFactory.parse_auto(
-                    sample_data.encode('utf-8'), 
+                    sample_data,
                     filename
                 )
                 print(f"  ✓ {filename:30s} -> {connector_type.value:25s} ({expected})")
@@ -114,10 +120,8 @@ async def test_parser_factory():
         
         return True
         
-    except Exception as e:
-        print(f"\n✗ Error testing parser factory: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("✗ Error testing parser factory")
         return False
 
 
@@ -142,9 +146,17 @@ async def main():
         (DiscoverParser, SAMPLE_DISCOVER, "Discover Credit Card"),
     ]
     
+    # The parsers are independent, so run them concurrently; each returns
+    # its report, printed here in order so the output doesn't interleave
+    outcomes = await asyncio.gather(
+        *(
+            test_parser(parser_class, sample_data, institution)
+            for parser_class, sample_data, institution in tests
+        )
+    )
     results = []
-    for parser_class, sample_data, institution in tests:
-        success = await test_parser(parser_class, sample_data, institution)
+    for (_, _, institution), (success, report) in zip(tests, outcomes):
+        print(report)
         results.append((institution, success))
     
     # Test parser factory
@@ -178,4 +190,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
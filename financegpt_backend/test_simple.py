@@ -19,68 +19,103 @@ class TransactionType(str, Enum):
     PURCHASE = "purchase"
     PAYMENT = "payment"
 
+def cents_to_decimal(cents):
+    """Convert integer cents back to a Decimal at the output boundary."""
+    return Decimal(cents).scaleb(-2)
+
 class BankTransaction:
-    def __init__(self, date, description, amount, transaction_type, **kwargs):
+    # Amounts are held as integer cents; Decimal only appears in to_dict()
+    def __init__(self, date, description, amount_cents, transaction_type, **kwargs):
         self.date = date
         self.description = description
-        self.amount = amount
+        self.amount_cents = amount_cents
         self.transaction_type = transaction_type
-        self.balance = kwargs.get('balance')
+        self.balance_cents = kwargs.get('balance_cents')
         self.category = kwargs.get('category')
     
     def to_dict(self):
         return {
             'date': self.date.isoformat(),
             'description': self.description,
-            'amount': str(self.amount),
+            'amount': str(cents_to_decimal(self.amount_cents)),
             'transaction_type': self.transaction_type.value,
-            'balance': str(self.balance) if self.balance else None,
+            'balance': str(cents_to_decimal(self.balance_cents)) if self.balance_cents else None,
             'category': self.category,
         }
 
 # Simple Chase parser
 class SimpleChaseParser:
     def parse_amount(self, amount_str):
+        """Parse a dollar amount string into integer cents."""
         if not amount_str:
-            return Decimal("0")
+            return 0
         cleaned = amount_str.strip().replace("$", "").replace(",", "")
         if cleaned.startswith("(") and cleaned.endswith(")"):
             cleaned = "-" + cleaned[1:-1]
+        negative = cleaned.startswith("-")
+        dollars, _, cents = cleaned.lstrip("+-").partition(".")
+        if len(cents) <= 2 and (dollars + cents).isascii() and (dollars + cents).isdigit():
+            value = int(dollars or "0") * 100 + int(cents.ljust(2, "0"))
+            return -value if negative else value
+        # Rare shapes (sub-cent precision, exponents): round through Decimal
         try:
-            return Decimal(cleaned)
-        except:
-            return Decimal("0")
+            return int((Decimal(cleaned) * 100).to_integral_value())
+        except Exception:
+            return 0
     
     def parse_date(self, date_str):
-        formats = ["%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except ValueError:
-                continue
-        raise ValueError(f"Could not parse date: {date_str}")
+        # MM/DD/YYYY, MM/DD/YY or YYYY-MM-DD, parsed without strptime
+        cleaned = date_str.strip()
+        try:
+            if "/" in cleaned:
+                month, day, year = cleaned.split("/")
+                if len(year) == 2:
+                    year = int(year)
+                    year += 1900 if year >= 69 else 2000
+                elif len(year) != 4:
+                    raise ValueError
+                return datetime(int(year), int(month), int(day))
+            year, month, day = cleaned.split("-")
+            if len(year) != 4:
+                raise ValueError
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            raise ValueError(f"Could not parse date: {date_str}") from None
     
     async def parse_csv(self, csv_content):
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        csv_reader = csv.reader(io.StringIO(csv_content))
         transactions = []
         
+        # Resolve column positions once from the header row
+        header = next(csv_reader, [])
+        columns = {name: i for i, name in enumerate(header)}
+        date_idx = columns.get("Posting Date")
+        desc_idx = columns.get("Description")
+        amount_idx = columns.get("Amount")
+        balance_idx = columns.get("Balance")
+        
+        def field(row, idx, default=""):
+            return row[idx] if idx is not None and idx < len(row) else default
+        
         for row in csv_reader:
-            if not row.get("Description"):
+            description = field(row, desc_idx)
+            if not description:
                 continue
             
-            date = self.parse_date(row.get("Posting Date", ""))
-            amount = self.parse_amount(row.get("Amount", "0"))
-            description = row.get("Description", "").strip()
-            balance = self.parse_amount(row.get("Balance", "")) if row.get("Balance") else None
+            date = self.parse_date(field(row, date_idx))
+            amount = self.parse_amount(field(row, amount_idx, "0"))
+            description = description.strip()
+            balance_str = field(row, balance_idx)
+            balance = self.parse_amount(balance_str) if balance_str else None
             
             trans_type = TransactionType.DEBIT if amount < 0 else TransactionType.CREDIT
             
             transaction = BankTransaction(
                 date=date,
                 description=description,
-                amount=amount,
+                amount_cents=amount,
                 transaction_type=trans_type,
-                balance=balance
+                balance_cents=balance
             )
             transactions.append(transaction)
         
@@ -117,13 +117,13 @@ export default function DocumentsTable() {
 		isLoading: isFinanceGPTDocsLoading,
 		refetch: refetchFinanceGPTDocs,
 	} = useQuery({
-		queryKey: ["financegpt-docs", debouncedSearch, pageIndex, pageSize],
+		queryKey: ["financegpt-docs", debouncedSearch, pageSize],
 		queryFn: () =>
 			documentsApiService.getFinanceGPTDocs({
 				queryParams: {
-					page: pageIndex,
 					page_size: pageSize,
 					title: debouncedSearch.trim() || undefined,
+					include_total: true,
 				},
 			}),
 		staleTime: 3 * 60 * 1000, // 3 minutes
@@ -138,7 +138,7 @@ export default function DocumentsTable() {
 			title: doc.title,
 			document_type: "FINANCEGPT_DOCS",
 			document_metadata: { source: doc.source },
-			content: doc.content,
+			content: "", // List items omit content
 			created_at: new Date().toISOString(),
 			search_space_id: -1, // Special value for global docs
 		}));
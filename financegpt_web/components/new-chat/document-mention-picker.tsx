@@ -126,7 +126,7 @@ export const DocumentMentionPicker = forwardRef<
 			queryKey: ["financegpt-docs-mention", "", false],
 			queryFn: () =>
 				documentsApiService.getFinanceGPTDocs({
-					queryParams: { page: 0, page_size: PAGE_SIZE },
+					queryParams: { page_size: PAGE_SIZE },
 				}),
 			staleTime: 3 * 60 * 1000,
 		});
@@ -153,8 +153,7 @@ export const DocumentMentionPicker = forwardRef<
 	);
 
 	const financegptDocsQueryParams = useMemo(() => {
-		const params: { page: number; page_size: number; title?: string } = {
-			page: 0,
+		const params: { page_size: number; title?: string } = {
 			page_size: PAGE_SIZE,
 		};
 		if (isSearchValid) {
@@ -71,8 +71,10 @@ export const googleDriveItem = z.object({
  */
 export const getConnectorsRequest = z.object({
 	queryParams: paginationQueryParams
-		.pick({ skip: true, limit: true })
+		.pick({ limit: true })
 		.extend({
+			// Keyset cursor: id of the last connector from the previous page
+			after_id: z.number().optional(),
 			search_space_id: z.number().or(z.string()).nullish(),
 		})
 		.nullish(),
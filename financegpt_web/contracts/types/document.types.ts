@@ -79,6 +79,8 @@ export const financegptDocsDocument = z.object({
 	content: z.string(),
 });
 
+export const financegptDocsDocumentListItem = financegptDocsDocument.omit({ content: true });
+
 export const financegptDocsDocumentWithChunks = financegptDocsDocument.extend({
 	chunks: z.array(financegptDocsChunk),
 });
@@ -214,17 +216,20 @@ export const getFinanceGPTDocsByChunkResponse = financegptDocsDocumentWithChunks
  * List FinanceGPT docs
  */
 export const getFinanceGPTDocsRequest = z.object({
-	queryParams: paginationQueryParams.extend({
+	queryParams: z.object({
+		cursor: z.string().optional(),
+		page_size: z.number().optional(),
 		title: z.string().optional(),
+		include_total: z.boolean().optional(),
 	}),
 });
 
 export const getFinanceGPTDocsResponse = z.object({
-	items: z.array(financegptDocsDocument),
-	total: z.number(),
-	page: z.number(),
+	items: z.array(financegptDocsDocumentListItem),
 	page_size: z.number(),
 	has_more: z.boolean(),
+	next_cursor: z.string().nullish(),
+	total: z.number().nullish(),
 });
 
 /**
@@ -271,6 +276,7 @@ export type DeleteDocumentResponse = z.infer<typeof deleteDocumentResponse>;
 export type DocumentTypeEnum = z.infer<typeof documentTypeEnum>;
 export type FinanceGPTDocsChunk = z.infer<typeof financegptDocsChunk>;
 export type FinanceGPTDocsDocument = z.infer<typeof financegptDocsDocument>;
+export type FinanceGPTDocsDocumentListItem = z.infer<typeof financegptDocsDocumentListItem>;
 export type FinanceGPTDocsDocumentWithChunks = z.infer<typeof financegptDocsDocumentWithChunks>;
 export type GetFinanceGPTDocsByChunkRequest = z.infer<typeof getFinanceGPTDocsByChunkRequest>;
 export type GetFinanceGPTDocsByChunkResponse = z.infer<typeof getFinanceGPTDocsByChunkResponse>;